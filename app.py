@@ -1,21 +1,44 @@
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
 import json
+import orjson
+import hashlib
 from pathlib import Path
-import sys
-import sqlite3
 import io
+import queue
+import threading
 from datetime import datetime
-import yaml
-
-# Add src directory to path for imports
-sys.path.append(str(Path(__file__).parent / "src"))
+from typing import Any, Dict, List, Optional
 
 from src.multi_format_processor import MultiFormatProcessor
 from src.ollama_client import OllamaClient
-from src.schema_enricher import EnhancedSchemaEnricher
-from src.migration_generator import MigrationGenerator
-from src.business_context_engine import BusinessContextEngine
+
+# Columns shown in the AI enhancement comparison table
+RESULTS_COLUMNS = [
+    'column_name', 'suggested_name', 'data_type',
+    'business_description', 'compliance_notes'
+]
+
+# Trailing characters of streamed AI output kept on screen
+LIVE_OUTPUT_CHARS = 2000
+
+# On-disk store for enriched schemas, so a refresh does not re-run the AI enhancement
+ENRICHMENT_CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+
+# Bump when the enrichment prompts change so earlier results, in memory or on disk, are not reused
+ENRICHMENT_VERSION = 1
+
+# AI enhancement types offered in the enhancement tab, and those selected by default
+ENHANCEMENT_OPTIONS = [
+    "Business-Friendly Column Names",
+    "Industry-Specific Descriptions",
+    "Data Governance & Compliance",
+    "Data Quality Rules",
+    "Transformation Suggestions",
+    "Business KPI Identification"
+]
+DEFAULT_ENHANCEMENT_OPTIONS = ["Business-Friendly Column Names", "Industry-Specific Descriptions"]
 
 # Page configuration
 st.set_page_config(
@@ -40,6 +63,132 @@ if 'selected_industry' not in st.session_state:
     st.session_state.selected_industry = "General"
 if 'project_context' not in st.session_state:
     st.session_state.project_context = {}
+if 'schema_df' not in st.session_state:
+    st.session_state.schema_df = None
+if 'quality_summary' not in st.session_state:
+    st.session_state.quality_summary = None
+if 'migration_generator' not in st.session_state:
+    st.session_state.migration_generator = None
+
+
+@st.cache_resource
+def get_ollama_client() -> OllamaClient:
+    """Return a single Ollama client shared across reruns and sessions."""
+    return OllamaClient()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_available_models(_client: OllamaClient) -> List[str]:
+    """List available models, reusing the result for 30 seconds."""
+    return _client.get_available_models()
+
+
+def summarize_quality(data: pd.DataFrame, schema_df: pd.DataFrame) -> Dict[str, Any]:
+    """Compute the data quality metrics shown in the discovery and analysis tabs."""
+    completeness_pct = schema_df['completeness_pct'].astype(float)
+
+    return {
+        'high': int((completeness_pct >= 95).sum()),
+        'mid': int(((completeness_pct >= 70) & (completeness_pct < 95)).sum()),
+        'low': int((completeness_pct < 70).sum()),
+        'avg': completeness_pct.mean(),
+        'completeness': (1 - data.isnull().sum().sum() / (len(data) * len(data.columns))) * 100,
+    }
+
+
+def add_profile(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach the schema frame, quality summary and a small preview slice to a loaded data source."""
+    result['schema_df'] = pd.DataFrame(result['schema'])
+    result['quality'] = summarize_quality(result['data'], result['schema_df'])
+    result['preview'] = result['data'].head(10).copy()
+    return result
+
+
+def set_source(result: Dict[str, Any]) -> None:
+    """Make a loaded data source the current one for every tab."""
+    st.session_state.source_data = result['data']
+    st.session_state.original_schema = result['schema']
+    st.session_state.schema_df = result['schema_df']
+    st.session_state.quality_summary = result['quality']
+
+
+@st.cache_data(show_spinner=False, persist="disk")
+def load_csv(file_bytes: bytes, file_name: str) -> Dict[str, Any]:
+    """Parse and profile an uploaded CSV, keyed on its contents.
+
+    Results are persisted to disk, so re-uploading a file after a restart skips parsing and
+    schema inference.
+    """
+    buffer = io.BytesIO(file_bytes)
+    buffer.name = file_name
+    buffer.size = len(file_bytes)
+    result = MultiFormatProcessor().process_csv(buffer)
+    return add_profile(result)
+
+
+@st.cache_data(show_spinner=False)
+def load_sample_data(sample_type: str, sample_size: int) -> Dict[str, Any]:
+    """Generate a sample dataset once per (type, size) combination."""
+    result = MultiFormatProcessor().generate_sample_data(sample_type, sample_size)
+    return add_profile(result)
+
+
+@st.cache_data(show_spinner=False)
+def load_sample_ota_schema(sample_size: int) -> Dict[str, Any]:
+    """Generate the sample OTA database once per size."""
+    result = MultiFormatProcessor().generate_sample_ota_schema(sample_size)
+    return add_profile(result)
+
+
+def to_arrow(df: pd.DataFrame):
+    """Convert a frame to an Arrow table for st.dataframe, leaving mixed-type frames to Streamlit."""
+    try:
+        return pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return df
+
+
+@st.cache_resource(ttl=3600)
+def enrichment_memo() -> Dict[str, List[Dict[str, Any]]]:
+    """Enriched schemas produced by this server, keyed by everything that shapes their prompts."""
+    return {}
+
+
+def enrichment_memo_key(schema: List[Dict[str, Any]], enhancement_options: List[str], industry: str,
+                        project_context: Dict[str, Any], batch_size: int) -> str:
+    """Key an enrichment on everything that changes the prompts sent to the AI.
+
+    Besides the schema, options and industry, the prompts name the project, source and target
+    systems, and batch_size decides which columns share a prompt.
+    """
+    prompt_context = [project_context.get(field) for field in ('name', 'source', 'target')]
+    payload = json.dumps(
+        [ENRICHMENT_VERSION, schema, sorted(enhancement_options), industry, prompt_context, batch_size],
+        sort_keys=True, default=str
+    )
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+def save_enrichment(key: str, rows: List[Dict[str, Any]]) -> None:
+    """Persist an enriched schema to the on-disk cache as JSON, keyed like the in-memory memo.
+
+    Values JSON has no type for (timestamps, decimals) are stored as strings.
+    """
+    ENRICHMENT_CACHE_DIR.mkdir(exist_ok=True)
+    (ENRICHMENT_CACHE_DIR / f"{key}.json").write_bytes(
+        orjson.dumps(rows, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    )
+
+
+def load_enrichment(key: str) -> Optional[List[Dict[str, Any]]]:
+    """Return a previously persisted enriched schema, if any."""
+    path = ENRICHMENT_CACHE_DIR / f"{key}.json"
+    if not path.exists():
+        return None
+    try:
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
 
 
 def main():
@@ -69,21 +218,20 @@ def main():
             1000, 5000, 10000, 25000, 50000
         ], index=2)  # Default to 10000
 
-        # Store in project context
-        st.session_state.project_context['sample_size'] = sample_size
-
-        # Store project context
+        # Store project context; created_date is set once per session, so the context only
+        # changes when a setting does and the cached migration generator can be reused
         st.session_state.project_context = {
             "name": project_name,
             "source": source_system,
             "target": target_system,
             "industry": industry,
-            "created_date": datetime.now().isoformat()
+            "sample_size": sample_size,
+            "created_date": st.session_state.project_context.get("created_date") or datetime.now().isoformat()
         }
 
         # Ollama connection
         st.subheader("🤖 AI Engine Status")
-        ollama_client = OllamaClient()
+        ollama_client = get_ollama_client()
 
         if st.button("🔄 Check AI Connection"):
             with st.spinner("Checking Ollama connection..."):
@@ -91,13 +239,17 @@ def main():
 
         if st.session_state.ollama_connected:
             st.success("✅ AI Engine Connected")
-            available_models = ollama_client.get_available_models()
+            available_models = list_available_models(ollama_client)
             if available_models:
                 selected_model = st.selectbox("AI Model", available_models)
         else:
             st.error("❌ AI Engine Disconnected")
             st.info("Start Ollama: `ollama serve`")
 
+        batch_size = st.slider("Columns per AI Request", min_value=4, max_value=16, value=8,
+                               help="Columns batched into one prompt. Larger batches mean fewer "
+                                    "AI calls but longer, less reliable responses.")
+
     # Main tabs
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "📁 Data Discovery",
@@ -118,20 +270,17 @@ def main():
             "Sample Data Generator"
         ])
 
-        processor = MultiFormatProcessor()
-
         if source_type == "CSV File Upload":
             uploaded_file = st.file_uploader("Upload CSV File", type=['csv'])
 
             if uploaded_file is not None:
                 try:
                     with st.spinner("🔄 Processing CSV file..."):
-                        result = processor.process_csv(uploaded_file)
-                        st.session_state.source_data = result['data']
-                        st.session_state.original_schema = result['schema']
+                        result = load_csv(uploaded_file.getvalue(), uploaded_file.name)
+                        set_source(result)
 
                     st.success("✅ CSV processed successfully!")
-                    display_data_preview(result['data'])
+                    display_data_preview(result)
 
                 except Exception as e:
                     st.error(f"❌ Error processing file: {str(e)}")
@@ -143,12 +292,11 @@ def main():
             # Add OTA-specific sample generation
             if st.button("🏨 Generate Sample OTA/Booking Database Schema"):
                 with st.spinner("Generating sample OTA database schema..."):
-                    result = processor.generate_sample_ota_schema(sample_size)
-                    st.session_state.source_data = result['data']
-                    st.session_state.original_schema = result['schema']
+                    result = load_sample_ota_schema(sample_size)
+                    set_source(result)
 
                 st.success("✅ Sample OTA booking schema generated!")
-                display_data_preview(result['data'])
+                display_data_preview(result)
 
         elif source_type == "JSON Schema":
             st.info("📝 Upload or paste JSON schema")
@@ -157,11 +305,10 @@ def main():
 
             if json_input and st.button("Process JSON Schema"):
                 try:
-                    result = processor.process_json_schema(json_input)
-                    st.session_state.source_data = result['data']
-                    st.session_state.original_schema = result['schema']
+                    result = add_profile(MultiFormatProcessor().process_json_schema(json_input))
+                    set_source(result)
                     st.success("✅ JSON schema processed!")
-                    display_data_preview(result['data'])
+                    display_data_preview(result)
                 except Exception as e:
                     st.error(f"❌ Error processing JSON: {str(e)}")
 
@@ -179,19 +326,29 @@ def main():
 
             if st.button(f"🎲 Generate {sample_type}"):
                 with st.spinner(f"Generating {sample_type.lower()}..."):
-                    result = processor.generate_sample_data(sample_type, sample_size)
-                    st.session_state.source_data = result['data']
-                    st.session_state.original_schema = result['schema']
+                    result = load_sample_data(sample_type, sample_size)
+                    set_source(result)
 
                 st.success(f"✅ {sample_type} generated!")
-                display_data_preview(result['data'])
+                display_data_preview(result)
+
+    # Restore a persisted enrichment made with the current schema, options and project settings
+    # instead of asking the AI again
+    if st.session_state.original_schema is not None and st.session_state.enriched_schema is None:
+        st.session_state.enriched_schema = load_enrichment(enrichment_memo_key(
+            st.session_state.original_schema,
+            st.session_state.get("enhancement_options", DEFAULT_ENHANCEMENT_OPTIONS),
+            industry,
+            st.session_state.project_context,
+            batch_size
+        ))
 
     with tab2:
         if st.session_state.original_schema is not None:
             st.header("📊 Schema Analysis & Data Profiling")
 
             # Display enhanced schema table
-            display_enhanced_schema_analysis()
+            display_enhanced_schema_analysis(st.session_state.schema_df)
 
             # Data quality dashboard
             display_data_quality_dashboard()
@@ -210,22 +367,16 @@ def main():
                 st.subheader(f"🎯 {industry}-Specific Enhancements")
                 enhancement_options = st.multiselect(
                     "Select Enhancement Types:",
-                    [
-                        "Business-Friendly Column Names",
-                        "Industry-Specific Descriptions",
-                        "Data Governance & Compliance",
-                        "Data Quality Rules",
-                        "Transformation Suggestions",
-                        "Business KPI Identification"
-                    ],
-                    default=["Business-Friendly Column Names", "Industry-Specific Descriptions"]
+                    ENHANCEMENT_OPTIONS,
+                    default=DEFAULT_ENHANCEMENT_OPTIONS,
+                    key="enhancement_options"
                 )
 
             with col2:
                 st.subheader("🚀 AI Processing")
                 if st.button("✨ Enhance with AI", type="primary", use_container_width=True):
                     if enhancement_options:
-                        enhance_schema_with_ai(enhancement_options, ollama_client)
+                        enhance_schema_with_ai(enhancement_options, ollama_client, batch_size)
                     else:
                         st.warning("⚠️ Please select at least one enhancement option")
 
@@ -261,8 +412,11 @@ def main():
             st.info("👆 Complete the previous steps to see project summary")
 
 
-def display_data_preview(data):
+def display_data_preview(result):
     """Display data preview with metrics."""
+    data = result['data']
+    quality = result['quality']
+
     if isinstance(data, pd.DataFrame):
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -273,16 +427,14 @@ def display_data_preview(data):
             memory_usage = data.memory_usage(deep=True).sum() / 1024 / 1024
             st.metric("💾 Memory", f"{memory_usage:.1f} MB")
         with col4:
-            completeness = (1 - data.isnull().sum().sum() / (len(data) * len(data.columns))) * 100
-            st.metric("✅ Completeness", f"{completeness:.1f}%")
+            st.metric("✅ Completeness", f"{quality['completeness']:.1f}%")
 
         st.subheader("📋 Data Preview")
-        st.dataframe(data.head(10), use_container_width=True)
+        st.dataframe(to_arrow(result['preview']))
 
 
-def display_enhanced_schema_analysis():
+def display_enhanced_schema_analysis(schema_df):
     """Display enhanced schema analysis."""
-    schema_df = pd.DataFrame(st.session_state.original_schema)
 
     # Enhanced schema display with better formatting
     st.subheader("📋 Schema Overview")
@@ -297,7 +449,7 @@ def display_enhanced_schema_analysis():
     formatted_df['completeness_pct'] = formatted_df['completeness_pct'].round(1)
 
     st.dataframe(
-        formatted_df,
+        to_arrow(formatted_df),
         use_container_width=True,
         column_config={
             "column_name": st.column_config.TextColumn("Column", width=150),
@@ -311,101 +463,211 @@ def display_enhanced_schema_analysis():
     )
 
 
+@st.fragment
 def display_data_quality_dashboard():
     """Display data quality insights."""
     st.subheader("🔍 Data Quality Assessment")
 
-    schema_df = pd.DataFrame(st.session_state.original_schema)
+    quality = st.session_state.quality_summary
 
     # Quality metrics
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        high_quality_cols = len(schema_df[schema_df['completeness_pct'] >= 95])
-        st.metric("🟢 High Quality Columns", high_quality_cols)
+        st.metric("🟢 High Quality Columns", quality['high'])
 
     with col2:
-        medium_quality_cols = len(schema_df[
-                                      (schema_df['completeness_pct'] >= 70) &
-                                      (schema_df['completeness_pct'] < 95)
-                                      ])
-        st.metric("🟡 Medium Quality Columns", medium_quality_cols)
+        st.metric("🟡 Medium Quality Columns", quality['mid'])
 
     with col3:
-        low_quality_cols = len(schema_df[schema_df['completeness_pct'] < 70])
-        st.metric("🔴 Low Quality Columns", low_quality_cols)
+        st.metric("🔴 Low Quality Columns", quality['low'])
 
     with col4:
-        avg_completeness = schema_df['completeness_pct'].mean()
-        st.metric("📊 Avg Completeness", f"{avg_completeness:.1f}%")
+        st.metric("📊 Avg Completeness", f"{quality['avg']:.1f}%")
 
 
-def enhance_schema_with_ai(enhancement_options, ollama_client):
+def enhance_schema_with_ai(enhancement_options, ollama_client, batch_size):
     """Enhance schema using AI."""
+    # Identical inputs were already enriched: reuse the result without calling the AI again
+    memo = enrichment_memo()
+    memo_key = enrichment_memo_key(
+        st.session_state.original_schema, enhancement_options, st.session_state.selected_industry,
+        st.session_state.project_context, batch_size
+    )
+    if memo_key in memo:
+        st.session_state.enriched_schema = memo[memo_key]
+        st.success("✅ Schema enhanced successfully with AI insights!")
+        return
+
     with st.spinner("🧠 AI is analyzing your schema..."):
         try:
+            from src.schema_enricher import EnhancedSchemaEnricher
+            from src.business_context_engine import BusinessContextEngine
+
             enricher = EnhancedSchemaEnricher(ollama_client)
-            context_engine = BusinessContextEngine(st.session_state.selected_industry)
+            context_engine = BusinessContextEngine.create(st.session_state.selected_industry)
 
             # Add business context to the schema
             contextualized_schema = context_engine.add_business_context(
                 st.session_state.original_schema
             )
 
-            # Enhance with AI
-            enhanced_schema = enricher.enhance_schema(
+            # Enhance with AI, sending batches concurrently and streaming their output
+            progress = st.progress(0.0, text="Sending column batches to the AI engine...")
+            with st.expander("🧠 Live AI output", expanded=True):
+                live_caption = st.empty()
+                live_output = st.empty()
+
+            enhanced_schema = run_streamed_enhancement(
+                enricher,
                 contextualized_schema,
                 enhancement_options,
-                st.session_state.project_context
+                dict(st.session_state.project_context),
+                batch_size,
+                progress,
+                live_caption,
+                live_output
             )
+            progress.empty()
 
             st.session_state.enriched_schema = enhanced_schema
+            memo[memo_key] = enhanced_schema
+            save_enrichment(memo_key, enhanced_schema)
             st.success("✅ Schema enhanced successfully with AI insights!")
-            st.rerun()
 
         except Exception as e:
             st.error(f"❌ AI enhancement failed: {str(e)}")
 
 
+def run_streamed_enhancement(enricher, schema, enhancement_options, project_context,
+                             batch_size, progress, live_caption, live_output):
+    """Run the enricher in a worker thread and render its streamed output as it arrives."""
+    events = queue.Queue()
+    outcome = {}
+
+    def run():
+        try:
+            outcome['schema'] = enricher.enhance_schema(
+                schema,
+                enhancement_options,
+                project_context,
+                chunk_size=batch_size,
+                progress_callback=lambda completed, total: events.put(('progress', (completed, total))),
+                on_token=lambda chunk_number, text: events.put(('token', (chunk_number, text)))
+            )
+        except Exception as e:
+            outcome['error'] = e
+        finally:
+            events.put(('done', None))
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+
+    streamed_text = {}
+    finished = False
+    while not finished:
+        # Block for the next event, then drain the backlog so the UI is updated once per batch of tokens
+        pending = [events.get()]
+        while True:
+            try:
+                pending.append(events.get_nowait())
+            except queue.Empty:
+                break
+
+        latest_chunk = None
+        for kind, payload in pending:
+            if kind == 'token':
+                latest_chunk, text = payload
+                streamed_text.setdefault(latest_chunk, []).append(text)
+            elif kind == 'progress':
+                completed, total = payload
+                progress.progress(completed / total, text=f"Enhanced {completed}/{total} column batches")
+            else:
+                finished = True
+
+        if latest_chunk is not None:
+            live_caption.caption(f"Column batch {latest_chunk}")
+            live_output.code("".join(streamed_text[latest_chunk])[-LIVE_OUTPUT_CHARS:], language='json')
+
+    worker.join()
+
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['schema']
+
+
+@st.fragment
 def display_ai_enhancement_results():
     """Display AI enhancement results."""
     st.subheader("🎯 AI Enhancement Results")
 
-    # Create comparison view
-    for i, enhanced_col in enumerate(st.session_state.enriched_schema):
-        if enhanced_col.get('is_overall_assessment'):
-            continue
+    enriched_schema = st.session_state.enriched_schema
+    results_df = pd.DataFrame(enriched_schema)
+    if 'is_overall_assessment' in results_df:
+        results_df = results_df[~results_df['is_overall_assessment'].fillna(False).astype(bool)]
 
-        with st.expander(
-                f"📊 {enhanced_col['column_name']} → {enhanced_col.get('suggested_name', enhanced_col['column_name'])}",
-                expanded=False):
-            col1, col2 = st.columns(2)
+    # Compact comparison view for every column
+    st.dataframe(
+        to_arrow(results_df.reindex(columns=RESULTS_COLUMNS)),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "column_name": st.column_config.TextColumn("Original Name"),
+            "suggested_name": st.column_config.TextColumn("Suggested Name"),
+            "data_type": st.column_config.TextColumn("Type"),
+            "business_description": st.column_config.TextColumn("Business Description", width="large"),
+            "compliance_notes": st.column_config.TextColumn("Compliance"),
+        }
+    )
 
-            with col1:
-                st.write("**🔍 Original Analysis:**")
-                st.write(f"**Name:** `{enhanced_col['column_name']}`")
-                st.write(f"**Type:** `{enhanced_col['data_type']}`")
-                st.write(f"**Completeness:** {enhanced_col['completeness_pct']}%")
+    if results_df.empty:
+        return
 
-            with col2:
-                st.write("**✨ AI Enhancement:**")
-                st.write(f"**Suggested Name:** `{enhanced_col.get('suggested_name', 'N/A')}`")
-                st.write(f"**Business Description:** {enhanced_col.get('business_description', 'N/A')}")
+    # Detailed view for a single selected column
+    selected_index = st.selectbox(
+        "Inspect Column",
+        results_df.index.tolist(),
+        format_func=lambda idx: enriched_schema[idx]['column_name']
+    )
+    enhanced_col = enriched_schema[selected_index]
+
+    with st.expander(
+            f"📊 {enhanced_col['column_name']} → {enhanced_col.get('suggested_name', enhanced_col['column_name'])}",
+            expanded=True):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.write("**🔍 Original Analysis:**")
+            st.write(f"**Name:** `{enhanced_col['column_name']}`")
+            st.write(f"**Type:** `{enhanced_col['data_type']}`")
+            st.write(f"**Completeness:** {enhanced_col['completeness_pct']}%")
+
+        with col2:
+            st.write("**✨ AI Enhancement:**")
+            st.write(f"**Suggested Name:** `{enhanced_col.get('suggested_name', 'N/A')}`")
+            st.write(f"**Business Description:** {enhanced_col.get('business_description', 'N/A')}")
 
-                if enhanced_col.get('compliance_notes'):
-                    st.write(f"**🛡️ Compliance:** {enhanced_col['compliance_notes']}")
+            if enhanced_col.get('compliance_notes'):
+                st.write(f"**🛡️ Compliance:** {enhanced_col['compliance_notes']}")
 
-                if enhanced_col.get('transformation_suggestions'):
-                    st.write("**🔄 Transformations:**")
-                    for suggestion in enhanced_col['transformation_suggestions']:
-                        st.write(f"• {suggestion}")
+            if enhanced_col.get('transformation_suggestions'):
+                st.write("**🔄 Transformations:**")
+                for suggestion in enhanced_col['transformation_suggestions']:
+                    st.write(f"• {suggestion}")
 
 
 def generate_migration_assets():
     """Generate migration artifacts."""
     with st.spinner("🏗️ Generating migration assets..."):
         try:
-            generator = MigrationGenerator(st.session_state.project_context)
+            from src.migration_generator import MigrationGenerator
+
+            # Reuse the generator while the project is unchanged, so regenerating an
+            # unchanged schema returns its cached assets
+            generator = st.session_state.migration_generator
+            if generator is None or generator.project_context != st.session_state.project_context:
+                generator = MigrationGenerator(dict(st.session_state.project_context))
+                st.session_state.migration_generator = generator
 
             assets = generator.generate_all_assets(
                 st.session_state.enriched_schema,
@@ -414,12 +676,12 @@ def generate_migration_assets():
 
             st.session_state.migration_artifacts = assets
             st.success("✅ Migration assets generated successfully!")
-            st.rerun()
 
         except Exception as e:
             st.error(f"❌ Asset generation failed: {str(e)}")
 
 
+@st.fragment
 def display_migration_artifacts():
     """Display generated migration artifacts."""
     st.subheader("📦 Generated Migration Assets")
@@ -497,8 +759,8 @@ def display_project_summary():
             st.metric("📋 Columns Processed", len(st.session_state.original_schema))
 
             if st.session_state.enriched_schema:
-                enhanced_count = len([c for c in st.session_state.enriched_schema
-                                      if c.get('enhanced')])
+                enhanced_count = sum(1 for c in st.session_state.enriched_schema
+                                     if c.get('enhanced'))
                 st.metric("✨ AI Enhanced Columns", enhanced_count)
 
             if st.session_state.migration_artifacts:
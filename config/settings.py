@@ -2,7 +2,8 @@
 
 import os
 import re
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Pattern, Tuple
 
 # Ollama Configuration
 OLLAMA_CONFIG = {
@@ -16,22 +17,32 @@ OLLAMA_CONFIG = {
     "presence_penalty": float(os.getenv("OLLAMA_PRES_PENALTY", "0.0")),
 }
 
+# Friendly model name for the UI, derived once from the configured model
+OLLAMA_CONFIG["friendly_model_name"] = OLLAMA_CONFIG["default_model"].replace(":", " ").title()
+
 # CSV Processing Configuration
 CSV_CONFIG = {
     "max_file_size_mb": int(os.getenv("MAX_FILE_SIZE_MB", "100")),
     "max_rows_preview": int(os.getenv("MAX_ROWS_PREVIEW", "1000")),
-    "supported_encodings": ["utf-8", "latin-1", "cp1252", "iso-8859-1"],
-    "date_patterns": [
+    "supported_encodings": ("utf-8", "latin-1", "cp1252", "iso-8859-1"),
+    "date_patterns": (
         r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
         r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
         r'\d{2}-\d{2}-\d{4}',  # MM-DD-YYYY
         r'\d{4}/\d{2}/\d{2}',  # YYYY/MM/DD
-    ],
-    "compiled_date_patterns": []  # to be filled below
+    ),
 }
 
-# Compile regex patterns (performance boost if reused frequently)
-CSV_CONFIG["compiled_date_patterns"] = [re.compile(p) for p in CSV_CONFIG["date_patterns"]]
+
+@lru_cache(maxsize=1)
+def get_compiled_date_patterns() -> Tuple[Pattern, ...]:
+    """Compile the CSV date patterns on first use rather than at import."""
+    return tuple(re.compile(p) for p in CSV_CONFIG["date_patterns"])
+
+
+# Long-running servers can opt into paying the compile cost at startup instead
+if os.getenv("CSV_EAGER_REGEX", "0") == "1":
+    get_compiled_date_patterns()
 
 # Streamlit UI Configuration
 STREAMLIT_CONFIG = {
@@ -71,9 +82,10 @@ DEBUG_CONFIG = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Dict[str, Any]:
-    """Get complete configuration dictionary."""
-    config = {
+    """Get complete configuration dictionary (built once and shared)."""
+    return {
         "ollama": OLLAMA_CONFIG,
         "csv": CSV_CONFIG,
         "streamlit": STREAMLIT_CONFIG,
@@ -82,11 +94,6 @@ def get_config() -> Dict[str, Any]:
         "debug": DEBUG_CONFIG
     }
 
-    # Add friendly name for UI
-    config["ollama"]["friendly_model_name"] = config["ollama"]["default_model"].replace(":", " ").title()
-
-    return config
-
 
 def log_config() -> None:
     """Print the current configuration (for debugging)."""
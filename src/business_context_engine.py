@@ -1,399 +1,542 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, FrozenSet, Iterable, Iterator, Mapping, Optional, Tuple
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import lru_cache, partial
+from types import MappingProxyType
 import re
+import sys
+
+try:
+    import ahocorasick
+except ImportError:  # optional; keyword matching falls back to per-token set lookups
+    ahocorasick = None
+
+
+class Industry(Enum):
+    """Industries offered in the UI, keyed by their display name."""
+    GENERAL = "General"
+    FINANCIAL_SERVICES = "Financial Services"
+    HEALTHCARE = "Healthcare"
+    RETAIL = "Retail/E-commerce"
+    OTA = "Online Travel Agency (OTA)"
+    MANUFACTURING = "Manufacturing"
+    TELECOMMUNICATIONS = "Telecommunications"
+    GOVERNMENT = "Government"
+
+
+# Separators between the tokens of a column name
+_TOKEN_SPLIT = re.compile(r'[_\W]+')
+
+# Keyword groups tested against column names; a keyword matches when it occurs anywhere in the name
+_ID_KEYWORDS = frozenset({'id', 'key', 'nbr', 'number'})
+_CUSTOMER_KEYWORDS = frozenset({'cust', 'customer', 'client', 'guest'})
+_PRODUCT_KEYWORDS = frozenset({'prod', 'product', 'item', 'prop', 'property'})
+_ORDER_KEYWORDS = frozenset({'ord', 'order', 'trans', 'bkng', 'booking'})
+_AMOUNT_KEYWORDS = frozenset({'amt', 'amount', 'price', 'cost', 'value', 'rate'})
+_DATE_KEYWORDS = frozenset({'dt', 'date', 'time', 'ts'})
+_STAY_KEYWORDS = frozenset({'checkin', 'checkout'})
+_STATUS_KEYWORDS = frozenset({'status', 'state', 'flag', 'ind'})
+_DESCRIPTIVE_KEYWORDS = frozenset({'name', 'desc', 'description'})
+_COMMISSION_KEYWORDS = frozenset({'commission', 'margin'})
+_CANCELLATION_KEYWORDS = frozenset({'cancel', 'refund'})
+_REVIEW_KEYWORDS = frozenset({'review', 'rating', 'score'})
+_FUNNEL_KEYWORDS = frozenset({'search', 'click', 'conversion'})
+
+_PII_KEYWORDS = frozenset({
+    'name', 'fname', 'lname', 'email', 'phone', 'address', 'addr',
+    'ssn', 'social', 'birth', 'dob', 'license', 'passport'
+})
+_FINANCIAL_ACCOUNT_KEYWORDS = frozenset({'account', 'balance', 'payment', 'card'})
+_MEDICAL_KEYWORDS = frozenset({'patient', 'medical', 'diagnosis', 'procedure'})
+_PAYMENT_KEYWORDS = frozenset({'payment', 'card', 'billing'})
+_TRAVELER_KEYWORDS = frozenset({'guest', 'customer', 'traveler'})
+_BOOKING_KEYWORDS = frozenset({'booking', 'reservation', 'cancellation'})
+
+_PRIMARY_KEY_KEYWORDS = frozenset({'id', 'key', 'primary'})
+_REVENUE_KEYWORDS = frozenset({'amount', 'price', 'cost', 'revenue', 'commission'})
+_CORE_BOOKING_KEYWORDS = frozenset({'booking', 'reservation', 'guest'})
+_OPERATIONAL_KEYWORDS = frozenset({'date', 'time', 'status', 'type'})
+
+_MONETARY_KEYWORDS = frozenset({'amount', 'price', 'commission'})
+_QUANTITY_KEYWORDS = frozenset({'quantity', 'qty', 'rooms'})
+_EMAIL_KEYWORDS = frozenset({'email', 'mail'})
+_PHONE_KEYWORDS = frozenset({'phone', 'tel'})
+_STATE_KEYWORDS = frozenset({'status', 'state'})
+
+_PARTNER_REVENUE_KEYWORDS = frozenset({'commission', 'revenue'})
+_GUEST_KEYWORDS = frozenset({'guest', 'customer'})
+_SALES_KEYWORDS = frozenset({'revenue', 'sales'})
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Industry-specific business glossaries, shared by every engine instance
+_BUSINESS_GLOSSARIES = _freeze({
+    "Financial Services": {
+        "account": "Financial account holder record",
+        "transaction": "Financial transaction or payment",
+        "balance": "Account balance or available funds",
+        "credit": "Credit-related information or transactions",
+        "debit": "Debit transactions or charges",
+        "risk": "Risk assessment or credit risk scoring",
+        "kyc": "Know Your Customer compliance data",
+        "aml": "Anti-Money Laundering related fields",
+        "routing": "Bank routing number or payment routing",
+        "swift": "SWIFT code for international transfers"
+    },
+    "Healthcare": {
+        "patient": "Patient demographic or medical information",
+        "diagnosis": "Medical diagnosis codes (ICD-10)",
+        "procedure": "Medical procedures (CPT codes)",
+        "provider": "Healthcare provider information",
+        "claim": "Insurance claim or billing information",
+        "phi": "Protected Health Information",
+        "hipaa": "HIPAA compliance related data",
+        "medication": "Prescription or medication data",
+        "allergy": "Patient allergy information",
+        "vital": "Vital signs measurements"
+    },
+    "Retail/E-commerce": {
+        "customer": "Customer profile and demographic data",
+        "order": "Purchase order information",
+        "product": "Product catalog and inventory data",
+        "inventory": "Stock levels and warehouse data",
+        "sales": "Sales performance and revenue data",
+        "cart": "Shopping cart and session data",
+        "payment": "Payment processing information",
+        "shipping": "Shipping and fulfillment data",
+        "return": "Return and refund processing",
+        "loyalty": "Customer loyalty program data",
+        "promotion": "Marketing campaigns and promotions"
+    },
+    "Online Travel Agency (OTA)": {
+        "booking": "Reservation or booking transaction record",
+        "reservation": "Hotel/accommodation reservation details",
+        "accommodation": "Property or hotel listing information",
+        "property": "Hotel, apartment, or rental property details",
+        "guest": "Traveler or guest profile and preferences",
+        "stay": "Actual stay period and check-in/out details",
+        "cancellation": "Booking cancellation and refund information",
+        "rate": "Room rates, pricing, and availability data",
+        "availability": "Property availability and capacity management",
+        "commission": "Partner commission and revenue sharing",
+        "inventory": "Room inventory and allocation management",
+        "channel": "Distribution channel (direct, OTA, GDS)",
+        "payment": "Payment processing and fraud detection",
+        "review": "Guest reviews and property ratings",
+        "loyalty": "Guest loyalty program and points",
+        "destination": "Travel destination and location data",
+        "amenity": "Property amenities and facilities",
+        "policy": "Cancellation, payment, and booking policies",
+        "search": "Search queries and user behavior",
+        "conversion": "Booking funnel and conversion tracking",
+        "revenue": "Revenue management and pricing optimization",
+        "competitor": "Competitive pricing and market analysis",
+        "fraud": "Fraud detection and prevention data",
+        "partner": "Hotel partner and supplier information",
+        "contract": "Partner contracts and rate agreements"
+    },
+    "Manufacturing": {
+        "production": "Manufacturing production data",
+        "quality": "Quality control and assurance metrics",
+        "equipment": "Manufacturing equipment and machinery",
+        "batch": "Production batch tracking",
+        "material": "Raw materials and supply chain",
+        "operator": "Production line operator data",
+        "downtime": "Equipment downtime tracking",
+        "yield": "Production yield and efficiency",
+        "safety": "Workplace safety incidents",
+        "maintenance": "Equipment maintenance records"
+    }
+})
+
+# Compliance frameworks by industry, shared by every engine instance
+_COMPLIANCE_FRAMEWORKS = _freeze({
+    "Financial Services": [
+        "PCI DSS - Payment Card Industry Data Security Standard",
+        "SOX - Sarbanes-Oxley Act compliance",
+        "GDPR - General Data Protection Regulation",
+        "CCPA - California Consumer Privacy Act",
+        "KYC - Know Your Customer requirements",
+        "AML - Anti-Money Laundering regulations",
+        "BASEL III - Banking regulatory framework"
+    ],
+    "Healthcare": [
+        "HIPAA - Health Insurance Portability and Accountability Act",
+        "HITECH - Health Information Technology for Economic and Clinical Health",
+        "FDA 21 CFR Part 11 - Electronic records compliance",
+        "GDPR - General Data Protection Regulation",
+        "State privacy laws - Various state healthcare privacy requirements"
+    ],
+    "Retail/E-commerce": [
+        "PCI DSS - Payment Card Industry Data Security Standard",
+        "GDPR - General Data Protection Regulation",
+        "CCPA - California Consumer Privacy Act",
+        "COPPA - Children's Online Privacy Protection Act",
+        "CAN-SPAM Act - Email marketing compliance",
+        "FTC Act - Federal Trade Commission consumer protection"
+    ],
+    "Online Travel Agency (OTA)": [
+        "GDPR - General Data Protection Regulation (critical for EU travelers)",
+        "PCI DSS - Payment Card Industry Data Security Standard",
+        "CCPA - California Consumer Privacy Act",
+        "Data Localization Laws - Various country-specific requirements",
+        "Consumer Protection Laws - Travel-specific regulations",
+        "Tourism Industry Regulations - Local tourism board requirements",
+        "Anti-Money Laundering (AML) - For high-value bookings",
+        "Accessibility Laws - Website accessibility compliance",
+        "Package Travel Directive - EU travel package regulations",
+        "Price Transparency Laws - Display of total costs and fees",
+        "Cooling-off Period Laws - Consumer right to cancel",
+        "Force Majeure Regulations - COVID-19 and emergency cancellations"
+    ],
+    "General": [
+        "GDPR - General Data Protection Regulation",
+        "SOC 2 - Service Organization Control 2",
+        "ISO 27001 - Information security management"
+    ]
+})
+
+# Common naming patterns by industry, shared by every engine instance
+_NAMING_PATTERNS = _freeze({
+    "Financial Services": {
+        "account_patterns": ["acct", "account", "acc"],
+        "transaction_patterns": ["txn", "trans", "transaction"],
+        "amount_patterns": ["amt", "amount", "value", "val"],
+        "date_patterns": ["dt", "date", "time", "ts"],
+        "code_patterns": ["cd", "code", "type", "status"]
+    },
+    "Healthcare": {
+        "patient_patterns": ["pt", "patient", "pat"],
+        "medical_patterns": ["dx", "diagnosis", "proc", "procedure"],
+        "provider_patterns": ["prov", "provider", "dr", "physician"],
+        "date_patterns": ["dt", "date", "time", "dos"],
+        "code_patterns": ["cd", "code", "icd", "cpt"]
+    },
+    "Retail/E-commerce": {
+        "customer_patterns": ["cust", "customer", "client"],
+        "product_patterns": ["prod", "product", "item", "sku"],
+        "order_patterns": ["ord", "order", "purchase"],
+        "quantity_patterns": ["qty", "quantity", "count", "nbr"],
+        "price_patterns": ["price", "cost", "amt", "amount"]
+    },
+    "Online Travel Agency (OTA)": {
+        "booking_patterns": ["bkng", "booking", "reservation", "res"],
+        "property_patterns": ["prop", "property", "hotel", "accom"],
+        "guest_patterns": ["guest", "traveler", "customer", "cust"],
+        "rate_patterns": ["rate", "price", "tariff", "amt"],
+        "date_patterns": ["dt", "date", "checkin", "checkout"],
+        "status_patterns": ["status", "state", "cd", "flg"],
+        "location_patterns": ["dest", "destination", "city", "country"],
+        "revenue_patterns": ["commission", "revenue", "margin", "profit"]
+    }
+})
+
+
+# Glossary terms per industry, with each term's position so the first listed match wins
+_GLOSSARY_TERMS = _freeze({industry: frozenset(glossary) for industry, glossary in _BUSINESS_GLOSSARIES.items()})
+_GLOSSARY_RANKS = _freeze({industry: {term: rank for rank, term in enumerate(glossary)}
+                           for industry, glossary in _BUSINESS_GLOSSARIES.items()})
+
+# Final glossary-based context strings, built and interned once instead of formatted per column
+_GLOSSARY_CONTEXTS = _freeze({
+    industry: {term: sys.intern(f"{description} (Industry: {industry})") for term, description in glossary.items()}
+    for industry, glossary in _BUSINESS_GLOSSARIES.items()
+})
+
+_ALL_KEYWORDS = frozenset().union(
+    _ID_KEYWORDS, _CUSTOMER_KEYWORDS, _PRODUCT_KEYWORDS, _ORDER_KEYWORDS, _AMOUNT_KEYWORDS,
+    _DATE_KEYWORDS, _STAY_KEYWORDS, _STATUS_KEYWORDS, _DESCRIPTIVE_KEYWORDS, _COMMISSION_KEYWORDS,
+    _CANCELLATION_KEYWORDS, _REVIEW_KEYWORDS, _FUNNEL_KEYWORDS, _PII_KEYWORDS,
+    _FINANCIAL_ACCOUNT_KEYWORDS, _MEDICAL_KEYWORDS, _PAYMENT_KEYWORDS, _TRAVELER_KEYWORDS,
+    _BOOKING_KEYWORDS, _PRIMARY_KEY_KEYWORDS, _REVENUE_KEYWORDS, _CORE_BOOKING_KEYWORDS,
+    _OPERATIONAL_KEYWORDS, _MONETARY_KEYWORDS, _QUANTITY_KEYWORDS, _EMAIL_KEYWORDS,
+    _PHONE_KEYWORDS, _STATE_KEYWORDS, _PARTNER_REVENUE_KEYWORDS, _GUEST_KEYWORDS, _SALES_KEYWORDS,
+    *_GLOSSARY_TERMS.values()
+)
+
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over every keyword, or None if pyahocorasick is missing."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _ALL_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+@lru_cache(maxsize=4096)
+def _token_keywords(token: str) -> FrozenSet[str]:
+    """Return the keywords occurring in a single name token."""
+    return frozenset(keyword for keyword in _ALL_KEYWORDS if keyword in token)
+
+
+def _match_keywords(column_name: str) -> FrozenSet[str]:
+    """Return every keyword occurring in a column name.
+
+    With pyahocorasick installed this is a single scan of the lowercased name. Otherwise the
+    name is split into its ``_``/punctuation-separated tokens, which repeat across columns and
+    are cached; keywords contain no separators, so both give the same matches.
+    """
+    name = column_name.lower()
+    if _KEYWORD_AUTOMATON is not None:
+        return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(name))
+
+    matched = set()
+    for token in _TOKEN_SPLIT.split(name):
+        matched |= _token_keywords(token)
+    return frozenset(matched)
+
+
+# Compliance needs for any column that looks like personal data
+_PII_COMPLIANCE_NEEDS = (
+    "GDPR Article 6 - Lawful basis for processing personal data",
+    "Data encryption at rest and in transit required",
+    "Access logging and audit trail implementation"
+)
 
 
 class BusinessContextEngine:
-    """Provides industry-specific business context for schema analysis."""
+    """Provides industry-specific business context for schema analysis.
 
-    def __init__(self, industry: str = "General"):
-        self.industry = industry
-        self.business_glossaries = self._load_business_glossaries()
-        self.compliance_frameworks = self._load_compliance_frameworks()
-        self.naming_patterns = self._load_naming_patterns()
+    Use ``BusinessContextEngine.create(industry)`` to get the engine specialised for an
+    industry; industries without special rules share this generic implementation.
+    """
 
-    def add_business_context(self, schema: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Add business context to schema based on industry knowledge."""
-        enhanced_schema = []
+    # Industry-specific compliance needs: (keywords, needs added when any keyword occurs)
+    _compliance_rules = ()
+    # Industry-specific high criticality: (keywords, criticality) checked in order, first match wins
+    _criticality_rules = ()
+    # Industry-specific business rules: (keyword groups that must each match, rule)
+    _business_rule_table = ()
+    _amount_context = "Financial amount for business calculations and reporting"
 
+    def __init__(self, industry: str = "General"):
+        self.industry = industry
+        self.business_glossaries = _BUSINESS_GLOSSARIES
+        self.compliance_frameworks = _COMPLIANCE_FRAMEWORKS
+        self.naming_patterns = _NAMING_PATTERNS
+
+    @classmethod
+    def create(cls, industry: str = "General") -> 'BusinessContextEngine':
+        """Return the shared engine for an industry, specialised where the industry has its own rules."""
+        return _engine_for(industry)
+
+    def add_business_context(self, schema: List[Dict[str, Any]], copy: bool = False,
+                             parallel: bool = False, max_workers: Optional[int] = None) -> List[Mapping[str, Any]]:
+        """Add business context to schema based on industry knowledge.
+
+        Each returned column is a ``ChainMap`` of the four business-context fields over the
+        original column, so the original fields are shared rather than copied. Pass
+        ``copy=True`` to get independent plain dicts instead.
+
+        With ``parallel=True`` columns are classified on a thread pool of ``max_workers``
+        threads; worth it only for schemas with hundreds of columns. Order is preserved.
+        """
+        if parallel:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(partial(self._enhance_column, copy=copy), schema))
+
+        return list(self.iter_business_context(schema, copy))
+
+    def iter_business_context(self, schema: Iterable[Dict[str, Any]],
+                              copy: bool = False) -> Iterator[Mapping[str, Any]]:
+        """Yield each column with business context added, one at a time.
+
+        Use this instead of ``add_business_context`` when the columns are consumed once in order,
+        e.g. when streaming them to a writer, so the enhanced schema is never held in full.
+        """
         for column in schema:
-            enhanced_column = column.copy()
-
-            # Add business context
-            enhanced_column['business_context'] = self._infer_business_context(column)
-            enhanced_column['compliance_implications'] = self._identify_compliance_needs(column)
-            enhanced_column['business_criticality'] = self._assess_business_criticality(column)
-            enhanced_column['suggested_business_rules'] = self._suggest_business_rules(column)
-
-            enhanced_schema.append(enhanced_column)
-
-        return enhanced_schema
-
-    def _load_business_glossaries(self) -> Dict[str, Dict]:
-        """Load industry-specific business glossaries."""
-        return {
-            "Financial Services": {
-                "account": "Financial account holder record",
-                "transaction": "Financial transaction or payment",
-                "balance": "Account balance or available funds",
-                "credit": "Credit-related information or transactions",
-                "debit": "Debit transactions or charges",
-                "risk": "Risk assessment or credit risk scoring",
-                "kyc": "Know Your Customer compliance data",
-                "aml": "Anti-Money Laundering related fields",
-                "routing": "Bank routing number or payment routing",
-                "swift": "SWIFT code for international transfers"
-            },
-            "Healthcare": {
-                "patient": "Patient demographic or medical information",
-                "diagnosis": "Medical diagnosis codes (ICD-10)",
-                "procedure": "Medical procedures (CPT codes)",
-                "provider": "Healthcare provider information",
-                "claim": "Insurance claim or billing information",
-                "phi": "Protected Health Information",
-                "hipaa": "HIPAA compliance related data",
-                "medication": "Prescription or medication data",
-                "allergy": "Patient allergy information",
-                "vital": "Vital signs measurements"
-            },
-            "Retail/E-commerce": {
-                "customer": "Customer profile and demographic data",
-                "order": "Purchase order information",
-                "product": "Product catalog and inventory data",
-                "inventory": "Stock levels and warehouse data",
-                "sales": "Sales performance and revenue data",
-                "cart": "Shopping cart and session data",
-                "payment": "Payment processing information",
-                "shipping": "Shipping and fulfillment data",
-                "return": "Return and refund processing",
-                "loyalty": "Customer loyalty program data",
-                "promotion": "Marketing campaigns and promotions"
-            },
-            "Online Travel Agency (OTA)": {
-                "booking": "Reservation or booking transaction record",
-                "reservation": "Hotel/accommodation reservation details",
-                "accommodation": "Property or hotel listing information",
-                "property": "Hotel, apartment, or rental property details",
-                "guest": "Traveler or guest profile and preferences",
-                "stay": "Actual stay period and check-in/out details",
-                "cancellation": "Booking cancellation and refund information",
-                "rate": "Room rates, pricing, and availability data",
-                "availability": "Property availability and capacity management",
-                "commission": "Partner commission and revenue sharing",
-                "inventory": "Room inventory and allocation management",
-                "channel": "Distribution channel (direct, OTA, GDS)",
-                "payment": "Payment processing and fraud detection",
-                "review": "Guest reviews and property ratings",
-                "loyalty": "Guest loyalty program and points",
-                "destination": "Travel destination and location data",
-                "amenity": "Property amenities and facilities",
-                "policy": "Cancellation, payment, and booking policies",
-                "search": "Search queries and user behavior",
-                "conversion": "Booking funnel and conversion tracking",
-                "revenue": "Revenue management and pricing optimization",
-                "competitor": "Competitive pricing and market analysis",
-                "fraud": "Fraud detection and prevention data",
-                "partner": "Hotel partner and supplier information",
-                "contract": "Partner contracts and rate agreements"
-            },
-            "Manufacturing": {
-                "production": "Manufacturing production data",
-                "quality": "Quality control and assurance metrics",
-                "equipment": "Manufacturing equipment and machinery",
-                "batch": "Production batch tracking",
-                "material": "Raw materials and supply chain",
-                "operator": "Production line operator data",
-                "downtime": "Equipment downtime tracking",
-                "yield": "Production yield and efficiency",
-                "safety": "Workplace safety incidents",
-                "maintenance": "Equipment maintenance records"
-            }
+            yield self._enhance_column(column, copy)
+
+    def _enhance_column(self, column: Dict[str, Any], copy: bool) -> Mapping[str, Any]:
+        """Return the column with its business-context fields added."""
+        context, compliance, criticality, rules = self._classify_column(column)
+
+        # Add business context
+        overlay = {
+            'business_context': context,
+            'compliance_implications': compliance,
+            'business_criticality': criticality,
+            'suggested_business_rules': rules
         }
 
-    def _load_compliance_frameworks(self) -> Dict[str, List[str]]:
-        """Load compliance frameworks by industry."""
-        return {
-            "Financial Services": [
-                "PCI DSS - Payment Card Industry Data Security Standard",
-                "SOX - Sarbanes-Oxley Act compliance",
-                "GDPR - General Data Protection Regulation",
-                "CCPA - California Consumer Privacy Act",
-                "KYC - Know Your Customer requirements",
-                "AML - Anti-Money Laundering regulations",
-                "BASEL III - Banking regulatory framework"
-            ],
-            "Healthcare": [
-                "HIPAA - Health Insurance Portability and Accountability Act",
-                "HITECH - Health Information Technology for Economic and Clinical Health",
-                "FDA 21 CFR Part 11 - Electronic records compliance",
-                "GDPR - General Data Protection Regulation",
-                "State privacy laws - Various state healthcare privacy requirements"
-            ],
-            "Retail/E-commerce": [
-                "PCI DSS - Payment Card Industry Data Security Standard",
-                "GDPR - General Data Protection Regulation",
-                "CCPA - California Consumer Privacy Act",
-                "COPPA - Children's Online Privacy Protection Act",
-                "CAN-SPAM Act - Email marketing compliance",
-                "FTC Act - Federal Trade Commission consumer protection"
-            ],
-            "Online Travel Agency (OTA)": [
-                "GDPR - General Data Protection Regulation (critical for EU travelers)",
-                "PCI DSS - Payment Card Industry Data Security Standard",
-                "CCPA - California Consumer Privacy Act",
-                "Data Localization Laws - Various country-specific requirements",
-                "Consumer Protection Laws - Travel-specific regulations",
-                "Tourism Industry Regulations - Local tourism board requirements",
-                "Anti-Money Laundering (AML) - For high-value bookings",
-                "Accessibility Laws - Website accessibility compliance",
-                "Package Travel Directive - EU travel package regulations",
-                "Price Transparency Laws - Display of total costs and fees",
-                "Cooling-off Period Laws - Consumer right to cancel",
-                "Force Majeure Regulations - COVID-19 and emergency cancellations"
-            ],
-            "General": [
-                "GDPR - General Data Protection Regulation",
-                "SOC 2 - Service Organization Control 2",
-                "ISO 27001 - Information security management"
-            ]
-        }
-
-    def _load_naming_patterns(self) -> Dict[str, Dict]:
-        """Load common naming patterns by industry."""
-        return {
-            "Financial Services": {
-                "account_patterns": ["acct", "account", "acc"],
-                "transaction_patterns": ["txn", "trans", "transaction"],
-                "amount_patterns": ["amt", "amount", "value", "val"],
-                "date_patterns": ["dt", "date", "time", "ts"],
-                "code_patterns": ["cd", "code", "type", "status"]
-            },
-            "Healthcare": {
-                "patient_patterns": ["pt", "patient", "pat"],
-                "medical_patterns": ["dx", "diagnosis", "proc", "procedure"],
-                "provider_patterns": ["prov", "provider", "dr", "physician"],
-                "date_patterns": ["dt", "date", "time", "dos"],
-                "code_patterns": ["cd", "code", "icd", "cpt"]
-            },
-            "Retail/E-commerce": {
-                "customer_patterns": ["cust", "customer", "client"],
-                "product_patterns": ["prod", "product", "item", "sku"],
-                "order_patterns": ["ord", "order", "purchase"],
-                "quantity_patterns": ["qty", "quantity", "count", "nbr"],
-                "price_patterns": ["price", "cost", "amt", "amount"]
-            },
-            "Online Travel Agency (OTA)": {
-                "booking_patterns": ["bkng", "booking", "reservation", "res"],
-                "property_patterns": ["prop", "property", "hotel", "accom"],
-                "guest_patterns": ["guest", "traveler", "customer", "cust"],
-                "rate_patterns": ["rate", "price", "tariff", "amt"],
-                "date_patterns": ["dt", "date", "checkin", "checkout"],
-                "status_patterns": ["status", "state", "cd", "flg"],
-                "location_patterns": ["dest", "destination", "city", "country"],
-                "revenue_patterns": ["commission", "revenue", "margin", "profit"]
-            }
-        }
-
-    def _infer_business_context(self, column: Dict[str, Any]) -> str:
-        """Infer business context from column information."""
-        column_name = column['column_name'].lower()
-        sample_values = column.get('sample_values', [])
-
-        # Get industry-specific glossary
-        glossary = self.business_glossaries.get(self.industry, {})
-
-        # Check for direct matches
-        for term, description in glossary.items():
-            if term in column_name:
-                return f"{description} (Industry: {self.industry})"
+        return {**column, **overlay} if copy else ChainMap(overlay, column)
+
+    def _classify_column(self, column: Dict[str, Any]) -> Tuple[str, Tuple[str, ...], str, Tuple[str, ...]]:
+        """Return the business context, compliance needs, criticality and rules for a column."""
+        # Read every field once up front; the profile flags below only use these locals
+        get = column.get
+        column_name, data_type, completeness, unique_count, total_count, is_pii, is_business_key = (
+            column['column_name'], get('data_type', ''), get('completeness_pct', 0), get('unique_count', 0),
+            get('total_count', 1), bool(get('potential_pii')), bool(get('potential_business_key'))
+        )
+        keywords = _match_keywords(column_name)
+        uniqueness_ratio = unique_count / max(total_count, 1)
+
+        return (
+            self._business_context(keywords),
+            self._compliance_needs(keywords),
+            self._business_criticality(
+                keywords, is_pii, completeness > 95, uniqueness_ratio > 0.8, completeness > 80
+            ),
+            self._business_rules(keywords, data_type, completeness < 70, is_business_key, is_pii)
+        )
+
+    # Classification results depend only on these arguments, so they are memoized per engine;
+    # engines from create() are shared, so the caches carry over between enhancement runs
+
+    @lru_cache(maxsize=4096)
+    def _business_context(self, keywords: FrozenSet[str]) -> str:
+        """Infer business context from the keywords in a column name."""
+        # Check for direct matches, preferring the term listed first in the glossary
+        glossary_hits = keywords & _GLOSSARY_TERMS.get(self.industry, frozenset())
+        if glossary_hits:
+            term = min(glossary_hits, key=_GLOSSARY_RANKS[self.industry].__getitem__)
+            return _GLOSSARY_CONTEXTS[self.industry][term]
 
         # Check for common business patterns
-        if any(pattern in column_name for pattern in ['id', 'key', 'nbr', 'number']):
-            if any(pattern in column_name for pattern in ['cust', 'customer', 'client', 'guest']):
+        if keywords & _ID_KEYWORDS:
+            if keywords & _CUSTOMER_KEYWORDS:
                 return "Customer/Guest identifier for business operations"
-            elif any(pattern in column_name for pattern in ['prod', 'product', 'item', 'prop', 'property']):
+            elif keywords & _PRODUCT_KEYWORDS:
                 return "Product/Property identifier for inventory management"
-            elif any(pattern in column_name for pattern in ['ord', 'order', 'trans', 'bkng', 'booking']):
+            elif keywords & _ORDER_KEYWORDS:
                 return "Transaction/Booking identifier for order processing"
             else:
                 return "Business identifier for operational tracking"
 
-        elif any(pattern in column_name for pattern in ['amt', 'amount', 'price', 'cost', 'value', 'rate']):
-            if self.industry == "Online Travel Agency (OTA)":
-                return "Financial amount for booking transactions and revenue management"
-            else:
-                return "Financial amount for business calculations and reporting"
+        elif keywords & _AMOUNT_KEYWORDS:
+            return self._amount_context
 
-        elif any(pattern in column_name for pattern in ['dt', 'date', 'time', 'ts']):
-            if self.industry == "Online Travel Agency (OTA)" and any(
-                    pattern in column_name for pattern in ['checkin', 'checkout']):
-                return "Travel date for booking and stay management"
-            else:
-                return "Date/time field for temporal business analysis"
+        elif keywords & _DATE_KEYWORDS:
+            return self._date_context(keywords)
 
-        elif any(pattern in column_name for pattern in ['status', 'state', 'flag', 'ind']):
+        elif keywords & _STATUS_KEYWORDS:
             return "Status indicator for business process tracking"
 
-        elif any(pattern in column_name for pattern in ['name', 'desc', 'description']):
+        elif keywords & _DESCRIPTIVE_KEYWORDS:
             return "Descriptive text field for business identification"
 
         # Industry-specific patterns
-        elif self.industry == "Online Travel Agency (OTA)":
-            if any(pattern in column_name for pattern in ['commission', 'margin']):
-                return "Revenue sharing and partner commission data"
-            elif any(pattern in column_name for pattern in ['cancel', 'refund']):
-                return "Cancellation and refund processing information"
-            elif any(pattern in column_name for pattern in ['review', 'rating', 'score']):
-                return "Guest feedback and property quality metrics"
-            elif any(pattern in column_name for pattern in ['search', 'click', 'conversion']):
-                return "User behavior and booking funnel analytics"
-
-        return f"Business data field relevant to {self.industry} operations"
-
-    def _identify_compliance_needs(self, column: Dict[str, Any]) -> List[str]:
-        """Identify compliance requirements for the column."""
-        compliance_needs = []
-        column_name = column['column_name'].lower()
+        return self._extra_context(keywords) or sys.intern(
+            f"Business data field relevant to {self.industry} operations"
+        )
 
+    def _date_context(self, keywords: FrozenSet[str]) -> str:
+        """Describe a date/time column."""
+        return "Date/time field for temporal business analysis"
+
+    def _extra_context(self, keywords: FrozenSet[str]) -> Optional[str]:
+        """Industry-specific context for columns matching none of the common patterns."""
+        return None
+
+    @lru_cache(maxsize=4096)
+    def _compliance_needs(self, keywords: FrozenSet[str]) -> Tuple[str, ...]:
+        """Identify compliance requirements from the keywords in a column name."""
         # PII Detection
-        pii_patterns = [
-            'name', 'fname', 'lname', 'email', 'phone', 'address', 'addr',
-            'ssn', 'social', 'birth', 'dob', 'license', 'passport'
-        ]
-
-        if any(pattern in column_name for pattern in pii_patterns):
-            compliance_needs.extend([
-                "GDPR Article 6 - Lawful basis for processing personal data",
-                "Data encryption at rest and in transit required",
-                "Access logging and audit trail implementation"
-            ])
+        compliance_needs = _PII_COMPLIANCE_NEEDS if keywords & _PII_KEYWORDS else ()
 
         # Industry-specific compliance
-        industry_compliance = self.compliance_frameworks.get(self.industry, [])
-
-        if self.industry == "Financial Services":
-            if any(pattern in column_name for pattern in ['account', 'balance', 'payment', 'card']):
-                compliance_needs.extend([
-                    "PCI DSS - Secure storage of cardholder data",
-                    "SOX - Financial reporting accuracy requirements"
-                ])
-
-        elif self.industry == "Healthcare":
-            if any(pattern in column_name for pattern in ['patient', 'medical', 'diagnosis', 'procedure']):
-                compliance_needs.extend([
-                    "HIPAA - Protected Health Information (PHI) safeguards",
-                    "Minimum necessary standard for data access"
-                ])
-
-        elif self.industry == "Retail/E-commerce":
-            if any(pattern in column_name for pattern in ['payment', 'card', 'billing']):
-                compliance_needs.append("PCI DSS - Payment processing security")
-
-        elif self.industry == "Online Travel Agency (OTA)":
-            if any(pattern in column_name for pattern in ['guest', 'customer', 'traveler']):
-                compliance_needs.extend([
-                    "GDPR - EU traveler data protection requirements",
-                    "Data localization - Country-specific data residency rules"
-                ])
-            if any(pattern in column_name for pattern in ['payment', 'card', 'billing']):
-                compliance_needs.append("PCI DSS - Payment processing for travel bookings")
-            if any(pattern in column_name for pattern in ['booking', 'reservation', 'cancellation']):
-                compliance_needs.extend([
-                    "Package Travel Directive - EU booking protection",
-                    "Consumer protection laws - Booking terms transparency"
-                ])
+        for rule_keywords, needs in self._compliance_rules:
+            if keywords & rule_keywords:
+                compliance_needs += needs
 
         return compliance_needs
 
-    def _assess_business_criticality(self, column: Dict[str, Any]) -> str:
-        """Assess business criticality of the column."""
-        column_name = column['column_name'].lower()
-        completeness = column.get('completeness_pct', 0)
-        uniqueness_ratio = column.get('unique_count', 0) / max(column.get('total_count', 1), 1)
-
+    @lru_cache(maxsize=4096)
+    def _business_criticality(self, keywords: FrozenSet[str], is_pii: bool, is_complete: bool,
+                              is_mostly_unique: bool, is_well_populated: bool) -> str:
+        """Assess business criticality from the column keywords and profile flags."""
         # High criticality indicators
-        if any(pattern in column_name for pattern in ['id', 'key', 'primary']):
+        if keywords & _PRIMARY_KEY_KEYWORDS:
             return "High - Primary business identifier"
 
-        elif any(pattern in column_name for pattern in ['amount', 'price', 'cost', 'revenue', 'commission']):
+        elif keywords & _REVENUE_KEYWORDS:
             return "High - Financial/Revenue critical"
 
-        elif column.get('potential_pii'):
+        elif is_pii:
             return "High - Personal data with compliance requirements"
 
-        elif completeness > 95 and uniqueness_ratio > 0.8:
+        elif is_complete and is_mostly_unique:
             return "High - Well-maintained business key"
 
         # Industry-specific high criticality
-        elif self.industry == "Online Travel Agency (OTA)":
-            if any(pattern in column_name for pattern in ['booking', 'reservation', 'guest']):
-                return "High - Core booking business process"
-            elif any(pattern in column_name for pattern in ['checkin', 'checkout']):
-                return "High - Critical for stay management"
+        elif self._criticality_rules:
+            for rule_keywords, criticality in self._criticality_rules:
+                if keywords & rule_keywords:
+                    return criticality
 
         # Medium criticality
-        elif any(pattern in column_name for pattern in ['date', 'time', 'status', 'type']):
+        elif keywords & _OPERATIONAL_KEYWORDS:
             return "Medium - Operational tracking field"
 
-        elif completeness > 80:
+        elif is_well_populated:
             return "Medium - Well-populated business data"
 
         # Low criticality
         else:
             return "Low - Supporting or optional data"
 
-    def _suggest_business_rules(self, column: Dict[str, Any]) -> List[str]:
-        """Suggest business rules for the column."""
-        rules = []
-        column_name = column['column_name'].lower()
-        data_type = column.get('data_type', '')
-        completeness = column.get('completeness_pct', 0)
+    @lru_cache(maxsize=4096)
+    def _business_rules(self, keywords: FrozenSet[str], data_type: str, is_incomplete: bool,
+                        is_business_key: bool, is_pii: bool) -> Tuple[str, ...]:
+        """Suggest business rules from the column keywords, type and profile flags."""
+        rules = ()
 
         # Completeness rules
-        if completeness < 70:
-            rules.append("Implement data completeness monitoring and alerts")
+        if is_incomplete:
+            rules += ("Implement data completeness monitoring and alerts",)
 
         # Type-specific rules
-        if data_type in ['integer', 'float']:
-            if 'amount' in column_name or 'price' in column_name or 'commission' in column_name:
-                rules.append("Validate non-negative amounts for financial fields")
-                rules.append("Implement currency precision rules (2 decimal places)")
+        if data_type in ('integer', 'float'):
+            if keywords & _MONETARY_KEYWORDS:
+                rules += (
+                    "Validate non-negative amounts for financial fields",
+                    "Implement currency precision rules (2 decimal places)"
+                )
 
-            if 'quantity' in column_name or 'qty' in column_name or 'rooms' in column_name:
-                rules.append("Validate positive quantities for inventory")
+            if keywords & _QUANTITY_KEYWORDS:
+                rules += ("Validate positive quantities for inventory",)
 
         elif data_type == 'string':
-            if any(pattern in column_name for pattern in ['email', 'mail']):
-                rules.append("Validate email format using regex pattern")
-                rules.append("Implement duplicate email detection")
+            if keywords & _EMAIL_KEYWORDS:
+                rules += ("Validate email format using regex pattern", "Implement duplicate email detection")
 
-            elif any(pattern in column_name for pattern in ['phone', 'tel']):
-                rules.append("Standardize phone number format")
-                rules.append("Validate phone number patterns by region")
+            elif keywords & _PHONE_KEYWORDS:
+                rules += ("Standardize phone number format", "Validate phone number patterns by region")
 
-            elif any(pattern in column_name for pattern in ['status', 'state']):
-                rules.append("Implement allowed values validation")
-                rules.append("Create status transition rules")
+            elif keywords & _STATE_KEYWORDS:
+                rules += ("Implement allowed values validation", "Create status transition rules")
 
         # Business key rules
-        if column.get('potential_business_key'):
-            rules.append("Implement uniqueness constraints")
-            rules.append("Create referential integrity checks")
+        if is_business_key:
+            rules += ("Implement uniqueness constraints", "Create referential integrity checks")
 
         # PII rules
-        if column.get('potential_pii'):
-            rules.append("Implement data masking for non-production environments")
-            rules.append("Create access control and audit logging")
+        if is_pii:
+            rules += (
+                "Implement data masking for non-production environments",
+                "Create access control and audit logging"
+            )
 
         # Industry-specific rules
-        if self.industry == "Online Travel Agency (OTA)":
-            if 'booking' in column_name and 'date' in column_name:
-                rules.append("Validate booking date is not in the past")
-            if 'checkin' in column_name or 'checkout' in column_name:
-                rules.append("Validate check-out date is after check-in date")
-            if 'cancellation' in column_name and 'date' in column_name:
-                rules.append("Validate cancellation deadline against check-in date")
-            if 'commission' in column_name:
-                rules.append("Validate commission percentage is within contract limits")
+        for keyword_groups, rule in self._business_rule_table:
+            if all(keywords & group for group in keyword_groups):
+                rules += (rule,)
 
         return rules
 
@@ -406,7 +549,7 @@ class BusinessContextEngine:
             'data_steward': f"{self.industry} Data Team",
             'business_owner': f"{self.industry} Business Unit",
             'usage_guidelines': self._generate_usage_guidelines(column),
-            'related_metrics': self._identify_related_metrics(column)
+            'related_metrics': self._identify_related_metrics(_match_keywords(column['column_name']))
         }
 
     def _generate_usage_guidelines(self, column: Dict[str, Any]) -> str:
@@ -424,33 +567,126 @@ class BusinessContextEngine:
 
         return "; ".join(guidelines) if guidelines else "Standard business data usage applies"
 
-    def _identify_related_metrics(self, column: Dict[str, Any]) -> List[str]:
-        """Identify related business metrics."""
-        column_name = column['column_name'].lower()
-
-        if self.industry == "Online Travel Agency (OTA)":
-            if 'booking' in column_name:
-                return ["Booking Conversion Rate", "Cancellation Rate", "Revenue per Booking"]
-            elif 'commission' in column_name or 'revenue' in column_name:
-                return ["Average Commission Rate", "Partner Revenue", "Margin Analysis"]
-            elif 'guest' in column_name or 'customer' in column_name:
-                return ["Guest Satisfaction Score", "Repeat Booking Rate", "Customer Lifetime Value"]
-            elif 'property' in column_name:
-                return ["Property Performance Score", "Occupancy Rate", "Average Daily Rate"]
-            elif 'search' in column_name:
-                return ["Search Conversion Rate", "Click-through Rate", "Abandonment Rate"]
-
-        elif 'revenue' in column_name or 'sales' in column_name:
-            return ["Monthly Revenue", "Year-over-Year Growth", "Revenue per Customer"]
+    def _identify_related_metrics(self, keywords: FrozenSet[str]) -> Tuple[str, ...]:
+        """Identify related business metrics from the keywords in a column name."""
+        if keywords & _SALES_KEYWORDS:
+            return ("Monthly Revenue", "Year-over-Year Growth", "Revenue per Customer")
 
-        elif 'customer' in column_name and 'id' in column_name:
-            return ["Customer Count", "Customer Acquisition Rate", "Customer Retention"]
+        elif 'customer' in keywords and 'id' in keywords:
+            return ("Customer Count", "Customer Acquisition Rate", "Customer Retention")
 
-        elif 'order' in column_name:
-            return ["Order Volume", "Average Order Value", "Order Conversion Rate"]
+        elif 'order' in keywords:
+            return ("Order Volume", "Average Order Value", "Order Conversion Rate")
 
-        elif 'product' in column_name:
-            return ["Product Performance", "Inventory Turnover", "Product Profitability"]
+        elif 'product' in keywords:
+            return ("Product Performance", "Inventory Turnover", "Product Profitability")
 
         else:
-            return []
\ No newline at end of file
+            return ()
+
+
+class _FinServBusinessContextEngine(BusinessContextEngine):
+    """Business context for Financial Services."""
+
+    _compliance_rules = (
+        (_FINANCIAL_ACCOUNT_KEYWORDS, (
+            "PCI DSS - Secure storage of cardholder data",
+            "SOX - Financial reporting accuracy requirements"
+        )),
+    )
+
+
+class _HealthcareBusinessContextEngine(BusinessContextEngine):
+    """Business context for Healthcare."""
+
+    _compliance_rules = (
+        (_MEDICAL_KEYWORDS, (
+            "HIPAA - Protected Health Information (PHI) safeguards",
+            "Minimum necessary standard for data access"
+        )),
+    )
+
+
+class _RetailBusinessContextEngine(BusinessContextEngine):
+    """Business context for Retail/E-commerce."""
+
+    _compliance_rules = (
+        (_PAYMENT_KEYWORDS, ("PCI DSS - Payment processing security",)),
+    )
+
+
+class _OTABusinessContextEngine(BusinessContextEngine):
+    """Business context for Online Travel Agencies."""
+
+    _compliance_rules = (
+        (_TRAVELER_KEYWORDS, (
+            "GDPR - EU traveler data protection requirements",
+            "Data localization - Country-specific data residency rules"
+        )),
+        (_PAYMENT_KEYWORDS, ("PCI DSS - Payment processing for travel bookings",)),
+        (_BOOKING_KEYWORDS, (
+            "Package Travel Directive - EU booking protection",
+            "Consumer protection laws - Booking terms transparency"
+        )),
+    )
+    _criticality_rules = (
+        (_CORE_BOOKING_KEYWORDS, "High - Core booking business process"),
+        (_STAY_KEYWORDS, "High - Critical for stay management"),
+    )
+    _business_rule_table = (
+        ((frozenset({'booking'}), frozenset({'date'})), "Validate booking date is not in the past"),
+        ((_STAY_KEYWORDS,), "Validate check-out date is after check-in date"),
+        ((frozenset({'cancellation'}), frozenset({'date'})), "Validate cancellation deadline against check-in date"),
+        ((frozenset({'commission'}),), "Validate commission percentage is within contract limits"),
+    )
+    _amount_context = "Financial amount for booking transactions and revenue management"
+
+    def _date_context(self, keywords: FrozenSet[str]) -> str:
+        """Describe a date/time column, calling out check-in and check-out dates."""
+        if keywords & _STAY_KEYWORDS:
+            return "Travel date for booking and stay management"
+        return super()._date_context(keywords)
+
+    def _extra_context(self, keywords: FrozenSet[str]) -> Optional[str]:
+        """OTA-specific context for columns matching none of the common patterns."""
+        if keywords & _COMMISSION_KEYWORDS:
+            return "Revenue sharing and partner commission data"
+        elif keywords & _CANCELLATION_KEYWORDS:
+            return "Cancellation and refund processing information"
+        elif keywords & _REVIEW_KEYWORDS:
+            return "Guest feedback and property quality metrics"
+        elif keywords & _FUNNEL_KEYWORDS:
+            return "User behavior and booking funnel analytics"
+        return None
+
+    def _identify_related_metrics(self, keywords: FrozenSet[str]) -> Tuple[str, ...]:
+        """Identify related OTA business metrics from the keywords in a column name."""
+        if 'booking' in keywords:
+            return ("Booking Conversion Rate", "Cancellation Rate", "Revenue per Booking")
+        elif keywords & _PARTNER_REVENUE_KEYWORDS:
+            return ("Average Commission Rate", "Partner Revenue", "Margin Analysis")
+        elif keywords & _GUEST_KEYWORDS:
+            return ("Guest Satisfaction Score", "Repeat Booking Rate", "Customer Lifetime Value")
+        elif 'property' in keywords:
+            return ("Property Performance Score", "Occupancy Rate", "Average Daily Rate")
+        elif 'search' in keywords:
+            return ("Search Conversion Rate", "Click-through Rate", "Abandonment Rate")
+
+
+# Engine class per industry; industries not listed use the generic engine
+_INDUSTRY_ENGINES = MappingProxyType({
+    Industry.FINANCIAL_SERVICES: _FinServBusinessContextEngine,
+    Industry.HEALTHCARE: _HealthcareBusinessContextEngine,
+    Industry.RETAIL: _RetailBusinessContextEngine,
+    Industry.OTA: _OTABusinessContextEngine,
+})
+
+
+@lru_cache(maxsize=None)
+def _engine_for(industry: str) -> BusinessContextEngine:
+    """Build the engine for an industry once and share it."""
+    try:
+        engine_class = _INDUSTRY_ENGINES.get(Industry(industry), BusinessContextEngine)
+    except ValueError:
+        engine_class = BusinessContextEngine
+    return engine_class(industry)
@@ -1,40 +1,128 @@
 import pandas as pd
 import numpy as np
-import chardet
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+import pyarrow.compute as pc
+import csv
+import os
 import re
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+import hashlib
 import io
 
+try:
+    import cchardet as chardet  # C implementation of the same detect() API
+except ImportError:
+    import chardet
+
+# Bytes of the file handed to chardet, keeping detection cost independent of file size
+ENCODING_SAMPLE_BYTES = 32 * 1024
+
+# Files larger than this are parsed by the pandas fallback in chunks of CSV_CHUNK_ROWS rows
+CHUNKED_READ_BYTES = 10 * 1024 * 1024
+CSV_CHUNK_ROWS = 100_000
+
+# Rows scanned in Python for sample values before falling back to a full unique()
+SAMPLE_SCAN_ROWS = 1000
+
+# Threads used to analyze columns in parallel during schema inference
+SCHEMA_WORKERS = min(8, os.cpu_count() or 1)
+
+# Bytes of the file csv.Sniffer looks at to pick the separator
+SNIFF_SAMPLE_BYTES = 16 * 1024
+
+# Field values read as missing, the same tokens pandas.read_csv treats as NA by default
+_NA_VALUES = (
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+)
+
+# Byte-order marks and the encodings that consume them (UTF-32 before the UTF-16 prefix it shares)
+_BOMS = (
+    (b'\xef\xbb\xbf', 'utf-8-sig'),
+    (b'\xff\xfe\x00\x00', 'utf-32'),
+    (b'\x00\x00\xfe\xff', 'utf-32'),
+    (b'\xff\xfe', 'utf-16'),
+    (b'\xfe\xff', 'utf-16'),
+)
+
+# Values (lowercased) that mark a column as boolean
+_TRUE_VALUES = frozenset({'true', 'yes', 'y', '1', 'on', 'enabled'})
+_FALSE_VALUES = frozenset({'false', 'no', 'n', '0', 'off', 'disabled'})
+_BOOLEAN_VALUES = _TRUE_VALUES | _FALSE_VALUES
+
+# Column-name tokens (lowercased) of float columns that stay float even when every value is whole
+_DECIMAL_NAME_TOKENS = frozenset({
+    'rt', 'rate', 'amt', 'amount', 'pct', 'percent', 'price', 'cost', 'ratio', 'dec', 'decimal'
+})
+
 
 class CSVProcessor:
     """Handles CSV file processing and schema inference."""
 
     def __init__(self):
-        self.supported_encodings = ['utf-8', 'latin1', 'cp1252', 'iso-8859-1']
-        self.date_patterns = [
+        self.supported_encodings = ('utf-8', 'latin1', 'cp1252', 'iso-8859-1')
+        self.date_patterns = (
             r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
             r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
             r'\d{2}-\d{2}-\d{4}',  # MM-DD-YYYY
             r'\d{4}/\d{2}/\d{2}',  # YYYY/MM/DD
-        ]
+        )
+        # strftime format for each of the date patterns above, in the same order
+        self.date_formats = ('%Y-%m-%d', '%m/%d/%Y', '%m-%d-%Y', '%Y/%m/%d')
+        self._date_pattern_formats = tuple(
+            (re.compile(pattern), date_format) for pattern, date_format in zip(self.date_patterns, self.date_formats)
+        )
+        # All date patterns in one alternation so a column is matched in a single vectorized pass;
+        # grouped as a whole so an anchor added in front applies to every alternative
+        self._date_regex = re.compile('(?:' + '|'.join(f'(?:{pattern})' for pattern in self.date_patterns) + ')')
+
+        # Column-name cleanup pattern, compiled once
+        self._re_name_separators = re.compile(r'[\W_]+')
+
+        # Inferred types of untyped columns by content signature
+        self._inferred_types = {}
 
     def detect_encoding(self, file_bytes: bytes) -> str:
-        """Detect file encoding using chardet."""
+        """Detect file encoding from a byte-order mark or a sample of the file using chardet."""
+        # A byte-order mark settles the encoding without running chardet
+        for bom, bom_encoding in _BOMS:
+            if file_bytes.startswith(bom):
+                return bom_encoding
+
         try:
-            result = chardet.detect(file_bytes)
-            encoding = result['encoding']
+            encoding, confidence = self._detect_sample(file_bytes[:ENCODING_SAMPLE_BYTES])
+
+            # Low confidence on the head of a large file: try a window from the middle too
+            if confidence < 0.7 and len(file_bytes) > 2 * ENCODING_SAMPLE_BYTES:
+                middle = len(file_bytes) // 2
+                middle_encoding, middle_confidence = self._detect_sample(
+                    file_bytes[middle:middle + ENCODING_SAMPLE_BYTES]
+                )
+                if middle_confidence > confidence:
+                    encoding, confidence = middle_encoding, middle_confidence
 
             # Fallback to common encodings if detection fails
-            if not encoding or result['confidence'] < 0.7:
+            if not encoding or confidence < 0.7:
                 encoding = 'utf-8'
 
             return encoding
         except Exception:
             return 'utf-8'
 
-    def process_file(self, uploaded_file) -> pd.DataFrame:
-        """Process uploaded CSV file and return DataFrame."""
+    def _detect_sample(self, sample: bytes) -> Tuple[Optional[str], float]:
+        """Run chardet on a sample; cchardet reports no confidence for undecidable input."""
+        result = chardet.detect(sample)
+        return result['encoding'], result['confidence'] or 0.0
+
+    def process_file(self, uploaded_file, max_rows: Optional[int] = None) -> pd.DataFrame:
+        """Process uploaded CSV file and return DataFrame.
+
+        ``max_rows`` stops parsing once that many rows are read, for callers that only need a
+        sample (e.g. to infer a schema). Large files read in full are parsed in chunks.
+        """
         # Read file bytes
         file_bytes = uploaded_file.read()
         uploaded_file.seek(0)  # Reset file pointer
@@ -42,80 +130,178 @@ class CSVProcessor:
         # Detect encoding
         encoding = self.detect_encoding(file_bytes)
 
-        # Try different parsing strategies
-        parsing_strategies = [
-            {'sep': ',', 'encoding': encoding},
-            {'sep': ';', 'encoding': encoding},
-            {'sep': '\t', 'encoding': encoding},
-            {'sep': ',', 'encoding': 'utf-8'},
-            {'sep': ',', 'encoding': 'latin1'},
+        # Guess the separator once from a sample; only retry candidates if sniffing fails
+        separator = self._sniff_separator(file_bytes, encoding)
+        separators = (separator,) if separator else (',', ';', '\t')
+
+        # Fast path: the multithreaded pyarrow reader, producing Arrow-backed dtypes
+        try:
+            df = self._read_with_pyarrow(file_bytes, encoding, separators[0], max_rows)
+            if self._is_valid_frame(df):
+                return self._finalize_frame(df)
+        except Exception:
+            pass
+
+        # Fall back to the pandas C engine, then to the common encodings
+        parsing_strategies = [{'sep': sep, 'encoding': encoding, 'low_memory': False} for sep in separators]
+        parsing_strategies += [
+            {'sep': separators[0], 'encoding': 'utf-8', 'low_memory': False},
+            {'sep': separators[0], 'encoding': 'latin1', 'low_memory': False},
         ]
 
+        # Bound the rows read, or read large files in chunks instead of all at once
+        if max_rows is not None:
+            read_options = {'nrows': max_rows}
+        elif len(file_bytes) > CHUNKED_READ_BYTES:
+            read_options = {'chunksize': CSV_CHUNK_ROWS}
+        else:
+            read_options = {}
+
+        # Every attempt parses the bytes already in memory rather than re-reading the upload
+        buffer = io.BytesIO(file_bytes)
+
         for strategy in parsing_strategies:
             try:
-                # Reset file pointer
-                uploaded_file.seek(0)
+                # Reset buffer position
+                buffer.seek(0)
 
                 df = pd.read_csv(
-                    uploaded_file,
+                    buffer,
                     **strategy,
-                    on_bad_lines='skip',
-                    low_memory=False
+                    **read_options,
+                    on_bad_lines='skip'
                 )
 
-                # Validate DataFrame
-                if len(df.columns) > 1 and len(df) > 0:
-                    # Clean column names
-                    df.columns = [self._clean_column_name(col) for col in df.columns]
-                    return df
+                if 'chunksize' in read_options:
+                    with df as reader:
+                        df = pd.concat(reader, ignore_index=True)
+
+                if self._is_valid_frame(df):
+                    return self._finalize_frame(df)
 
             except Exception as e:
                 continue
 
         raise ValueError("Could not parse CSV file with any supported format")
 
-    def _clean_column_name(self, column_name: str) -> str:
-        """Clean and standardize column names."""
-        # Convert to string and strip whitespace
-        name = str(column_name).strip()
+    def _sniff_separator(self, file_bytes: bytes, encoding: str) -> Optional[str]:
+        """Guess the field separator from the start of the file, or None if it can't be told."""
+        try:
+            sample = file_bytes[:SNIFF_SAMPLE_BYTES].decode(encoding, errors='replace')
+            return csv.Sniffer().sniff(sample, delimiters=',;\t|').delimiter
+        except (csv.Error, LookupError):
+            return None
+
+    def _read_with_pyarrow(self, file_bytes: bytes, encoding: str, separator: str,
+                           max_rows: Optional[int] = None) -> pd.DataFrame:
+        """Parse with pyarrow's CSV reader, skipping malformed rows like the pandas path does."""
+        read_options = pa_csv.ReadOptions(encoding=encoding)
+        parse_options = pa_csv.ParseOptions(delimiter=separator, invalid_row_handler=lambda row: 'skip')
+        # Without this, empty and NA fields of text columns come back as '' and 'NA' rather than nulls
+        convert_options = pa_csv.ConvertOptions(null_values=list(_NA_VALUES), strings_can_be_null=True)
+
+        if max_rows is None:
+            table = pa_csv.read_csv(io.BytesIO(file_bytes), read_options=read_options,
+                                    parse_options=parse_options, convert_options=convert_options)
+        else:
+            # Stream record batches and stop as soon as enough rows are read
+            batches = []
+            row_count = 0
+            reader = pa_csv.open_csv(io.BytesIO(file_bytes), read_options=read_options,
+                                     parse_options=parse_options, convert_options=convert_options)
+            for batch in reader:
+                batches.append(batch)
+                row_count += batch.num_rows
+                if row_count >= max_rows:
+                    break
+            table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, max_rows)
 
-        # Remove quotes
-        name = name.strip('"\'')
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
 
-        # Replace spaces and special characters with underscores
-        name = re.sub(r'[^\w\s]', '_', name)
-        name = re.sub(r'\s+', '_', name)
+    def _is_valid_frame(self, df: pd.DataFrame) -> bool:
+        """Check that a parse produced more than one column and at least one row.
 
-        # Remove multiple underscores
-        name = re.sub(r'_+', '_', name)
+        pyarrow reads text that is not valid in the chosen encoding as binary columns; such a
+        frame is rejected so the remaining encodings get a try.
+        """
+        if any(isinstance(dtype, pd.ArrowDtype)
+               and (pa.types.is_binary(dtype.pyarrow_dtype) or pa.types.is_large_binary(dtype.pyarrow_dtype))
+               for dtype in df.dtypes):
+            return False
+        return len(df.columns) > 1 and len(df) > 0
 
-        # Remove leading/trailing underscores
-        name = name.strip('_')
+    def _finalize_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean column names and shrink dtypes of a successfully parsed frame."""
+        df.columns = [self._clean_column_name(col) for col in df.columns]
+        return self._downcast_dtypes(df)
 
-        # Ensure name is not empty
-        if not name:
-            name = 'unnamed_column'
+    def _downcast_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Shrink integer columns and store low-cardinality text as categories."""
+        row_count = len(df)
 
-        return name
+        for column in df.columns:
+            series = df[column]
+
+            if isinstance(series.dtype, np.dtype) and pd.api.types.is_integer_dtype(series.dtype):
+                df[column] = pd.to_numeric(series, downcast='integer')
+            elif series.dtype == object and series.nunique() / row_count < 0.5:
+                df[column] = series.astype('category')
+
+        return df
+
+    def _clean_column_name(self, column_name: str) -> str:
+        """Clean and standardize column names."""
+        # Replace each run of spaces, quotes, special characters (including a stray BOM) and
+        # underscores with a single underscore, then remove leading/trailing underscores.
+        # Surrounding whitespace and quotes become one of those runs, so need no separate strip.
+        name = self._re_name_separators.sub('_', str(column_name)).strip('_')
+
+        # Ensure name is not empty
+        return name or 'unnamed_column'
 
     def infer_schema(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """Infer schema from DataFrame."""
-        schema = []
-
-        for column in df.columns:
-            column_info = self._analyze_column(df, column)
-            schema.append(column_info)
+        null_counts, unique_counts = self._column_counts(df)
+
+        # Columns are analyzed independently on a thread pool; the heavy lifting happens in
+        # numpy/pyarrow kernels that release the GIL. Columns are pulled out of the frame up
+        # front so worker threads never index the shared DataFrame.
+        columns = [
+            (df[column], column, null_counts[column], unique_counts[column])
+            for column in df.columns
+        ]
+        with ThreadPoolExecutor(max_workers=max(1, min(SCHEMA_WORKERS, len(columns)))) as executor:
+            return list(executor.map(lambda args: self._analyze_column(*args), columns))
+
+    def _column_counts(self, df: pd.DataFrame) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Return null and unique counts per column.
+
+        Arrow-backed columns (from the pyarrow reader) carry their null count in the array
+        metadata and count distinct values in a C++ kernel; other columns are counted in one
+        whole-frame pass each.
+        """
+        arrow_columns = [column for column, dtype in df.dtypes.items() if isinstance(dtype, pd.ArrowDtype)]
+
+        other_columns = df.drop(columns=arrow_columns)
+        null_counts = other_columns.isna().sum().to_dict()
+        unique_counts = other_columns.nunique().to_dict()
+
+        for column in arrow_columns:
+            values = pa.array(df[column].array)
+            null_counts[column] = values.null_count
+            # Columns that are empty throughout come back as Arrow's null type, which has no
+            # count_distinct kernel
+            if pa.types.is_null(values.type):
+                unique_counts[column] = 0
+            else:
+                unique_counts[column] = pc.count_distinct(values, mode='only_valid').as_py()
 
-        return schema
+        return null_counts, unique_counts
 
-    def _analyze_column(self, df: pd.DataFrame, column: str) -> Dict[str, Any]:
+    def _analyze_column(self, series: pd.Series, column: str, null_count: int, unique_count: int) -> Dict[str, Any]:
         """Analyze individual column and return metadata."""
-        series = df[column]
-
         # Basic statistics
         total_count = len(series)
-        null_count = series.isnull().sum()
-        unique_count = series.nunique()
 
         # Get non-null values for type inference
         non_null_values = series.dropna()
@@ -124,7 +310,7 @@ class CSVProcessor:
         inferred_type = self._infer_data_type(non_null_values)
 
         # Get sample values (first 5 unique non-null values)
-        sample_values = [str(val) for val in non_null_values.unique()[:5]]
+        sample_values = self._sample_values(non_null_values, 5)
 
         # Additional analysis based on type
         analysis = {
@@ -139,7 +325,7 @@ class CSVProcessor:
 
         # Type-specific analysis
         if inferred_type in ['integer', 'float']:
-            analysis.update(self._analyze_numeric_column(non_null_values))
+            analysis.update(self._analyze_numeric_column(non_null_values, inferred_type))
         elif inferred_type == 'string':
             analysis.update(self._analyze_string_column(non_null_values))
         elif inferred_type == 'date':
@@ -151,13 +337,78 @@ class CSVProcessor:
 
         return analysis
 
+    def _sample_values(self, series: pd.Series, count: int) -> List[str]:
+        """Return the first ``count`` distinct values as strings, scanning no further than needed."""
+        # Most columns show enough distinct values early on; walk the head and stop at ``count``
+        seen = set()
+        samples = []
+        for value in series.iloc[:SAMPLE_SCAN_ROWS]:
+            if value not in seen:
+                seen.add(value)
+                samples.append(str(value))
+                if len(samples) == count:
+                    return samples
+
+        # Low-cardinality columns may need the rest of the column: let pandas find the distinct values
+        if len(series) > SAMPLE_SCAN_ROWS:
+            return [str(value) for value in series.unique()[:count]]
+        return samples
+
     def _infer_data_type(self, series: pd.Series) -> str:
         """Infer data type from series values."""
         if len(series) == 0:
             return 'string'
 
-        # Convert to string for pattern matching
-        str_series = series.astype(str)
+        # Columns the reader already typed need no pattern matching
+        dtype = series.dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            return 'boolean'
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return 'date'
+        if pd.api.types.is_float_dtype(dtype):
+            # Whole-number floats are integer columns that pandas widened to hold missing values,
+            # unless the name marks a decimal quantity or a single repeated value says too little
+            # (a constant rate of 1.0)
+            if self._has_decimal_name(series.name):
+                return 'float'
+            # Arrow doubles have no modulo kernel, so test the values as a NumPy array
+            values = series.to_numpy(dtype='float64', na_value=np.nan)
+            if (values % 1 == 0).all() and len(np.unique(values)) > 1:
+                return 'integer'
+            return 'float'
+        if pd.api.types.is_integer_dtype(dtype):
+            # Integer columns holding only 0/1 are still flags
+            values = series.unique()
+            if len(values) <= 2 and self._is_boolean_column(pd.Series(values).astype(str)):
+                return 'boolean'
+            return 'integer'
+
+        # Columns with identical contents, common in generated files, are pattern-matched once
+        try:
+            signature = self._column_signature(series)
+        except TypeError:
+            # Values pandas can't hash (e.g. lists from JSON) are matched without caching
+            return self._infer_text_type(series)
+
+        if signature not in self._inferred_types:
+            self._inferred_types[signature] = self._infer_text_type(series)
+        return self._inferred_types[signature]
+
+    def _has_decimal_name(self, column_name: Any) -> bool:
+        """Check whether a column name contains a token of a rate, amount or other decimal quantity."""
+        tokens = self._re_name_separators.split(str(column_name).lower())
+        return not _DECIMAL_NAME_TOKENS.isdisjoint(tokens)
+
+    def _column_signature(self, series: pd.Series) -> Tuple[str, int, bytes]:
+        """Identify a column by its dtype, length and a digest of its values."""
+        value_hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        return str(series.dtype), len(series), hashlib.blake2b(value_hashes.tobytes(), digest_size=16).digest()
+
+    def _infer_text_type(self, series: pd.Series) -> str:
+        """Infer data type of an untyped column by matching its values as strings."""
+        # Arrow's match takes pattern strings, not compiled regexes, hence the .pattern in
+        # _is_date_column
+        str_series = self._as_arrow_strings(series)
 
         # Check for boolean patterns
         if self._is_boolean_column(str_series):
@@ -166,73 +417,97 @@ class CSVProcessor:
         if self._is_date_column(str_series):
             return 'date'
 
-        # Check for numeric patterns
-        numeric_pattern = r'^-?\d+\.?\d*$'
-        numeric_matches = str_series.str.match(numeric_pattern).sum()
+        # Check for numeric values
+        coerced = pd.to_numeric(str_series, errors='coerce')
 
-        if numeric_matches == len(str_series):
-            # Check if all values are integers
-            if str_series.str.contains('\.').sum() == 0:
-                return 'integer'
-            else:
-                return 'float'
+        if coerced.notna().all():
+            # Check if all values are whole numbers
+            return 'integer' if (coerced % 1 == 0).all() else 'float'
 
         # Default to string
         return 'string'
 
     def _is_boolean_column(self, str_series: pd.Series) -> bool:
         """Check if column contains boolean-like values."""
-        boolean_values = {
-            'true', 'false', 'yes', 'no', 'y', 'n',
-            '1', '0', 'on', 'off', 'enabled', 'disabled'
-        }
-
-        unique_values = set(str_series.str.lower().unique())
-        return len(unique_values) <= 2 and unique_values.issubset(boolean_values)
+        # Lowercase distinct values only, stopping at the first that can't be a boolean
+        lowered_values = set()
+        for value in str_series.unique():
+            lowered = value.lower()
+            if lowered not in _BOOLEAN_VALUES:
+                return False
+            lowered_values.add(lowered)
+            if len(lowered_values) > 2:
+                return False
+
+        return True
 
     def _is_date_column(self, str_series: pd.Series) -> bool:
         """Check if column contains date-like values."""
-        match_count = 0
+        return str_series.str.match(self._date_regex.pattern).mean() > 0.7
 
-        for val in str_series:
-            for pattern in self.date_patterns:
-                if re.match(pattern, val):
-                    match_count += 1
-                    break
-
-        return match_count / len(str_series) > 0.7
-
-    def _analyze_numeric_column(self, series: pd.Series) -> Dict[str, Any]:
+    def _analyze_numeric_column(self, series: pd.Series, inferred_type: str = 'float') -> Dict[str, Any]:
         """Analyze numeric column."""
         numeric_series = pd.to_numeric(series, errors='coerce').dropna()
 
         if numeric_series.empty:
             return {}
 
+        # One aggregation call instead of five separate reductions
+        stats = numeric_series.agg(['min', 'max', 'mean', 'median', 'std'])
+        # Arrow-backed columns report an undefined statistic (the std of one value) as NA, which
+        # round() rejects; bring the stats to NumPy floats with NaN as the NumPy path gives
+        stats = pd.Series(stats.to_numpy(dtype='float64', na_value=np.nan), index=stats.index)
+        min_value, max_value = stats['min'], stats['max']
+
+        # The combined result is float; keep the bounds of integer columns (including whole-number
+        # float columns typed as integer) integral
+        if inferred_type == 'integer':
+            min_value, max_value = int(min_value), int(max_value)
+
         return {
-            'min_value': numeric_series.min(),
-            'max_value': numeric_series.max(),
-            'mean_value': round(numeric_series.mean(), 2),
-            'median_value': numeric_series.median(),
-            'std_dev': round(numeric_series.std(), 2),
+            'min_value': min_value,
+            'max_value': max_value,
+            'mean_value': round(stats['mean'], 2),
+            'median_value': stats['median'],
+            'std_dev': round(stats['std'], 2),
         }
 
+    def _as_arrow_strings(self, series: pd.Series) -> pd.Series:
+        """Convert values to Arrow-backed strings so .str methods run in Arrow's C++ kernels
+        rather than over Python objects, falling back to plain str conversion."""
+        try:
+            return series.astype('string[pyarrow]')
+        except (ImportError, TypeError, ValueError):
+            return series.astype(str)
+
     def _analyze_string_column(self, series: pd.Series) -> Dict[str, Any]:
         """Analyze string column."""
-        str_lengths = series.astype(str).str.len()
+        if series.empty:
+            # Arrow's length kernels report NA rather than NaN for a column with no values
+            return {'min_length': np.nan, 'max_length': np.nan, 'avg_length': np.nan, 'most_common': None}
+
+        length_stats = self._as_arrow_strings(series).str.len().agg(['min', 'max', 'mean'])
+
+        # One hashing pass without sorting the counts; mode() would build and sort the tied values
+        value_counts = series.value_counts(sort=False)
 
         return {
-            'min_length': str_lengths.min(),
-            'max_length': str_lengths.max(),
-            'avg_length': round(str_lengths.mean(), 2),
-            'most_common': series.mode().iloc[0] if len(series.mode()) > 0 else None,
+            # agg() returns the three stats as one float series; lengths are whole numbers
+            'min_length': int(length_stats['min']),
+            'max_length': int(length_stats['max']),
+            'avg_length': round(length_stats['mean'], 2),
+            'most_common': value_counts.idxmax() if len(value_counts) > 0 else None,
         }
 
     def _analyze_date_column(self, series: pd.Series) -> Dict[str, Any]:
         """Analyze date column."""
         try:
-            # Try to parse dates
-            date_series = pd.to_datetime(series, errors='coerce', infer_datetime_format=True)
+            # Parse with the format of the pattern the values follow, which takes pandas' fast
+            # path instead of guessing the format; exact=False tolerates a trailing time part
+            date_format = self._detect_date_format(series)
+            date_series = pd.to_datetime(
+                series, format=date_format, exact=False, errors='coerce', cache=True
+            )
             date_series = date_series.dropna()
 
             if len(date_series) > 0:
@@ -246,12 +521,26 @@ class CSVProcessor:
 
         return {}
 
+    def _detect_date_format(self, series: pd.Series) -> Optional[str]:
+        """Return the strftime format of the date pattern the first value follows, if any."""
+        if pd.api.types.is_datetime64_any_dtype(series.dtype) or len(series) == 0:
+            return None
+
+        first_value = str(series.iloc[0])
+        for pattern, date_format in self._date_pattern_formats:
+            if pattern.match(first_value):
+                return date_format
+        return None
+
     def _analyze_boolean_column(self, series: pd.Series) -> Dict[str, Any]:
         """Analyze boolean column."""
         value_counts = series.value_counts()
 
+        # Classify the few distinct values rather than every row, in any letter case
+        lowered_values = value_counts.index.astype(str).str.lower()
+
         return {
-            'true_count': value_counts.get('true', 0) + value_counts.get('1', 0) + value_counts.get('yes', 0),
-            'false_count': value_counts.get('false', 0) + value_counts.get('0', 0) + value_counts.get('no', 0),
+            'true_count': value_counts[lowered_values.isin(_TRUE_VALUES)].sum(),
+            'false_count': value_counts[lowered_values.isin(_FALSE_VALUES)].sum(),
             'unique_values': value_counts.index.tolist(),
         }
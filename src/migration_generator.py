@@ -1,8 +1,200 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Optional, Union
 import pandas as pd
+from collections import defaultdict
 from datetime import datetime
+from pathlib import Path
+import hashlib
+import json
+import textwrap
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+_NUMERIC_TYPES = frozenset({'integer', 'float'})
+
+# (keyword, SQL template, numeric columns only), checked in order; the first match wins
+_TRANSFORMATION_TEMPLATES = (
+    ('uppercase', "UPPER({})", False),
+    ('lowercase', "LOWER({})", False),
+    ('trim', "TRIM({})", False),
+    ('standardize phone', "REGEXP_REPLACE({}, '[^0-9]', '')", False),
+    ('format currency', "ROUND({}, 2)", False),
+    ('null to zero', "COALESCE({}, 0)", True),
+    ('extract date', "DATE({})", False),
+)
+
+# Generic data types mapped to each target platform's column types
+_SNOWFLAKE_TYPES = {
+    'string': 'VARCHAR(255)',
+    'integer': 'NUMBER(38,0)',
+    'float': 'NUMBER(38,2)',
+    'boolean': 'BOOLEAN',
+    'date': 'DATE',
+    'datetime': 'TIMESTAMP_NTZ',
+    'timestamp': 'TIMESTAMP_NTZ'
+}
+
+_BIGQUERY_TYPES = {
+    'string': 'STRING',
+    'integer': 'INT64',
+    'float': 'FLOAT64',
+    'boolean': 'BOOL',
+    'date': 'DATE',
+    'datetime': 'DATETIME',
+    'timestamp': 'TIMESTAMP'
+}
+
+_GENERIC_TYPES = {
+    'string': 'VARCHAR(255)',
+    'integer': 'INTEGER',
+    'float': 'DECIMAL(10,2)',
+    'boolean': 'BOOLEAN',
+    'date': 'DATE',
+    'datetime': 'TIMESTAMP',
+    'timestamp': 'TIMESTAMP'
+}
+
+# Opening blocks of the generated assets, filled in once per generator from the project's
+# header fields (see MigrationGenerator.__init__)
+_DBT_MODEL_HEADER = """/*
+ * dbt Model: {table_name_lower}
+ * Generated: {generated_at}
+ * Source: {source}
+ * Target: {target}
+ * Industry: {industry}
+ */
+
+{{{{ config(
+    materialized='table',
+    tags=['{industry_lower}', 'migration', 'enhanced'],
+    description='Enhanced {table_name_lower} with business-friendly column names and transformations'
+) }}}}
+
+WITH source_data AS (
+    SELECT *
+    FROM {{{{ source('raw_data', 'raw_{table_name_lower}') }}}}
+),
+
+enhanced_data AS (
+    SELECT
+"""
+
+_QUALITY_TESTS_HEADER = """/*
+ * Data Quality Tests for {table_name_lower}
+ * Generated: {generated_at}
+ * Industry: {industry}
+ */
+
+-- ========================================
+-- COMPLETENESS TESTS
+-- ========================================
+
+"""
+
+_DOCUMENTATION_HEADER = """# {table_name} - Business Data Dictionary
+
+**Generated:** {generated_at}  
+**Industry:** {industry}  
+**Source System:** {source}  
+**Target Platform:** {target}  
+
+## Overview
+
+This document provides business-friendly documentation for the {table_name} dataset as part of the data migration from {source} to {target}.
+
+## Business Context
+
+This dataset contains {industry} data that supports critical business operations including:
+
+"""
+
+_SNOWFLAKE_DDL_HEADER = """-- Snowflake DDL for {table_name_upper}
+-- Generated: {generated_at}
+
+CREATE OR REPLACE TABLE {table_name_upper} (
+"""
+
+_BIGQUERY_DDL_HEADER = """-- BigQuery DDL for {table_name_lower}
+-- Generated: {generated_at}
+
+CREATE OR REPLACE TABLE `project.dataset.{table_name_lower}` (
+"""
+
+_GENERIC_DDL_HEADER = """-- Generic DDL for {table_name}
+-- Generated: {generated_at}
+-- Target Platform: {target}
+
+CREATE TABLE {table_name} (
+"""
+
+_LINEAGE_HEADER = """# Data Lineage Documentation
+
+## Source to Target Mapping
+
+**Migration Project:** {table_name}  
+**Source:** {source}  
+**Target:** {target}  
+**Generated:** {generated_at}
+
+## Field Mappings
+
+| Source Field | Target Field | Transformation | Business Rationale |
+|--------------|--------------|----------------|-------------------|
+"""
+
+_HEADER_TEMPLATES = {
+    'dbt_model': _DBT_MODEL_HEADER,
+    'quality_tests': _QUALITY_TESTS_HEADER,
+    'documentation': _DOCUMENTATION_HEADER,
+    'snowflake_ddl': _SNOWFLAKE_DDL_HEADER,
+    'bigquery_ddl': _BIGQUERY_DDL_HEADER,
+    'generic_ddl': _GENERIC_DDL_HEADER,
+    'lineage': _LINEAGE_HEADER,
+}
+
+# Data quality test queries, filled in with the column (name) and dbt model (table)
+_NON_NEGATIVE_TEST_TMPL = """SELECT '{name}_non_negative_check' AS test_name,
+       COUNT(*) AS total_records,
+       SUM(CASE WHEN {name} < 0 THEN 1 ELSE 0 END) AS negative_values,
+       CASE WHEN SUM(CASE WHEN {name} < 0 THEN 1 ELSE 0 END) = 0 
+            THEN 'PASS' ELSE 'FAIL' END AS test_result
+FROM {{{{ ref('{table}') }}}}
+WHERE {name} IS NOT NULL;
+
+"""
+
+_EMAIL_FORMAT_TEST_TMPL = """SELECT '{name}_email_format_check' AS test_name,
+       COUNT(*) AS total_records,
+       SUM(CASE WHEN NOT regexp_like({name}, '^[^@]+@[^@]+\\.[^@]+$') THEN 1 ELSE 0 END) AS invalid_emails,
+       CASE WHEN SUM(CASE WHEN NOT regexp_like({name}, '^[^@]+@[^@]+\\.[^@]+$') THEN 1 ELSE 0 END) = 0 
+            THEN 'PASS' ELSE 'FAIL' END AS test_result
+FROM {{{{ ref('{table}') }}}}
+WHERE {name} IS NOT NULL;
+
+"""
+
+# dbt_utils.expression_is_true expressions for schema.yml column tests
+_EMAIL_EXPRESSION_TMPL = "regexp_like({name}, '^[^@]+@[^@]+\\\\.[^@]+$')"
+_NON_NEGATIVE_EXPRESSION_TMPL = "{name} >= 0"
+
+# Per generated asset, the method yielding its text and the file it is written to
+_ASSET_FILES = {
+    'dbt_model': ('_iter_dbt_model', '{name}_model.sql'),
+    'schema_yml': ('_iter_schema_yml', 'schema.yml'),
+    'quality_tests': ('_iter_quality_tests', 'quality_tests.sql'),
+    'documentation': ('_iter_business_documentation', 'business_glossary.md'),
+    'migration_script': ('_iter_migration_script', 'migration_script.sql'),
+    'lineage_documentation': ('_iter_lineage_docs', 'data_lineage.md'),
+}
+
+# DDL generator method per target platform; any other platform gets generic DDL
+_PLATFORM_DDL_GENERATORS = {
+    'Snowflake': '_iter_snowflake_ddl',
+    'BigQuery': '_iter_bigquery_ddl',
+}
 
 class MigrationGenerator:
     """Generates migration artifacts and documentation."""
@@ -13,6 +205,33 @@ class MigrationGenerator:
         self.source_system = project_context.get('source', 'Legacy System')
         self.industry = project_context.get('industry', 'General')
 
+        # Values every generator stamps into its output, derived once per generator
+        generated = datetime.now()
+        self._generated_at = generated.strftime('%Y-%m-%d %H:%M:%S')
+        self._generated_iso = generated.isoformat()
+        self._table_name = project_context.get('name', 'migration_table')
+        self._table_name_lower = self._table_name.lower()
+        self._table_name_upper = self._table_name.upper()
+        self._industry_lower = self.industry.lower()
+
+        header_fields = {
+            'generated_at': self._generated_at,
+            'source': self.source_system,
+            'target': self.target_platform,
+            'industry': self.industry,
+            'industry_lower': self._industry_lower,
+            'table_name': self._table_name,
+            'table_name_lower': self._table_name_lower,
+            'table_name_upper': self._table_name_upper,
+        }
+        self._headers = {name: template.format_map(header_fields) for name, template in _HEADER_TEMPLATES.items()}
+
+        # schema.yml's model envelope depends only on the project, so it is rendered once
+        self._schema_yml_header = self._render_schema_yml_header()
+
+        # Assets already generated by this generator, keyed by schema fingerprint
+        self._asset_cache: Dict[str, Dict[str, str]] = {}
+
     def _safe_get_criticality(self, column: Dict[str, Any]) -> str:
         """Safely get business criticality with fallback."""
         criticality = column.get('business_criticality')
@@ -20,69 +239,161 @@ class MigrationGenerator:
 
     def _safe_startswith(self, value: Any, prefix: str) -> bool:
         """Safely check if value starts with prefix."""
+        if type(value) is str:
+            return value.startswith(prefix)
         return str(value or '').startswith(prefix)
 
+    def _safe_float(self, value: Any, default: float) -> float:
+        """Convert a value, numpy scalars included, to a native float with fallback."""
+        if type(value) is float:
+            return value
+        try:
+            item = getattr(value, 'item', None)  # numpy scalar
+            return float(item() if item is not None else value)
+        except (ValueError, TypeError):
+            return default
+
+    def _render_schema_yml_header(self) -> str:
+        """Render schema.yml up to the model's columns key."""
+        envelope = {
+            'version': 2,
+            'models': [{
+                'name': self._table_name_lower,
+                'description': f'Enhanced {self.industry} data migrated from {self.source_system}',
+                'meta': {
+                    'industry': self.industry,
+                    'source_system': self.source_system,
+                    'migration_date': self._generated_iso,
+                    'data_steward': f'{self.industry} Data Team'
+                }
+            }]
+        }
+        return yaml.dump(envelope, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+
+    def _schema_fingerprint(self, enhanced_schema: List[Dict[str, Any]]) -> str:
+        """Key a schema on its full contents, so any edit to a column yields a new key."""
+        payload = json.dumps(enhanced_schema, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode()).hexdigest()
+
+    def _prepare_views(self, enhanced_schema: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Partition the schema once into the column subsets the generators work from.
+
+        Every view holds the column dicts themselves, in schema order, and excludes the AI's
+        overall-assessment entry. 'compliance' is the set of compliance implications across them,
+        and 'counts' holds the tallies behind the summary and readiness metrics.
+        """
+        views = {'active': [], 'critical': [], 'pii': [], 'business_keys': [], 'transformed': [],
+                 'compliance': set()}
+        counts = views['counts'] = {
+            'enhanced': 0, 'high_quality': 0, 'documented': 0, 'quality_total': 0,
+            # Tallied over every entry, the overall assessment included
+            'high_complexity': 0, 'low_quality': 0, 'undocumented': 0,
+        }
+
+        for col in enhanced_schema:
+            quality_score = col.get('data_quality_score', 0)
+            documented = bool(col.get('business_description'))
+            if col.get('migration_complexity') == 'High':
+                counts['high_complexity'] += 1
+            if quality_score < 0.7:
+                counts['low_quality'] += 1
+            if not documented:
+                counts['undocumented'] += 1
+
+            if col.get('is_overall_assessment'):
+                continue
+
+            views['active'].append(col)
+            counts['quality_total'] += quality_score
+            if quality_score > 0.8:
+                counts['high_quality'] += 1
+            if documented:
+                counts['documented'] += 1
+            if col.get('enhanced'):
+                counts['enhanced'] += 1
+            if self._safe_startswith(col.get('business_criticality'), 'High'):
+                views['critical'].append(col)
+            if col.get('potential_pii'):
+                views['pii'].append(col)
+            if col.get('potential_business_key'):
+                views['business_keys'].append(col)
+            if col.get('transformation_suggestions'):
+                views['transformed'].append(col)
+            views['compliance'].update(col.get('compliance_implications') or ())
+
+        return views
+
     def generate_all_assets(self, enhanced_schema: List[Dict[str, Any]],
                             source_data: pd.DataFrame = None) -> Dict[str, str]:
         """Generate comprehensive migration assets."""
 
+        fingerprint = self._schema_fingerprint(enhanced_schema)
+        cached = self._asset_cache.get(fingerprint)
+        if cached is not None:
+            return dict(cached)
+
+        # Partition the schema once and share the views across all generators
+        views = self._prepare_views(enhanced_schema)
+
         assets = {}
 
         # Generate dbt model
-        assets['dbt_model'] = self.generate_dbt_model(enhanced_schema)
+        assets['dbt_model'] = self.generate_dbt_model(enhanced_schema, views)
 
         # Generate schema YAML
-        assets['schema_yml'] = self.generate_schema_yml(enhanced_schema)
+        assets['schema_yml'] = self.generate_schema_yml(enhanced_schema, views)
 
         # Generate data quality tests
-        assets['quality_tests'] = self.generate_quality_tests(enhanced_schema)
+        assets['quality_tests'] = self.generate_quality_tests(enhanced_schema, views)
 
         # Generate business documentation
-        assets['documentation'] = self.generate_business_documentation(enhanced_schema)
+        assets['documentation'] = self.generate_business_documentation(enhanced_schema, views)
 
         # Generate migration script
-        assets['migration_script'] = self.generate_migration_script(enhanced_schema)
+        assets['migration_script'] = self.generate_migration_script(enhanced_schema, views)
 
         # Generate data lineage
-        assets['lineage_documentation'] = self.generate_lineage_docs(enhanced_schema)
+        assets['lineage_documentation'] = self.generate_lineage_docs(enhanced_schema, views)
 
-        return assets
+        self._asset_cache[fingerprint] = assets
+        return dict(assets)
 
-    def generate_dbt_model(self, enhanced_schema: List[Dict[str, Any]]) -> str:
-        """Generate dbt SQL model with transformations."""
+    def write_all_assets(self, enhanced_schema: List[Dict[str, Any]],
+                         output_dir: Union[str, Path]) -> Dict[str, Path]:
+        """Write every migration asset to output_dir, streaming each file as it is generated.
 
-        table_name = self.project_context.get('name', 'migration_table').lower()
-        source_table = f"raw_{table_name}"
+        Each file is written piece by piece rather than first built as one string, so exporting a
+        wide schema does not hold every asset in memory at once.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-        sql = f"""/*
- * dbt Model: {table_name}
- * Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
- * Source: {self.source_system}
- * Target: {self.target_platform}
- * Industry: {self.industry}
- */
+        views = self._prepare_views(enhanced_schema)
 
-{{{{ config(
-    materialized='table',
-    tags=['{self.industry.lower()}', 'migration', 'enhanced'],
-    description='Enhanced {table_name} with business-friendly column names and transformations'
-) }}}}
+        paths = {}
+        for asset, (method, file_name) in _ASSET_FILES.items():
+            path = output_dir / file_name.format(name=self._table_name)
+            with open(path, 'w', encoding='utf-8') as handle:
+                handle.writelines(getattr(self, method)(enhanced_schema, views))
+            paths[asset] = path
 
-WITH source_data AS (
-    SELECT *
-    FROM {{{{ source('raw_data', '{source_table}') }}}}
-),
+        return paths
 
-enhanced_data AS (
-    SELECT
-"""
+    def generate_dbt_model(self, enhanced_schema: List[Dict[str, Any]],
+                           views: Optional[Dict[str, Any]] = None) -> str:
+        """Generate dbt SQL model with transformations."""
+        return "".join(self._iter_dbt_model(enhanced_schema, views))
+
+    def _iter_dbt_model(self, enhanced_schema: List[Dict[str, Any]],
+                        views: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield the dbt SQL model in pieces."""
+        views = views or self._prepare_views(enhanced_schema)
+
+        yield self._headers['dbt_model']
 
         # Generate column transformations
         column_lines = []
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
-
+        for col in views['active']:
             original_name = col['column_name']
             suggested_name = col.get('suggested_name', original_name)
             transformations = col.get('transformation_suggestions', [])
@@ -103,26 +414,21 @@ enhanced_data AS (
             if col.get('business_description'):
                 column_lines[-1] += f"  -- {col['business_description'][:50]}..."
 
-        sql += ",\n".join(column_lines)
+        yield ",\n".join(column_lines)
 
         # Add data quality enhancements
-        sql += f"""
+        yield """
     FROM source_data
     WHERE 1=1
         -- Add data quality filters
 """
 
         # Add quality filters based on analysis
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
+        for col in views['critical']:
+            if col.get('completeness_pct', 100) < 95:
+                yield f"        AND {col['column_name']} IS NOT NULL  -- Critical field validation\n"
 
-            completeness = col.get('completeness_pct', 100)
-            business_criticality = col.get('business_criticality', '') or ''
-            if completeness < 95 and business_criticality.startswith('High'):
-                sql += f"        AND {col['column_name']} IS NOT NULL  -- Critical field validation\n"
-
-        sql += """
+        yield """
 ),
 
 final AS (
@@ -134,33 +440,20 @@ final AS (
 
 SELECT * FROM final"""
 
-        return sql
-
-    def generate_schema_yml(self, enhanced_schema: List[Dict[str, Any]]) -> str:
+    def generate_schema_yml(self, enhanced_schema: List[Dict[str, Any]],
+                            views: Optional[Dict[str, Any]] = None) -> str:
         """Generate comprehensive dbt schema.yml."""
+        return "".join(self._iter_schema_yml(enhanced_schema, views))
 
-        table_name = self.project_context.get('name', 'migration_table').lower()
+    def _iter_schema_yml(self, enhanced_schema: List[Dict[str, Any]],
+                         views: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield schema.yml in pieces."""
+        views = views or self._prepare_views(enhanced_schema)
 
-        schema_dict = {
-            'version': 2,
-            'models': [{
-                'name': table_name,
-                'description': f'Enhanced {self.industry} data migrated from {self.source_system}',
-                'meta': {
-                    'industry': self.industry,
-                    'source_system': self.source_system,
-                    'migration_date': datetime.now().isoformat(),
-                    'data_steward': f'{self.industry} Data Team'
-                },
-                'columns': []
-            }]
-        }
+        columns = []
 
         # Add column definitions
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
-
+        for col in views['active']:
             # Safely extract values and convert to native Python types
             suggested_name = col.get('suggested_name', col['column_name'])
             description = col.get('business_description', 'No description available')
@@ -173,14 +466,7 @@ SELECT * FROM final"""
                 business_criticality = 'Medium'
 
             # Safe conversion of data quality score
-            data_quality_score = col.get('data_quality_score', 0.5)
-            try:
-                if hasattr(data_quality_score, 'item'):  # numpy scalar
-                    data_quality_score = float(data_quality_score.item())
-                else:
-                    data_quality_score = float(data_quality_score)
-            except (ValueError, TypeError):
-                data_quality_score = 0.5
+            data_quality_score = self._safe_float(col.get('data_quality_score', 0.5), 0.5)
 
             column_def = {
                 'name': suggested_name,
@@ -210,16 +496,17 @@ SELECT * FROM final"""
             quality_rules = col.get('data_quality_rules', [])
             for rule in quality_rules:
                 if isinstance(rule, str):  # Ensure rule is a string
-                    if 'email' in rule.lower():
+                    rule_lower = rule.lower()
+                    if 'email' in rule_lower:
                         tests.append({
                             'dbt_utils.expression_is_true': {
-                                'expression': f"regexp_like({suggested_name}, '^[^@]+@[^@]+\\\\.[^@]+$')"
+                                'expression': _EMAIL_EXPRESSION_TMPL.format(name=suggested_name)
                             }
                         })
-                    elif 'positive' in rule.lower():
+                    elif 'positive' in rule_lower:
                         tests.append({
                             'dbt_utils.expression_is_true': {
-                                'expression': f"{suggested_name} >= 0"
+                                'expression': _NON_NEGATIVE_EXPRESSION_TMPL.format(name=suggested_name)
                             }
                         })
 
@@ -230,157 +517,136 @@ SELECT * FROM final"""
             if col.get('potential_pii'):
                 column_def['tags'] = ['pii', 'sensitive']
 
-            schema_dict['models'][0]['columns'].append(column_def)
+            columns.append(column_def)
 
-        return yaml.dump(schema_dict, default_flow_style=False, sort_keys=False)
+        yield self._schema_yml_header
+        if not columns:
+            yield "  columns: []\n"
+            return
 
-    def generate_quality_tests(self, enhanced_schema: List[Dict[str, Any]]) -> str:
-        """Generate comprehensive data quality tests."""
+        # The column list sits two spaces in, so it is dumped two columns narrower to wrap long
+        # values exactly where a dump of the whole document would
+        columns_yml = yaml.dump(columns, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False, width=78)
+        yield "  columns:\n"
+        yield textwrap.indent(columns_yml, '  ')
 
-        table_name = self.project_context.get('name', 'migration_table').lower()
+    def generate_quality_tests(self, enhanced_schema: List[Dict[str, Any]],
+                               views: Optional[Dict[str, Any]] = None) -> str:
+        """Generate comprehensive data quality tests."""
+        return "".join(self._iter_quality_tests(enhanced_schema, views))
 
-        sql = f"""/*
- * Data Quality Tests for {table_name}
- * Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
- * Industry: {self.industry}
- */
+    def _iter_quality_tests(self, enhanced_schema: List[Dict[str, Any]],
+                            views: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield the data quality tests in pieces."""
+        views = views or self._prepare_views(enhanced_schema)
 
--- ========================================
--- COMPLETENESS TESTS
--- ========================================
+        table_name = self._table_name_lower
 
-"""
+        yield self._headers['quality_tests']
 
         # Completeness tests
-        critical_columns = [col for col in enhanced_schema
-                            if self._safe_startswith(col.get('business_criticality'), 'High')]
+        critical_columns = views['critical']
 
         if critical_columns:
-            sql += f"-- Critical columns completeness check\n"
-            sql += f"SELECT 'Critical Columns Completeness' AS test_name,\n"
-            sql += f"       COUNT(*) AS total_records,\n"
+            yield "-- Critical columns completeness check\n"
+            yield "SELECT 'Critical Columns Completeness' AS test_name,\n"
+            yield "       COUNT(*) AS total_records,\n"
 
+            checks = []
             for col in critical_columns:
-                if col.get('is_overall_assessment'):
-                    continue
                 suggested_name = col.get('suggested_name', col['column_name'])
-                sql += f"       SUM(CASE WHEN {suggested_name} IS NULL THEN 1 ELSE 0 END) AS {suggested_name}_nulls,\n"
-                sql += f"       ROUND(100.0 * SUM(CASE WHEN {suggested_name} IS NOT NULL THEN 1 ELSE 0 END) / COUNT(*), 2) AS {suggested_name}_completeness_pct,\n"
+                checks.append(
+                    f"       SUM(CASE WHEN {suggested_name} IS NULL THEN 1 ELSE 0 END) AS {suggested_name}_nulls,\n"
+                    f"       ROUND(100.0 * SUM(CASE WHEN {suggested_name} IS NOT NULL THEN 1 ELSE 0 END) / COUNT(*), 2) AS {suggested_name}_completeness_pct"
+                )
 
-            sql = sql.rstrip(',\n') + f"\nFROM {{{{ ref('{table_name}') }}}}\n\n"
+            yield ",\n".join(checks)
+            yield f"\nFROM {{{{ ref('{table_name}') }}}}\n\n"
 
         # Business rule tests
-        sql += """-- ========================================
+        yield """-- ========================================
 -- BUSINESS RULE TESTS
 -- ========================================
 
 """
 
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
-
+        for col in views['active']:
             suggested_name = col.get('suggested_name', col['column_name'])
             business_rules = col.get('suggested_business_rules', [])
 
             if business_rules:
-                sql += f"-- {suggested_name} business rules\n"
+                yield f"-- {suggested_name} business rules\n"
 
                 for rule in business_rules:
-                    if 'non-negative' in rule.lower() and col['data_type'] in ['integer', 'float']:
-                        sql += f"""SELECT '{suggested_name}_non_negative_check' AS test_name,
-       COUNT(*) AS total_records,
-       SUM(CASE WHEN {suggested_name} < 0 THEN 1 ELSE 0 END) AS negative_values,
-       CASE WHEN SUM(CASE WHEN {suggested_name} < 0 THEN 1 ELSE 0 END) = 0 
-            THEN 'PASS' ELSE 'FAIL' END AS test_result
-FROM {{{{ ref('{table_name}') }}}}
-WHERE {suggested_name} IS NOT NULL;
-
-"""
-                    elif 'email' in rule.lower():
-                        sql += f"""SELECT '{suggested_name}_email_format_check' AS test_name,
-       COUNT(*) AS total_records,
-       SUM(CASE WHEN NOT regexp_like({suggested_name}, '^[^@]+@[^@]+\\.[^@]+$') THEN 1 ELSE 0 END) AS invalid_emails,
-       CASE WHEN SUM(CASE WHEN NOT regexp_like({suggested_name}, '^[^@]+@[^@]+\\.[^@]+$') THEN 1 ELSE 0 END) = 0 
-            THEN 'PASS' ELSE 'FAIL' END AS test_result
-FROM {{{{ ref('{table_name}') }}}}
-WHERE {suggested_name} IS NOT NULL;
-
-"""
+                    rule_lower = rule.lower()
+                    if 'non-negative' in rule_lower and col['data_type'] in _NUMERIC_TYPES:
+                        yield _NON_NEGATIVE_TEST_TMPL.format(name=suggested_name, table=table_name)
+                    elif 'email' in rule_lower:
+                        yield _EMAIL_FORMAT_TEST_TMPL.format(name=suggested_name, table=table_name)
 
         # Compliance tests
-        sql += """-- ========================================
+        yield """-- ========================================
 -- COMPLIANCE TESTS
 -- ========================================
 
 """
 
-        pii_columns = [col for col in enhanced_schema if col.get('potential_pii')]
+        pii_columns = views['pii']
         if pii_columns:
-            sql += "-- PII Data Audit\n"
-            sql += "SELECT 'PII_Data_Audit' AS test_name,\n"
-            sql += "       COUNT(*) AS total_records,\n"
+            yield "-- PII Data Audit\n"
+            yield "SELECT 'PII_Data_Audit' AS test_name,\n"
+            yield "       COUNT(*) AS total_records,\n"
 
+            audits = []
             for col in pii_columns:
-                if col.get('is_overall_assessment'):
-                    continue
                 suggested_name = col.get('suggested_name', col['column_name'])
-                sql += f"       COUNT(DISTINCT {suggested_name}) AS {suggested_name}_unique_values,\n"
-
-            sql = sql.rstrip(',\n') + f"\nFROM {{{{ ref('{table_name}') }}}};\n\n"
+                audits.append(f"       COUNT(DISTINCT {suggested_name}) AS {suggested_name}_unique_values")
 
-        return sql
+            yield ",\n".join(audits)
+            yield f"\nFROM {{{{ ref('{table_name}') }}}};\n\n"
 
-    def generate_business_documentation(self, enhanced_schema: List[Dict[str, Any]]) -> str:
+    def generate_business_documentation(self, enhanced_schema: List[Dict[str, Any]],
+                                        views: Optional[Dict[str, Any]] = None) -> str:
         """Generate comprehensive business documentation."""
+        return "".join(self._iter_business_documentation(enhanced_schema, views))
 
-        table_name = self.project_context.get('name', 'migration_table')
-
-        doc = f"""# {table_name} - Business Data Dictionary
-
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
-**Industry:** {self.industry}  
-**Source System:** {self.source_system}  
-**Target Platform:** {self.target_platform}  
-
-## Overview
-
-This document provides business-friendly documentation for the {table_name} dataset as part of the data migration from {self.source_system} to {self.target_platform}.
-
-## Business Context
+    def _iter_business_documentation(self, enhanced_schema: List[Dict[str, Any]],
+                                     views: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield the business documentation in pieces."""
+        views = views or self._prepare_views(enhanced_schema)
 
-This dataset contains {self.industry} data that supports critical business operations including:
+        yield self._headers['documentation']
 
-"""
-
-        # Add business context based on columns
+        # Add business context based on columns, grouping the glossary's columns by business domain
+        # in the same pass
         business_areas = set()
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
-            context = col.get('industry_context', '')
+        domains = defaultdict(list)
+        for col in views['active']:
+            context = col.get('industry_context')
             if context:
-                business_areas.add(context.split('.')[0] if '.' in context else context)
+                business_areas.add(context.partition('.')[0])
+            domain = context.partition(' ')[0] if context else 'General'
+            domain_columns = domains[domain]
+            if len(domain_columns) < 5:  # Limit to top 5 per domain
+                domain_columns.append(col)
 
         for area in sorted(business_areas):
-            doc += f"- {area}\n"
+            yield f"- {area}\n"
 
-        doc += f"""
+        yield f"""
 ## Data Quality Summary
 
 """
 
         # Add data quality summary
-        total_columns = len([col for col in enhanced_schema if not col.get('is_overall_assessment')])
-        high_quality = len([col for col in enhanced_schema
-                            if col.get('data_quality_score', 0) > 0.8 and not col.get('is_overall_assessment')])
-        pii_columns = len([col for col in enhanced_schema
-                           if col.get('potential_pii') and not col.get('is_overall_assessment')])
+        total_columns = len(views['active'])
+        high_quality = views['counts']['high_quality']
+        pii_columns = len(views['pii'])
 
-        doc += f"""- **Total Columns:** {total_columns}
+        yield f"""- **Total Columns:** {total_columns}
 - **High Quality Columns:** {high_quality} ({round(100 * high_quality / total_columns, 1)}%)
 - **PII Fields:** {pii_columns}
-- **Business Critical Fields:** {len([col for col in enhanced_schema if self._safe_startswith(col.get('business_criticality'), 'High')])}
+- **Business Critical Fields:** {len(views['critical'])}
 
 ## Column Reference
 
@@ -388,10 +654,7 @@ This dataset contains {self.industry} data that supports critical business opera
 |-------------|---------------------|-----------|-------------------|------------------|
 """
 
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
-
+        for col in views['active']:
             suggested_name = col.get('suggested_name', col['column_name'])
             description = col.get('business_description', 'No description')[:50] + '...'
             data_type = col['data_type']
@@ -400,92 +663,70 @@ This dataset contains {self.industry} data that supports critical business opera
             if len(col.get('compliance_implications', [])) > 2:
                 compliance += '...'
 
-            doc += f"| `{suggested_name}` | {description} | {data_type} | {criticality} | {compliance} |\n"
+            yield f"| `{suggested_name}` | {description} | {data_type} | {criticality} | {compliance} |\n"
 
-        doc += f"""
+        yield f"""
 ## Migration Notes
 
 ### Transformation Summary
 """
 
-        transformed_columns = [col for col in enhanced_schema
-                               if col.get('transformation_suggestions') and not col.get('is_overall_assessment')]
+        transformed_columns = views['transformed']
 
         if transformed_columns:
-            doc += f"\n{len(transformed_columns)} columns require transformation during migration:\n\n"
+            yield f"\n{len(transformed_columns)} columns require transformation during migration:\n\n"
             for col in transformed_columns:
-                doc += f"- **{col.get('suggested_name')}**: {', '.join(col['transformation_suggestions'][:2])}\n"
+                yield f"- **{col.get('suggested_name')}**: {', '.join(col['transformation_suggestions'][:2])}\n"
         else:
-            doc += "\nNo complex transformations required for this migration.\n"
+            yield "\nNo complex transformations required for this migration.\n"
 
-        doc += f"""
+        yield f"""
 ### Compliance Requirements
 
 This dataset is subject to the following compliance requirements:
 
 """
 
-        all_compliance = set()
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
-            all_compliance.update(col.get('compliance_implications', []))
+        for req in sorted(views['compliance']):
+            yield f"- {req}\n"
 
-        for req in sorted(all_compliance):
-            doc += f"- {req}\n"
-
-        doc += f"""
+        yield f"""
 ## Business Glossary
 
 ### Key Terms and Definitions
 """
 
-        # Group columns by business domain
-        domains = {}
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
-            context = col.get('industry_context', 'General')
-            domain = context.split(' ')[0] if context else 'General'
-            if domain not in domains:
-                domains[domain] = []
-            domains[domain].append(col)
-
         for domain, columns in domains.items():
-            doc += f"\n#### {domain}\n\n"
-            for col in columns[:5]:  # Limit to top 5 per domain
-                doc += f"**{col.get('suggested_name')}**: {col.get('business_description', 'No description')}\n\n"
+            yield f"\n#### {domain}\n\n"
+            for col in columns:
+                yield f"**{col.get('suggested_name')}**: {col.get('business_description', 'No description')}\n\n"
 
-        return doc
-
-    def generate_migration_script(self, enhanced_schema: List[Dict[str, Any]]) -> str:
+    def generate_migration_script(self, enhanced_schema: List[Dict[str, Any]],
+                                  views: Optional[Dict[str, Any]] = None) -> str:
         """Generate platform-specific migration script."""
+        return "".join(self._iter_migration_script(enhanced_schema, views))
 
-        if self.target_platform == 'Snowflake':
-            return self._generate_snowflake_ddl(enhanced_schema)
-        elif self.target_platform == 'BigQuery':
-            return self._generate_bigquery_ddl(enhanced_schema)
-        else:
-            return self._generate_generic_ddl(enhanced_schema)
+    def _iter_migration_script(self, enhanced_schema: List[Dict[str, Any]],
+                               views: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield the platform-specific migration script in pieces."""
+        views = views or self._prepare_views(enhanced_schema)
 
-    def _generate_snowflake_ddl(self, enhanced_schema: List[Dict[str, Any]]) -> str:
-        """Generate Snowflake-specific DDL."""
+        generator = getattr(self, _PLATFORM_DDL_GENERATORS.get(self.target_platform, '_iter_generic_ddl'))
+        return generator(enhanced_schema, views)
 
-        table_name = self.project_context.get('name', 'MIGRATION_TABLE').upper()
+    def _iter_snowflake_ddl(self, enhanced_schema: List[Dict[str, Any]],
+                            views: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield Snowflake-specific DDL in pieces."""
+        views = views or self._prepare_views(enhanced_schema)
 
-        ddl = f"""-- Snowflake DDL for {table_name}
--- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        table_name = self._table_name_upper
 
-CREATE OR REPLACE TABLE {table_name} (
-"""
+        yield self._headers['snowflake_ddl']
 
         column_definitions = []
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
-
+        for col in views['active']:
             suggested_name = col.get('suggested_name', col['column_name']).upper()
-            data_type = self._map_to_snowflake_type(col['data_type'])
+            data_type = _SNOWFLAKE_TYPES.get(col['data_type'], 'VARCHAR(255)')
 
             # Add nullability based on business criticality
             business_criticality = col.get('business_criticality') or ''
@@ -499,9 +740,9 @@ CREATE OR REPLACE TABLE {table_name} (
 
             column_definitions.append(column_def)
 
-        ddl += ",\n".join(column_definitions)
+        yield ",\n".join(column_definitions)
 
-        ddl += f"""
+        yield f"""
 )
 COMMENT = 'Enhanced {self.industry} data migrated from {self.source_system}'
 ;
@@ -510,31 +751,21 @@ COMMENT = 'Enhanced {self.industry} data migrated from {self.source_system}'
 """
 
         # Add indexes for business keys
-        for col in enhanced_schema:
-            if col.get('potential_business_key') and not col.get('is_overall_assessment'):
-                suggested_name = col.get('suggested_name', col['column_name']).upper()
-                ddl += f"CREATE INDEX IF NOT EXISTS IDX_{table_name}_{suggested_name} ON {table_name}({suggested_name});\n"
-
-        return ddl
-
-    def _generate_bigquery_ddl(self, enhanced_schema: List[Dict[str, Any]]) -> str:
-        """Generate BigQuery-specific DDL."""
-
-        table_name = self.project_context.get('name', 'migration_table').lower()
+        for col in views['business_keys']:
+            suggested_name = col.get('suggested_name', col['column_name']).upper()
+            yield f"CREATE INDEX IF NOT EXISTS IDX_{table_name}_{suggested_name} ON {table_name}({suggested_name});\n"
 
-        ddl = f"""-- BigQuery DDL for {table_name}
--- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    def _iter_bigquery_ddl(self, enhanced_schema: List[Dict[str, Any]],
+                           views: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield BigQuery-specific DDL in pieces."""
+        views = views or self._prepare_views(enhanced_schema)
 
-CREATE OR REPLACE TABLE `project.dataset.{table_name}` (
-"""
+        yield self._headers['bigquery_ddl']
 
         column_definitions = []
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
-
+        for col in views['active']:
             suggested_name = col.get('suggested_name', col['column_name']).lower()
-            data_type = self._map_to_bigquery_type(col['data_type'])
+            data_type = _BIGQUERY_TYPES.get(col['data_type'], 'STRING')
 
             # Add mode based on business criticality
             mode = "REQUIRED" if self._safe_startswith(col.get('business_criticality'), 'High') else "NULLABLE"
@@ -544,69 +775,46 @@ CREATE OR REPLACE TABLE `project.dataset.{table_name}` (
             column_def = f"    {suggested_name} {data_type} OPTIONS(description='{description}')"
             column_definitions.append(column_def)
 
-        ddl += ",\n".join(column_definitions)
+        yield ",\n".join(column_definitions)
 
-        ddl += f"""
+        yield f"""
 )
 OPTIONS(
     description='Enhanced {self.industry} data migrated from {self.source_system}',
-    labels=[('industry', '{self.industry.lower()}'), ('source', 'migration')]
+    labels=[('industry', '{self._industry_lower}'), ('source', 'migration')]
 )
 ;"""
 
-        return ddl
-
-    def _generate_generic_ddl(self, enhanced_schema: List[Dict[str, Any]]) -> str:
-        """Generate generic SQL DDL."""
+    def _iter_generic_ddl(self, enhanced_schema: List[Dict[str, Any]],
+                          views: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield generic SQL DDL in pieces."""
+        views = views or self._prepare_views(enhanced_schema)
 
-        table_name = self.project_context.get('name', 'migration_table')
-
-        ddl = f"""-- Generic DDL for {table_name}
--- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
--- Target Platform: {self.target_platform}
-
-CREATE TABLE {table_name} (
-"""
+        yield self._headers['generic_ddl']
 
         column_definitions = []
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
-
+        for col in views['active']:
             suggested_name = col.get('suggested_name', col['column_name'])
-            data_type = self._map_to_generic_type(col['data_type'])
+            data_type = _GENERIC_TYPES.get(col['data_type'], 'VARCHAR(255)')
 
             column_definitions.append(f"    {suggested_name} {data_type}")
 
-        ddl += ",\n".join(column_definitions)
-        ddl += "\n);"
-
-        return ddl
+        yield ",\n".join(column_definitions)
+        yield "\n);"
 
-    def generate_lineage_docs(self, enhanced_schema: List[Dict[str, Any]]) -> str:
+    def generate_lineage_docs(self, enhanced_schema: List[Dict[str, Any]],
+                              views: Optional[Dict[str, Any]] = None) -> str:
         """Generate data lineage documentation."""
+        return "".join(self._iter_lineage_docs(enhanced_schema, views))
 
-        table_name = self.project_context.get('name', 'migration_table')
-
-        lineage = f"""# Data Lineage Documentation
+    def _iter_lineage_docs(self, enhanced_schema: List[Dict[str, Any]],
+                           views: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield the data lineage documentation in pieces."""
+        views = views or self._prepare_views(enhanced_schema)
 
-## Source to Target Mapping
-
-**Migration Project:** {table_name}  
-**Source:** {self.source_system}  
-**Target:** {self.target_platform}  
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Field Mappings
-
-| Source Field | Target Field | Transformation | Business Rationale |
-|--------------|--------------|----------------|-------------------|
-"""
-
-        for col in enhanced_schema:
-            if col.get('is_overall_assessment'):
-                continue
+        yield self._headers['lineage']
 
+        for col in views['active']:
             original_name = col['column_name']
             suggested_name = col.get('suggested_name', original_name)
             transformations = col.get('transformation_suggestions', [])
@@ -614,131 +822,81 @@ CREATE TABLE {table_name} (
             transformation_desc = transformations[0] if transformations else "Direct mapping"
             business_rationale = col.get('business_description', 'Standard field')[:50]
 
-            lineage += f"| `{original_name}` | `{suggested_name}` | {transformation_desc} | {business_rationale} |\n"
+            yield f"| `{original_name}` | `{suggested_name}` | {transformation_desc} | {business_rationale} |\n"
 
-        lineage += f"""
+        yield f"""
 ## Transformation Rules
 
 ### Applied Transformations
 """
 
-        transformed_fields = [col for col in enhanced_schema
-                              if col.get('transformation_suggestions') and not col.get('is_overall_assessment')]
+        transformed_fields = views['transformed']
 
         for col in transformed_fields:
-            lineage += f"""
+            yield f"""
 #### {col.get('suggested_name', col['column_name'])}
 - **Source:** {col['column_name']}
 - **Transformations:** {', '.join(col['transformation_suggestions'])}
 - **Business Justification:** {col.get('business_description', 'N/A')}
 """
 
-        return lineage
-
     def _build_transformation_logic(self, column_name: str, transformations: List[str], data_type: str) -> str:
         """Build SQL transformation logic based on suggestions."""
 
         base_column = column_name
 
+        numeric = data_type in _NUMERIC_TYPES
+
         for transformation in transformations:
-            if 'uppercase' in transformation.lower():
-                base_column = f"UPPER({base_column})"
-            elif 'lowercase' in transformation.lower():
-                base_column = f"LOWER({base_column})"
-            elif 'trim' in transformation.lower():
-                base_column = f"TRIM({base_column})"
-            elif 'standardize phone' in transformation.lower():
-                base_column = f"REGEXP_REPLACE({base_column}, '[^0-9]', '')"
-            elif 'format currency' in transformation.lower():
-                base_column = f"ROUND({base_column}, 2)"
-            elif 'null to zero' in transformation.lower() and data_type in ['integer', 'float']:
-                base_column = f"COALESCE({base_column}, 0)"
-            elif 'extract date' in transformation.lower():
-                base_column = f"DATE({base_column})"
+            lowered = transformation.lower()
+            for keyword, template, numeric_only in _TRANSFORMATION_TEMPLATES:
+                if keyword in lowered and (numeric or not numeric_only):
+                    base_column = template.format(base_column)
+                    break
 
         return base_column
 
-    def _map_to_snowflake_type(self, generic_type: str) -> str:
-        """Map generic data types to Snowflake types."""
-        mapping = {
-            'string': 'VARCHAR(255)',
-            'integer': 'NUMBER(38,0)',
-            'float': 'NUMBER(38,2)',
-            'boolean': 'BOOLEAN',
-            'date': 'DATE',
-            'datetime': 'TIMESTAMP_NTZ',
-            'timestamp': 'TIMESTAMP_NTZ'
-        }
-        return mapping.get(generic_type, 'VARCHAR(255)')
-
-    def _map_to_bigquery_type(self, generic_type: str) -> str:
-        """Map generic data types to BigQuery types."""
-        mapping = {
-            'string': 'STRING',
-            'integer': 'INT64',
-            'float': 'FLOAT64',
-            'boolean': 'BOOL',
-            'date': 'DATE',
-            'datetime': 'DATETIME',
-            'timestamp': 'TIMESTAMP'
-        }
-        return mapping.get(generic_type, 'STRING')
-
-    def _map_to_generic_type(self, generic_type: str) -> str:
-        """Map to generic SQL types."""
-        mapping = {
-            'string': 'VARCHAR(255)',
-            'integer': 'INTEGER',
-            'float': 'DECIMAL(10,2)',
-            'boolean': 'BOOLEAN',
-            'date': 'DATE',
-            'datetime': 'TIMESTAMP',
-            'timestamp': 'TIMESTAMP'
-        }
-        return mapping.get(generic_type, 'VARCHAR(255)')
-
     def generate_project_summary(self, enhanced_schema: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate comprehensive project summary metrics."""
 
-        total_columns = len([col for col in enhanced_schema if not col.get('is_overall_assessment')])
+        views = self._prepare_views(enhanced_schema)
+        counts = views['counts']
+        total_columns = len(views['active'])
 
         # Calculate various metrics
         summary = {
             'project_info': self.project_context,
             'schema_metrics': {
                 'total_columns': total_columns,
-                'enhanced_columns': len([col for col in enhanced_schema if col.get('enhanced')]),
-                'pii_columns': len([col for col in enhanced_schema if col.get('potential_pii')]),
-                'business_keys': len([col for col in enhanced_schema if col.get('potential_business_key')]),
-                'high_quality_columns': len([col for col in enhanced_schema if col.get('data_quality_score', 0) > 0.8])
+                'enhanced_columns': counts['enhanced'],
+                'pii_columns': len(views['pii']),
+                'business_keys': len(views['business_keys']),
+                'high_quality_columns': counts['high_quality']
             },
             'business_impact': {
-                'high_criticality_fields': len(
-                    [col for col in enhanced_schema if self._safe_startswith(col.get('business_criticality'), 'High')]),
-                'compliance_requirements': len(
-                    set().union(*[col.get('compliance_implications', []) for col in enhanced_schema])),
-                'transformation_complexity': len(
-                    [col for col in enhanced_schema if col.get('transformation_suggestions')])
+                'high_criticality_fields': len(views['critical']),
+                'compliance_requirements': len(views['compliance']),
+                'transformation_complexity': len(views['transformed'])
             },
-            'migration_readiness': self._assess_migration_readiness(enhanced_schema)
+            'migration_readiness': self._assess_migration_readiness(enhanced_schema, views)
         }
 
         return summary
 
-    def _assess_migration_readiness(self, enhanced_schema: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _assess_migration_readiness(self, enhanced_schema: List[Dict[str, Any]],
+                                    views: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Assess overall migration readiness."""
+        views = views or self._prepare_views(enhanced_schema)
+        counts = views['counts']
 
-        total_columns = len([col for col in enhanced_schema if not col.get('is_overall_assessment')])
+        total_columns = len(views['active'])
 
         # Calculate readiness scores
-        data_quality_score = sum([col.get('data_quality_score', 0) for col in enhanced_schema if
-                                  not col.get('is_overall_assessment')]) / total_columns
+        data_quality_score = counts['quality_total'] / total_columns
 
-        high_complexity_count = len([col for col in enhanced_schema if col.get('migration_complexity') == 'High'])
-        complexity_score = 1.0 - (high_complexity_count / total_columns)
+        complexity_score = 1.0 - (counts['high_complexity'] / total_columns)
 
-        documentation_score = len([col for col in enhanced_schema if col.get('business_description') and not col.get(
-            'is_overall_assessment')]) / total_columns
+        documentation_score = counts['documented'] / total_columns
 
         overall_readiness = (data_quality_score + complexity_score + documentation_score) / 3
 
@@ -748,29 +906,28 @@ CREATE TABLE {table_name} (
             'complexity_score': round(complexity_score, 2),
             'documentation_score': round(documentation_score, 2),
             'readiness_level': 'High' if overall_readiness > 0.8 else 'Medium' if overall_readiness > 0.6 else 'Low',
-            'recommendations': self._generate_readiness_recommendations(overall_readiness, enhanced_schema)
+            'recommendations': self._generate_readiness_recommendations(overall_readiness, enhanced_schema, views)
         }
 
-    def _generate_readiness_recommendations(self, readiness_score: float, enhanced_schema: List[Dict[str, Any]]) -> \
-    List[str]:
+    def _generate_readiness_recommendations(self, readiness_score: float, enhanced_schema: List[Dict[str, Any]],
+                                            views: Optional[Dict[str, Any]] = None) -> List[str]:
         """Generate recommendations to improve migration readiness."""
         recommendations = []
 
         if readiness_score < 0.8:
+            counts = (views or self._prepare_views(enhanced_schema))['counts']
+
             # Data quality recommendations
-            low_quality_columns = [col for col in enhanced_schema if col.get('data_quality_score', 0) < 0.7]
-            if low_quality_columns:
-                recommendations.append(f"Improve data quality for {len(low_quality_columns)} columns before migration")
+            if counts['low_quality']:
+                recommendations.append(f"Improve data quality for {counts['low_quality']} columns before migration")
 
             # Complexity recommendations
-            high_complexity_columns = [col for col in enhanced_schema if col.get('migration_complexity') == 'High']
-            if high_complexity_columns:
+            if counts['high_complexity']:
                 recommendations.append(
-                    f"Develop detailed migration plan for {len(high_complexity_columns)} complex transformations")
+                    f"Develop detailed migration plan for {counts['high_complexity']} complex transformations")
 
             # Documentation recommendations
-            undocumented_columns = [col for col in enhanced_schema if not col.get('business_description')]
-            if undocumented_columns:
-                recommendations.append(f"Add business documentation for {len(undocumented_columns)} columns")
+            if counts['undocumented']:
+                recommendations.append(f"Add business documentation for {counts['undocumented']} columns")
 
         return recommendations
\ No newline at end of file
@@ -1,26 +1,73 @@
 import pandas as pd
 import numpy as np
 import json
+import orjson
 import sqlite3
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-import random
+from typing import Dict, List, Any, FrozenSet, Optional
+from datetime import date, datetime
 import string
 from faker import Faker
 
+try:
+    import ahocorasick
+except ImportError:  # optional; keyword matching falls back to substring scans
+    ahocorasick = None
+
+# Faker values drawn per sample column; rows are sampled from this pool instead of calling
+# Faker once per row. Emails, phone numbers and street addresses get a wider pool.
+FAKER_POOL_SIZE = 5000
+FAKER_WIDE_POOL_SIZE = 10_000
+
+# Sample values (uppercased) that make a column a boolean flag
+_BOOLEAN_FLAG_VALUES = frozenset({'Y', 'N', 'YES', 'NO', 'TRUE', 'FALSE', '1', '0'})
+
+# Separators stripped from a value in one pass before testing it as a phone number
+_PHONE_SEPARATORS = str.maketrans('', '', '-() ')
+
+# Keywords that mark a column name as PII or as a business key; a keyword matches anywhere in the name
+_PII_KEYWORDS = frozenset({
+    'email', 'phone', 'ssn', 'social', 'name', 'fname', 'lname',
+    'address', 'addr', 'birth', 'dob', 'license', 'passport'
+})
+_KEY_KEYWORDS = frozenset({'id', 'key', 'nbr', 'code', 'cd'})
+
+
+def _build_keyword_automaton(keywords: FrozenSet[str]):
+    """Build an Aho-Corasick automaton over the keywords, or None if pyahocorasick is missing."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_PII_AUTOMATON = _build_keyword_automaton(_PII_KEYWORDS)
+_KEY_AUTOMATON = _build_keyword_automaton(_KEY_KEYWORDS)
+
+
+def _has_keyword(column_name: str, keywords: FrozenSet[str], automaton) -> bool:
+    """Tell whether any keyword occurs in the lowercased column name, in one automaton scan when available."""
+    name = column_name.lower()
+    if automaton is not None:
+        return next(automaton.iter(name), None) is not None
+    return any(keyword in name for keyword in keywords)
+
 
 class MultiFormatProcessor:
     """Enhanced processor supporting multiple data source types."""
 
     def __init__(self):
         self.faker = Faker()
+        self.rng = np.random.default_rng()
         self.supported_formats = [
             'csv', 'excel', 'json', 'parquet', 'database', 'api_schema'
         ]
 
     def process_csv(self, uploaded_file) -> Dict[str, Any]:
         """Process CSV file with enhanced analysis."""
-        from csv_processor import CSVProcessor
+        from .csv_processor import CSVProcessor
 
         processor = CSVProcessor()
         data = processor.process_file(uploaded_file)
@@ -71,7 +118,12 @@ class MultiFormatProcessor:
     def process_json_schema(self, json_input: str) -> Dict[str, Any]:
         """Process JSON schema definition OR actual JSON data."""
         try:
-            parsed_json = json.loads(json_input)
+            # orjson covers well-formed input; the stdlib parser also takes what orjson rejects
+            # (NaN/Infinity literals, integers beyond 64 bits) and words the error for bad JSON
+            try:
+                parsed_json = orjson.loads(json_input)
+            except orjson.JSONDecodeError:
+                parsed_json = json.loads(json_input)
 
             if isinstance(parsed_json, list):
                 # Handle actual JSON data (array of objects)
@@ -198,223 +250,216 @@ class MultiFormatProcessor:
 
         return enhanced
 
+    def _sequential_ids(self, template: str, n: int) -> List[str]:
+        """Number n IDs from 1, e.g. 'C{:06d}' -> C000001, C000002, ..."""
+        return [template.format(i) for i in range(1, n + 1)]
+
+    def _random_codes(self, template: str, low: int, high: int, n: int) -> List[str]:
+        """Format n random integers in [low, high] into codes such as 'SKU{}'."""
+        return [template.format(v) for v in self.rng.integers(low, high + 1, n).tolist()]
+
+    def _faker_values(self, provider, n: int, pool_size: int = FAKER_POOL_SIZE, **kwargs) -> np.ndarray:
+        """Draw n values of a Faker provider, sampled with repetition from a pool of at most pool_size."""
+        pool = np.array([provider(**kwargs) for _ in range(min(n, pool_size))], dtype=object)
+        return pool[self.rng.integers(0, len(pool), n)] if n > len(pool) else pool
+
+    def _random_categories(self, values: List[str], n: int) -> pd.Categorical:
+        """Draw n of the given codes as a categorical, storing small integer codes instead of strings."""
+        return pd.Categorical.from_codes(self.rng.integers(0, len(values), n), categories=values)
+
+    def _random_amounts(self, low: float, high: float, n: int, decimals: int = 2) -> np.ndarray:
+        """Draw n uniform amounts in [low, high], rounded like currency."""
+        return np.round(self.rng.uniform(low, high, n), decimals)
+
+    def _random_days(self, start_days: int, end_days: int, n: int) -> np.ndarray:
+        """Draw n dates between two offsets in days from today, as datetime64[D]."""
+        return np.datetime64(date.today(), 'D') + self.rng.integers(start_days, end_days + 1, n)
+
+    def _random_dates(self, start_days: int, end_days: int, n: int) -> np.ndarray:
+        """Draw n dates between two offsets in days from today, as datetime.date objects."""
+        return self._random_days(start_days, end_days, n).astype(object)
+
+    def _random_timestamps(self, start_days: int, n: int) -> np.ndarray:
+        """Draw n timestamps between start_days from now and now, to the second."""
+        seconds = self.rng.integers(start_days * 86400, 1, n).astype('timedelta64[s]')
+        return np.datetime64(datetime.now(), 's') + seconds
+
     def _generate_customer_data(self, n: int) -> pd.DataFrame:
         """Generate realistic customer data with legacy naming conventions."""
-        data = []
-
-        for i in range(n):
-            # Use cryptic legacy column names that need enhancement
-            record = {
-                'CUST_ID_NBR': f'C{i + 1:06d}',
-                'CUST_FNAME': self.faker.first_name(),
-                'CUST_LNAME': self.faker.last_name(),
-                'CUST_EMAIL_ADDR': self.faker.email(),
-                'CUST_PHONE_NBR': self.faker.phone_number(),
-                'CUST_ADDR_LINE1': self.faker.street_address(),
-                'CUST_CITY_NM': self.faker.city(),
-                'CUST_STATE_CD': self.faker.state_abbr(),
-                'CUST_ZIP_CD': self.faker.zipcode(),
-                'CUST_COUNTRY_CD': 'US',
-                'CUST_BIRTH_DT': self.faker.date_of_birth(minimum_age=18, maximum_age=80),
-                'CUST_GENDER_CD': random.choice(['M', 'F', 'O']),
-                'CUST_STATUS_CD': random.choice(['A', 'I', 'S']),  # Active, Inactive, Suspended
-                'CUST_SEGMENT_CD': random.choice(['PREM', 'GOLD', 'SILV', 'BRNZ']),
-                'CUST_REG_DT': self.faker.date_between(start_date='-5y', end_date='today'),
-                'CUST_LAST_LOGIN_DT': self.faker.date_between(start_date='-30d', end_date='today'),
-                'CUST_LIFETIME_VAL_AMT': round(random.uniform(100, 50000), 2),
-                'CUST_RISK_SCORE_NBR': random.randint(1, 100),
-                'CUST_PREF_CONTACT_CD': random.choice(['EMAIL', 'PHONE', 'MAIL']),
-                'CUST_MARKETING_OPT_FLG': random.choice(['Y', 'N']),
-            }
-            data.append(record)
-
-        return pd.DataFrame(data)
+        # Use cryptic legacy column names that need enhancement. Every generator builds its
+        # columns as fresh arrays, so the frame wraps them (copy=False) instead of copying them
+        return pd.DataFrame({
+            'CUST_ID_NBR': self._sequential_ids('C{:06d}', n),
+            'CUST_FNAME': self._faker_values(self.faker.first_name, n),
+            'CUST_LNAME': self._faker_values(self.faker.last_name, n),
+            'CUST_EMAIL_ADDR': self._faker_values(self.faker.email, n, pool_size=FAKER_WIDE_POOL_SIZE),
+            'CUST_PHONE_NBR': self._faker_values(self.faker.phone_number, n, pool_size=FAKER_WIDE_POOL_SIZE),
+            'CUST_ADDR_LINE1': self._faker_values(self.faker.street_address, n, pool_size=FAKER_WIDE_POOL_SIZE),
+            'CUST_CITY_NM': self._faker_values(self.faker.city, n),
+            'CUST_STATE_CD': self._faker_values(self.faker.state_abbr, n),
+            'CUST_ZIP_CD': self._faker_values(self.faker.zipcode, n),
+            'CUST_COUNTRY_CD': 'US',
+            'CUST_BIRTH_DT': self._random_dates(-80 * 365, -18 * 365, n),
+            'CUST_GENDER_CD': self._random_categories(['M', 'F', 'O'], n),
+            'CUST_STATUS_CD': self._random_categories(['A', 'I', 'S'], n),  # Active, Inactive, Suspended
+            'CUST_SEGMENT_CD': self._random_categories(['PREM', 'GOLD', 'SILV', 'BRNZ'], n),
+            'CUST_REG_DT': self._random_dates(-5 * 365, 0, n),
+            'CUST_LAST_LOGIN_DT': self._random_dates(-30, 0, n),
+            'CUST_LIFETIME_VAL_AMT': self._random_amounts(100, 50000, n),
+            'CUST_RISK_SCORE_NBR': self.rng.integers(1, 101, n, dtype=np.int8),
+            'CUST_PREF_CONTACT_CD': self._random_categories(['EMAIL', 'PHONE', 'MAIL'], n),
+            'CUST_MARKETING_OPT_FLG': self._random_categories(['Y', 'N'], n),
+        }, copy=False)
 
     def _generate_order_data(self, n: int) -> pd.DataFrame:
         """Generate order data with legacy conventions."""
-        data = []
-
-        for i in range(n):
-            order_date = self.faker.date_between(start_date='-2y', end_date='today')
-            record = {
-                'ORDER_ID_NBR': f'ORD{i + 1:08d}',
-                'CUST_ID_NBR': f'C{random.randint(1, 1000):06d}',
-                'ORDER_DT': order_date,
-                'ORDER_STATUS_CD': random.choice(['PEND', 'CONF', 'SHIP', 'DLVR', 'CANC']),
-                'ORDER_TOTAL_AMT': round(random.uniform(10, 2000), 2),
-                'ORDER_TAX_AMT': round(random.uniform(1, 200), 2),
-                'ORDER_SHIP_AMT': round(random.uniform(0, 50), 2),
-                'ORDER_DISCOUNT_AMT': round(random.uniform(0, 100), 2),
-                'PAYMENT_METHOD_CD': random.choice(['CC', 'PP', 'BT', 'COD']),
-                'SHIP_METHOD_CD': random.choice(['STD', 'EXP', 'OVN', 'PU']),
-                'SHIP_ADDR_LINE1': self.faker.street_address(),
-                'SHIP_CITY_NM': self.faker.city(),
-                'SHIP_STATE_CD': self.faker.state_abbr(),
-                'SHIP_ZIP_CD': self.faker.zipcode(),
-                'ORDER_CHANNEL_CD': random.choice(['WEB', 'MOB', 'STORE', 'PHONE']),
-            }
-            data.append(record)
-
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            'ORDER_ID_NBR': self._sequential_ids('ORD{:08d}', n),
+            'CUST_ID_NBR': self._random_codes('C{:06d}', 1, 1000, n),
+            'ORDER_DT': self._random_dates(-2 * 365, 0, n),
+            'ORDER_STATUS_CD': self._random_categories(['PEND', 'CONF', 'SHIP', 'DLVR', 'CANC'], n),
+            'ORDER_TOTAL_AMT': self._random_amounts(10, 2000, n),
+            'ORDER_TAX_AMT': self._random_amounts(1, 200, n),
+            'ORDER_SHIP_AMT': self._random_amounts(0, 50, n),
+            'ORDER_DISCOUNT_AMT': self._random_amounts(0, 100, n),
+            'PAYMENT_METHOD_CD': self._random_categories(['CC', 'PP', 'BT', 'COD'], n),
+            'SHIP_METHOD_CD': self._random_categories(['STD', 'EXP', 'OVN', 'PU'], n),
+            'SHIP_ADDR_LINE1': self._faker_values(self.faker.street_address, n, pool_size=FAKER_WIDE_POOL_SIZE),
+            'SHIP_CITY_NM': self._faker_values(self.faker.city, n),
+            'SHIP_STATE_CD': self._faker_values(self.faker.state_abbr, n),
+            'SHIP_ZIP_CD': self._faker_values(self.faker.zipcode, n),
+            'ORDER_CHANNEL_CD': self._random_categories(['WEB', 'MOB', 'STORE', 'PHONE'], n),
+        }, copy=False)
 
     def _generate_product_data(self, n: int) -> pd.DataFrame:
         """Generate product catalog data."""
         categories = ['ELEC', 'CLTH', 'HOME', 'BOOK', 'TOYS', 'SPRT']
-        data = []
-
-        for i in range(n):
-            record = {
-                'PROD_ID_NBR': f'P{i + 1:06d}',
-                'PROD_SKU_CD': f'SKU{random.randint(100000, 999999)}',
-                'PROD_NAME_TXT': self.faker.catch_phrase(),
-                'PROD_DESC_TXT': self.faker.text(max_nb_chars=200),
-                'PROD_CAT_CD': random.choice(categories),
-                'PROD_SUBCAT_CD': f'{random.choice(categories)}{random.randint(10, 99)}',
-                'PROD_BRAND_NM': self.faker.company(),
-                'PROD_PRICE_AMT': round(random.uniform(5, 500), 2),
-                'PROD_COST_AMT': round(random.uniform(2, 250), 2),
-                'PROD_WEIGHT_NBR': round(random.uniform(0.1, 50), 2),
-                'PROD_STATUS_CD': random.choice(['A', 'D', 'O']),  # Active, Discontinued, Out of Stock
-                'PROD_INVENTORY_QTY': random.randint(0, 1000),
-                'PROD_LAUNCH_DT': self.faker.date_between(start_date='-5y', end_date='today'),
-                'PROD_RATING_NBR': round(random.uniform(1, 5), 1),
-                'PROD_REVIEW_CNT': random.randint(0, 500),
-                'PROD_VENDOR_ID_NBR': f'V{random.randint(1, 100):03d}',
-            }
-            data.append(record)
 
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            'PROD_ID_NBR': self._sequential_ids('P{:06d}', n),
+            'PROD_SKU_CD': self._random_codes('SKU{}', 100000, 999999, n),
+            'PROD_NAME_TXT': self._faker_values(self.faker.catch_phrase, n),
+            'PROD_DESC_TXT': self._faker_values(self.faker.text, n, max_nb_chars=200),
+            'PROD_CAT_CD': self._random_categories(categories, n),
+            'PROD_SUBCAT_CD': np.char.add(self.rng.choice(categories, n),
+                                          self.rng.integers(10, 100, n).astype(str)),
+            'PROD_BRAND_NM': self._faker_values(self.faker.company, n),
+            'PROD_PRICE_AMT': self._random_amounts(5, 500, n),
+            'PROD_COST_AMT': self._random_amounts(2, 250, n),
+            'PROD_WEIGHT_NBR': self._random_amounts(0.1, 50, n),
+            'PROD_STATUS_CD': self._random_categories(['A', 'D', 'O'], n),  # Active, Discontinued, Out of Stock
+            'PROD_INVENTORY_QTY': self.rng.integers(0, 1001, n, dtype=np.int16),
+            'PROD_LAUNCH_DT': self._random_dates(-5 * 365, 0, n),
+            'PROD_RATING_NBR': self._random_amounts(1, 5, n, decimals=1),
+            'PROD_REVIEW_CNT': self.rng.integers(0, 501, n, dtype=np.int16),
+            'PROD_VENDOR_ID_NBR': self._random_codes('V{:03d}', 1, 100, n),
+        }, copy=False)
 
     def _generate_order_items_data(self, n: int) -> pd.DataFrame:
         """Generate order items data."""
-        data = []
-
-        for i in range(n):
-            record = {
-                'ORDER_ITEM_ID_NBR': f'OI{i + 1:08d}',
-                'ORDER_ID_NBR': f'ORD{random.randint(1, 2500):08d}',
-                'PROD_ID_NBR': f'P{random.randint(1, 500):06d}',
-                'ITEM_QTY_NBR': random.randint(1, 10),
-                'ITEM_UNIT_PRICE_AMT': round(random.uniform(5, 500), 2),
-                'ITEM_TOTAL_AMT': 0,  # Will be calculated
-                'ITEM_DISCOUNT_AMT': round(random.uniform(0, 50), 2),
-                'ITEM_STATUS_CD': random.choice(['ORD', 'SHIP', 'DLVR', 'RETN']),
-            }
-            # Calculate total
-            record['ITEM_TOTAL_AMT'] = round(
-                record['ITEM_QTY_NBR'] * record['ITEM_UNIT_PRICE_AMT'] - record['ITEM_DISCOUNT_AMT'], 2
-            )
-            data.append(record)
-
-        return pd.DataFrame(data)
+        quantities = self.rng.integers(1, 11, n, dtype=np.int8)
+        unit_prices = self._random_amounts(5, 500, n)
+        discounts = self._random_amounts(0, 50, n)
+
+        return pd.DataFrame({
+            'ORDER_ITEM_ID_NBR': self._sequential_ids('OI{:08d}', n),
+            'ORDER_ID_NBR': self._random_codes('ORD{:08d}', 1, 2500, n),
+            'PROD_ID_NBR': self._random_codes('P{:06d}', 1, 500, n),
+            'ITEM_QTY_NBR': quantities,
+            'ITEM_UNIT_PRICE_AMT': unit_prices,
+            'ITEM_TOTAL_AMT': np.round(quantities * unit_prices - discounts, 2),
+            'ITEM_DISCOUNT_AMT': discounts,
+            'ITEM_STATUS_CD': self._random_categories(['ORD', 'SHIP', 'DLVR', 'RETN'], n),
+        }, copy=False)
 
     def _generate_financial_data(self, n: int) -> pd.DataFrame:
         """Generate financial transaction data."""
-        data = []
-
-        for i in range(n):
-            record = {
-                'TXN_ID_NBR': f'TXN{i + 1:010d}',
-                'ACCT_NBR': f'{random.randint(1000000000, 9999999999)}',
-                'TXN_DT': self.faker.date_between(start_date='-1y', end_date='today'),
-                'TXN_TS': self.faker.date_time_between(start_date='-1y', end_date='now'),
-                'TXN_TYPE_CD': random.choice(['DEP', 'WTH', 'TRF', 'FEE', 'INT', 'CHG']),
-                'TXN_AMT': round(random.uniform(-5000, 10000), 2),
-                'TXN_DESC_TXT': self.faker.sentence(nb_words=4),
-                'TXN_CATEGORY_CD': random.choice(['FOOD', 'GAS', 'SHOP', 'BILL', 'ENTM', 'MISC']),
-                'TXN_CHANNEL_CD': random.choice(['ATM', 'ONL', 'MOB', 'BRANCH', 'POS']),
-                'TXN_STATUS_CD': random.choice(['COMP', 'PEND', 'FAIL', 'VOID']),
-                'MERCHANT_NM': self.faker.company(),
-                'MERCHANT_CAT_CD': f'MCC{random.randint(1000, 9999)}',
-                'TXN_CURRENCY_CD': 'USD',
-                'TXN_EXCHANGE_RT': 1.0,
-                'FRAUD_SCORE_NBR': random.randint(0, 100),
-                'TXN_LOCATION_CD': self.faker.state_abbr(),
-            }
-            data.append(record)
-
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            'TXN_ID_NBR': self._sequential_ids('TXN{:010d}', n),
+            'ACCT_NBR': self._random_codes('{}', 1000000000, 9999999999, n),
+            'TXN_DT': self._random_dates(-365, 0, n),
+            'TXN_TS': self._random_timestamps(-365, n),
+            'TXN_TYPE_CD': self._random_categories(['DEP', 'WTH', 'TRF', 'FEE', 'INT', 'CHG'], n),
+            'TXN_AMT': self._random_amounts(-5000, 10000, n),
+            'TXN_DESC_TXT': self._faker_values(self.faker.sentence, n, nb_words=4),
+            'TXN_CATEGORY_CD': self._random_categories(['FOOD', 'GAS', 'SHOP', 'BILL', 'ENTM', 'MISC'], n),
+            'TXN_CHANNEL_CD': self._random_categories(['ATM', 'ONL', 'MOB', 'BRANCH', 'POS'], n),
+            'TXN_STATUS_CD': self._random_categories(['COMP', 'PEND', 'FAIL', 'VOID'], n),
+            'MERCHANT_NM': self._faker_values(self.faker.company, n),
+            'MERCHANT_CAT_CD': self._random_codes('MCC{}', 1000, 9999, n),
+            'TXN_CURRENCY_CD': 'USD',
+            'TXN_EXCHANGE_RT': 1.0,
+            'FRAUD_SCORE_NBR': self.rng.integers(0, 101, n, dtype=np.int8),
+            'TXN_LOCATION_CD': self._faker_values(self.faker.state_abbr, n),
+        }, copy=False)
 
     def _generate_healthcare_data(self, n: int) -> pd.DataFrame:
         """Generate healthcare records (anonymized)."""
-        data = []
-
-        for i in range(n):
-            record = {
-                'PATIENT_ID_NBR': f'PT{i + 1:08d}',
-                'VISIT_ID_NBR': f'V{i + 1:010d}',
-                'VISIT_DT': self.faker.date_between(start_date='-2y', end_date='today'),
-                'PATIENT_AGE_NBR': random.randint(1, 100),
-                'PATIENT_GENDER_CD': random.choice(['M', 'F', 'O']),
-                'DIAGNOSIS_CD': f'ICD{random.randint(10, 99)}.{random.randint(100, 999)}',
-                'PROCEDURE_CD': f'CPT{random.randint(10000, 99999)}',
-                'PROVIDER_ID_NBR': f'PR{random.randint(1, 1000):04d}',
-                'DEPARTMENT_CD': random.choice(['ER', 'ICU', 'SURG', 'CARD', 'ONCO', 'PEDI']),
-                'ADMISSION_TYPE_CD': random.choice(['EMER', 'ELEC', 'URGENT', 'OUTPT']),
-                'LENGTH_OF_STAY_NBR': random.randint(0, 30),
-                'DISCHARGE_STATUS_CD': random.choice(['HOME', 'TRANSFER', 'AMA', 'EXPIRED']),
-                'TOTAL_CHARGES_AMT': round(random.uniform(100, 50000), 2),
-                'INSURANCE_TYPE_CD': random.choice(['PRIV', 'MCARE', 'MCAID', 'SELF']),
-                'SEVERITY_SCORE_NBR': random.randint(1, 10),
-            }
-            data.append(record)
-
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            'PATIENT_ID_NBR': self._sequential_ids('PT{:08d}', n),
+            'VISIT_ID_NBR': self._sequential_ids('V{:010d}', n),
+            'VISIT_DT': self._random_dates(-2 * 365, 0, n),
+            'PATIENT_AGE_NBR': self.rng.integers(1, 101, n, dtype=np.int8),
+            'PATIENT_GENDER_CD': self._random_categories(['M', 'F', 'O'], n),
+            'DIAGNOSIS_CD': [f'ICD{major}.{minor}' for major, minor in
+                             zip(self.rng.integers(10, 100, n).tolist(), self.rng.integers(100, 1000, n).tolist())],
+            'PROCEDURE_CD': self._random_codes('CPT{}', 10000, 99999, n),
+            'PROVIDER_ID_NBR': self._random_codes('PR{:04d}', 1, 1000, n),
+            'DEPARTMENT_CD': self._random_categories(['ER', 'ICU', 'SURG', 'CARD', 'ONCO', 'PEDI'], n),
+            'ADMISSION_TYPE_CD': self._random_categories(['EMER', 'ELEC', 'URGENT', 'OUTPT'], n),
+            'LENGTH_OF_STAY_NBR': self.rng.integers(0, 31, n, dtype=np.int8),
+            'DISCHARGE_STATUS_CD': self._random_categories(['HOME', 'TRANSFER', 'AMA', 'EXPIRED'], n),
+            'TOTAL_CHARGES_AMT': self._random_amounts(100, 50000, n),
+            'INSURANCE_TYPE_CD': self._random_categories(['PRIV', 'MCARE', 'MCAID', 'SELF'], n),
+            'SEVERITY_SCORE_NBR': self.rng.integers(1, 11, n, dtype=np.int8),
+        }, copy=False)
 
     def _generate_manufacturing_data(self, n: int) -> pd.DataFrame:
         """Generate manufacturing/production data."""
-        data = []
-
-        for i in range(n):
-            record = {
-                'BATCH_ID_NBR': f'B{i + 1:08d}',
-                'PROD_LINE_CD': random.choice(['LINE01', 'LINE02', 'LINE03', 'LINE04']),
-                'SHIFT_CD': random.choice(['DAY', 'SWING', 'NIGHT']),
-                'PROD_DT': self.faker.date_between(start_date='-6m', end_date='today'),
-                'PART_NBR': f'PN{random.randint(100000, 999999)}',
-                'QTY_PRODUCED_NBR': random.randint(50, 1000),
-                'QTY_DEFECTIVE_NBR': random.randint(0, 50),
-                'CYCLE_TIME_MIN': round(random.uniform(10, 120), 2),
-                'TEMPERATURE_F': round(random.uniform(150, 300), 1),
-                'PRESSURE_PSI': round(random.uniform(20, 100), 1),
-                'HUMIDITY_PCT': round(random.uniform(30, 70), 1),
-                'OPERATOR_ID_NBR': f'OP{random.randint(1, 100):03d}',
-                'MACHINE_ID_NBR': f'M{random.randint(1, 50):03d}',
-                'QUALITY_GRADE_CD': random.choice(['A', 'B', 'C', 'REJECT']),
-                'DOWNTIME_MIN': random.randint(0, 60),
-                'MATERIAL_COST_AMT': round(random.uniform(50, 500), 2),
-            }
-            data.append(record)
-
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            'BATCH_ID_NBR': self._sequential_ids('B{:08d}', n),
+            'PROD_LINE_CD': self._random_categories(['LINE01', 'LINE02', 'LINE03', 'LINE04'], n),
+            'SHIFT_CD': self._random_categories(['DAY', 'SWING', 'NIGHT'], n),
+            'PROD_DT': self._random_dates(-6 * 30, 0, n),
+            'PART_NBR': self._random_codes('PN{}', 100000, 999999, n),
+            'QTY_PRODUCED_NBR': self.rng.integers(50, 1001, n, dtype=np.int16),
+            'QTY_DEFECTIVE_NBR': self.rng.integers(0, 51, n, dtype=np.int8),
+            'CYCLE_TIME_MIN': self._random_amounts(10, 120, n),
+            'TEMPERATURE_F': self._random_amounts(150, 300, n, decimals=1),
+            'PRESSURE_PSI': self._random_amounts(20, 100, n, decimals=1),
+            'HUMIDITY_PCT': self._random_amounts(30, 70, n, decimals=1),
+            'OPERATOR_ID_NBR': self._random_codes('OP{:03d}', 1, 100, n),
+            'MACHINE_ID_NBR': self._random_codes('M{:03d}', 1, 50, n),
+            'QUALITY_GRADE_CD': self._random_categories(['A', 'B', 'C', 'REJECT'], n),
+            'DOWNTIME_MIN': self.rng.integers(0, 61, n, dtype=np.int8),
+            'MATERIAL_COST_AMT': self._random_amounts(50, 500, n),
+        }, copy=False)
 
     def _generate_data_from_json_schema(self, schema_def: Dict) -> pd.DataFrame:
         """Generate sample data from JSON schema definition."""
-        data = []
+        n = 100
 
         # Simple JSON schema support for POC
-        for i in range(100):
-            record = {}
-            for field, field_type in schema_def.items():
-                if field_type == 'string':
-                    record[field] = self.faker.word()
-                elif field_type == 'integer':
-                    record[field] = random.randint(1, 1000)
-                elif field_type == 'float':
-                    record[field] = round(random.uniform(1, 1000), 2)
-                elif field_type == 'boolean':
-                    record[field] = random.choice([True, False])
-                elif field_type == 'date':
-                    record[field] = self.faker.date()
-                else:
-                    record[field] = self.faker.word()
-            data.append(record)
+        columns = {}
+        for field, field_type in schema_def.items():
+            if field_type == 'integer':
+                columns[field] = self.rng.integers(1, 1001, n)
+            elif field_type == 'float':
+                columns[field] = self._random_amounts(1, 1000, n)
+            elif field_type == 'boolean':
+                columns[field] = self.rng.choice([True, False], n)
+            elif field_type == 'date':
+                # ISO date strings since 1970, as Faker's date() gives, drawn in one vectorized call
+                days_since_epoch = (date.today() - date(1970, 1, 1)).days
+                columns[field] = self._random_days(-days_since_epoch, 0, n).astype(str).astype(object)
+            else:
+                columns[field] = self._faker_values(self.faker.word, n)
 
-        return pd.DataFrame(data)
+        return pd.DataFrame(columns, index=range(n), copy=False)
 
     def _infer_schema_from_sample_data(self, data: pd.DataFrame, table_name: str) -> List[Dict]:
         """Infer schema from generated sample data."""
-        from csv_processor import CSVProcessor
+        from .csv_processor import CSVProcessor
 
         processor = CSVProcessor()
         schema = processor.infer_schema(data)
@@ -428,21 +473,13 @@ class MultiFormatProcessor:
 
     def _detect_pii(self, column_name: str, sample_values: List[str]) -> bool:
         """Detect potential PII fields."""
-        pii_keywords = [
-            'email', 'phone', 'ssn', 'social', 'name', 'fname', 'lname',
-            'address', 'addr', 'birth', 'dob', 'license', 'passport'
-        ]
-
-        column_lower = column_name.lower()
-        return any(keyword in column_lower for keyword in pii_keywords)
+        return _has_keyword(column_name, _PII_KEYWORDS, _PII_AUTOMATON)
 
     def _detect_business_key(self, column_name: str, unique_count: int, total_count: int) -> bool:
         """Detect potential business keys."""
-        key_keywords = ['id', 'key', 'nbr', 'code', 'cd']
         uniqueness_ratio = unique_count / total_count if total_count > 0 else 0
 
-        column_lower = column_name.lower()
-        has_key_pattern = any(keyword in column_lower for keyword in key_keywords)
+        has_key_pattern = _has_keyword(column_name, _KEY_KEYWORDS, _KEY_AUTOMATON)
         is_highly_unique = uniqueness_ratio > 0.9
 
         return has_key_pattern and is_highly_unique
@@ -456,119 +493,109 @@ class MultiFormatProcessor:
         str_values = [str(v) for v in sample_values[:10]]
 
         # Check for common patterns
-        if all(v.upper() in ['Y', 'N', 'YES', 'NO', 'TRUE', 'FALSE', '1', '0'] for v in str_values):
+        first_length = len(str_values[0])
+        if all(v.upper() in _BOOLEAN_FLAG_VALUES for v in str_values):
             return 'boolean_flag'
-        elif all(len(v) == len(str_values[0]) and v.isupper() for v in str_values):
+        elif all(len(v) == first_length and v.isupper() for v in str_values):
             return 'fixed_code'
         elif all('@' in v for v in str_values):
             return 'email_address'
-        elif all(v.replace('-', '').replace('(', '').replace(')', '').replace(' ', '').isdigit() for v in str_values):
+        elif all(v.translate(_PHONE_SEPARATORS).isdigit() for v in str_values):
             return 'phone_number'
-        elif all(len(v.replace('-', '')) in [9, 11] and v.replace('-', '').isdigit() for v in str_values):
+        elif all(len(digits) in (9, 11) and digits.isdigit()
+                 for digits in (v.replace('-', '') for v in str_values)):
             return 'ssn_or_id'
         else:
             return 'general_text'
 
     def _generate_ota_booking_data(self, n: int) -> pd.DataFrame:
         """Generate realistic OTA booking data with legacy naming conventions."""
-        data = []
-
         booking_statuses = ['CONF', 'PEND', 'CANC', 'NOSH', 'AMND']
         property_types = ['HOTEL', 'APART', 'B&B', 'HOSTEL', 'VILLA', 'RESORT']
         channels = ['DIRECT', 'OTA', 'GDS', 'AGENT', 'MOBILE', 'API']
         cancellation_policies = ['FREE', 'NONREF', 'PARTIAL', 'FLEXI']
 
-        for i in range(n):
-            checkin_date = self.faker.date_between(start_date='-6m', end_date='+6m')
-            checkout_date = checkin_date + timedelta(days=random.randint(1, 14))
-            booking_date = checkin_date - timedelta(days=random.randint(1, 90))
-
-            record = {
-                'BKNG_ID_NBR': f'BK{i + 1:010d}',
-                'PROP_ID_NBR': f'PROP{random.randint(1, 10000):06d}',
-                'GUEST_ID_NBR': f'G{random.randint(1, 50000):08d}',
-                'BKNG_REF_CD': f'REF{random.randint(100000, 999999)}',
-                'BKNG_DT': booking_date,
-                'CHECKIN_DT': checkin_date,
-                'CHECKOUT_DT': checkout_date,
-                'NIGHTS_CNT': (checkout_date - checkin_date).days,
-                'ADULTS_CNT': random.randint(1, 4),
-                'CHILDREN_CNT': random.randint(0, 3),
-                'ROOMS_CNT': random.randint(1, 3),
-                'ROOM_TYPE_CD': random.choice(['STD', 'DLX', 'STE', 'FAM', 'TWIN', 'KING']),
-                'BKNG_STATUS_CD': random.choice(booking_statuses),
-                'CHANNEL_CD': random.choice(channels),
-                'PROP_TYPE_CD': random.choice(property_types),
-                'CURRENCY_CD': random.choice(['EUR', 'USD', 'GBP', 'AUD', 'CAD']),
-                'TOTAL_AMT': round(random.uniform(50, 2000), 2),
-                'COMMISSION_AMT': round(random.uniform(5, 300), 2),
-                'COMMISSION_PCT': round(random.uniform(8, 25), 2),
-                'CANC_POLICY_CD': random.choice(cancellation_policies),
-                'GUEST_EMAIL_ADDR': self.faker.email(),
-                'GUEST_PHONE_NBR': self.faker.phone_number(),
-                'GUEST_COUNTRY_CD': self.faker.country_code(),
-                'PAYMENT_METHOD_CD': random.choice(['CC', 'PAYPAL', 'BANK', 'CRYPTO']),
-                'LOYALTY_MEMBER_FLG': random.choice(['Y', 'N']),
-                'FRAUD_SCORE_NBR': random.randint(0, 100),
-                # Add more fields as needed...
-            }
-            data.append(record)
-
-        return pd.DataFrame(data)
+        checkin_dates = self._random_days(-6 * 30, 6 * 30, n)
+        nights = self.rng.integers(1, 15, n, dtype=np.int8)
+        checkout_dates = checkin_dates + nights
+        booking_dates = checkin_dates - self.rng.integers(1, 91, n)
+
+        return pd.DataFrame({
+            'BKNG_ID_NBR': self._sequential_ids('BK{:010d}', n),
+            'PROP_ID_NBR': self._random_codes('PROP{:06d}', 1, 10000, n),
+            'GUEST_ID_NBR': self._random_codes('G{:08d}', 1, 50000, n),
+            'BKNG_REF_CD': self._random_codes('REF{}', 100000, 999999, n),
+            'BKNG_DT': booking_dates.astype(object),
+            'CHECKIN_DT': checkin_dates.astype(object),
+            'CHECKOUT_DT': checkout_dates.astype(object),
+            'NIGHTS_CNT': nights,
+            'ADULTS_CNT': self.rng.integers(1, 5, n, dtype=np.int8),
+            'CHILDREN_CNT': self.rng.integers(0, 4, n, dtype=np.int8),
+            'ROOMS_CNT': self.rng.integers(1, 4, n, dtype=np.int8),
+            'ROOM_TYPE_CD': self._random_categories(['STD', 'DLX', 'STE', 'FAM', 'TWIN', 'KING'], n),
+            'BKNG_STATUS_CD': self._random_categories(booking_statuses, n),
+            'CHANNEL_CD': self._random_categories(channels, n),
+            'PROP_TYPE_CD': self._random_categories(property_types, n),
+            'CURRENCY_CD': self._random_categories(['EUR', 'USD', 'GBP', 'AUD', 'CAD'], n),
+            'TOTAL_AMT': self._random_amounts(50, 2000, n),
+            'COMMISSION_AMT': self._random_amounts(5, 300, n),
+            'COMMISSION_PCT': self._random_amounts(8, 25, n),
+            'CANC_POLICY_CD': self._random_categories(cancellation_policies, n),
+            'GUEST_EMAIL_ADDR': self._faker_values(self.faker.email, n, pool_size=FAKER_WIDE_POOL_SIZE),
+            'GUEST_PHONE_NBR': self._faker_values(self.faker.phone_number, n, pool_size=FAKER_WIDE_POOL_SIZE),
+            'GUEST_COUNTRY_CD': self._faker_values(self.faker.country_code, n),
+            'PAYMENT_METHOD_CD': self._random_categories(['CC', 'PAYPAL', 'BANK', 'CRYPTO'], n),
+            'LOYALTY_MEMBER_FLG': self._random_categories(['Y', 'N'], n),
+            'FRAUD_SCORE_NBR': self.rng.integers(0, 101, n, dtype=np.int8),
+            # Add more fields as needed...
+        }, copy=False)
 
     def _generate_hotel_property_data(self, n: int) -> pd.DataFrame:
         """Generate hotel property data for OTA systems."""
-        data = []
-
         property_types = ['HOTEL', 'APART', 'B&B', 'HOSTEL', 'VILLA', 'RESORT']
         star_ratings = [1, 2, 3, 4, 5]
 
-        for i in range(n):
-            record = {
-                'PROP_ID_NBR': f'PROP{i + 1:06d}',
-                'PROP_NAME_TXT': f"{self.faker.company()} {random.choice(['Hotel', 'Resort', 'Inn'])}",
-                'PROP_TYPE_CD': random.choice(property_types),
-                'STAR_RATING_NBR': random.choice(star_ratings),
-                'CITY_NM': self.faker.city(),
-                'COUNTRY_CD': self.faker.country_code(),
-                'LATITUDE_NBR': float(self.faker.latitude()),
-                'LONGITUDE_NBR': float(self.faker.longitude()),
-                'TOTAL_ROOMS_CNT': random.randint(10, 500),
-                'COMMISSION_PCT': round(random.uniform(10, 25), 2),
-                'GUEST_REVIEW_SCORE': round(random.uniform(6.0, 9.5), 1),
-                'ACTIVE_STATUS_FLG': random.choice(['Y', 'N']),
-                # Add more property fields...
-            }
-            data.append(record)
-
-        return pd.DataFrame(data)
+        property_kinds = self.rng.choice(['Hotel', 'Resort', 'Inn'], n).tolist()
+
+        return pd.DataFrame({
+            'PROP_ID_NBR': self._sequential_ids('PROP{:06d}', n),
+            'PROP_NAME_TXT': [f"{company} {kind}" for company, kind in
+                              zip(self._faker_values(self.faker.company, n), property_kinds)],
+            'PROP_TYPE_CD': self._random_categories(property_types, n),
+            'STAR_RATING_NBR': self.rng.choice(star_ratings, n),
+            'CITY_NM': self._faker_values(self.faker.city, n),
+            'COUNTRY_CD': self._faker_values(self.faker.country_code, n),
+            'LATITUDE_NBR': self._random_amounts(-90, 90, n, decimals=6),
+            'LONGITUDE_NBR': self._random_amounts(-180, 180, n, decimals=6),
+            'TOTAL_ROOMS_CNT': self.rng.integers(10, 501, n, dtype=np.int16),
+            'COMMISSION_PCT': self._random_amounts(10, 25, n),
+            'GUEST_REVIEW_SCORE': self._random_amounts(6.0, 9.5, n, decimals=1),
+            'ACTIVE_STATUS_FLG': self._random_categories(['Y', 'N'], n),
+            # Add more property fields...
+        }, copy=False)
 
     def _generate_travel_search_data(self, n: int) -> pd.DataFrame:
         """Generate travel search and user behavior data."""
-        data = []
-
         devices = ['DESKTOP', 'MOBILE', 'TABLET']
         search_types = ['CITY', 'PROPERTY', 'REGION', 'LANDMARK']
 
-        for i in range(n):
-            search_date = self.faker.date_between(start_date='-3m', end_date='now')
-            checkin_date = search_date + timedelta(days=random.randint(1, 180))
-
-            record = {
-                'SEARCH_ID_NBR': f'SRCH{i + 1:010d}',
-                'SESSION_ID_TXT': f'SESS{random.randint(100000000, 999999999)}',
-                'SEARCH_TS': self.faker.date_time_between(start_date=search_date, end_date=search_date),
-                'DESTINATION_TXT': self.faker.city(),
-                'CHECKIN_DT': checkin_date,
-                'CHECKOUT_DT': checkin_date + timedelta(days=random.randint(1, 14)),
-                'DEVICE_TYPE_CD': random.choice(devices),
-                'CONVERSION_FLG': random.choice(['Y', 'N']),
-                'CLICKS_CNT': random.randint(0, 20),
-                # Add more search behavior fields...
-            }
-            data.append(record)
-
-        return pd.DataFrame(data)
+        search_dates = self._random_days(-3 * 30, 0, n)
+        checkin_dates = search_dates + self.rng.integers(1, 181, n)
+        checkout_dates = checkin_dates + self.rng.integers(1, 15, n)
+
+        return pd.DataFrame({
+            'SEARCH_ID_NBR': self._sequential_ids('SRCH{:010d}', n),
+            'SESSION_ID_TXT': self._random_codes('SESS{}', 100000000, 999999999, n),
+            # Searches are stamped at midnight of the search date
+            'SEARCH_TS': search_dates.astype('datetime64[s]'),
+            'DESTINATION_TXT': self._faker_values(self.faker.city, n),
+            'CHECKIN_DT': checkin_dates.astype(object),
+            'CHECKOUT_DT': checkout_dates.astype(object),
+            'DEVICE_TYPE_CD': self._random_categories(devices, n),
+            'CONVERSION_FLG': self._random_categories(['Y', 'N'], n),
+            'CLICKS_CNT': self.rng.integers(0, 21, n, dtype=np.int8),
+            # Add more search behavior fields...
+        }, copy=False)
 
     def generate_sample_ota_schema(self,size: int = 10000) -> Dict[str, Any]:
         """Generate realistic OTA database schema for POC."""
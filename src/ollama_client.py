@@ -1,8 +1,9 @@
 import requests
-import json
-from typing import Dict, List,  Any
+import orjson
+from typing import Dict, List,  Any, Callable, Iterator, Optional
 import json5
 import re
+import threading
 
 class OllamaClient:
     """Client for interacting with Ollama API."""
@@ -10,14 +11,25 @@ class OllamaClient:
     def __init__(self, base_url: str = "http://localhost:11434"):
         self.base_url = base_url
         self.timeout = 120
+        # Keep-alive sessions, one per thread: the client is shared by every browser session and
+        # by the enricher's worker threads, and requests.Session is not documented as thread-safe
+        self._local = threading.local()
         self.default_model = "gemma:latest"
 #        self.default_model = "mistral"
 #        self.default_model = "mixtral:8x7b"
 
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's session, reusing its connections to the Ollama server."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
     def check_connection(self) -> bool:
         """Check if Ollama is running and accessible."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except Exception:
             return False
@@ -25,7 +37,7 @@ class OllamaClient:
     def get_available_models(self) -> List[str]:
         """Get list of available models."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 models = [model['name'] for model in data.get('models', [])]
@@ -34,14 +46,12 @@ class OllamaClient:
             pass
         return []
 
-    def generate_response(self, prompt: str, model: str = None) -> Dict[str, Any]:
-        """Generate response from Ollama model."""
-        model = model or self.default_model
-
-        payload = {
+    def _build_payload(self, prompt: str, model: str, stream: bool) -> Dict[str, Any]:
+        """Build the /api/generate request body."""
+        return {
             "model": model,
             "prompt": prompt,
-            "stream": False,
+            "stream": stream,
             "options": {
                 "temperature": 0.1,  # Lower temperature for more consistent outputs
                 "top_p": 0.9,
@@ -49,20 +59,54 @@ class OllamaClient:
             }
         }
 
+    def _iter_stream(self, prompt: str, model: str) -> Iterator[Dict[str, Any]]:
+        """Yield the decoded JSON lines of a streaming /api/generate call."""
+        with self.session.post(
+            f"{self.base_url}/api/generate",
+            json=self._build_payload(prompt, model, stream=True),
+            timeout=self.timeout,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                raise requests.HTTPError(f"HTTP {response.status_code}: {response.text}")
+
+            for line in response.iter_lines():
+                if line:
+                    yield orjson.loads(line)
+
+    def generate_stream(self, prompt: str, model: str = None) -> Iterator[str]:
+        """Yield response text from Ollama as it is generated."""
+        for chunk in self._iter_stream(prompt, model or self.default_model):
+            if chunk.get("response"):
+                yield chunk["response"]
+
+    def generate_response(self, prompt: str, model: str = None,
+                          on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Generate response from Ollama model.
+
+        When ``on_token`` is given the response is streamed and each text fragment is
+        passed to it as it arrives; the returned dict is the same either way.
+        """
+        model = model or self.default_model
+
         try:
-            response = requests.post(
+            if on_token is not None:
+                return self._generate_streamed_response(prompt, model, on_token)
+
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
-                json=payload,
+                json=self._build_payload(prompt, model, stream=False),
                 timeout=self.timeout
             )
 
             if response.status_code == 200:
+                body = orjson.loads(response.content)
                 return {
                     "success": True,
-                    "response": response.json().get("response", ""),
+                    "response": body.get("response", ""),
                     "model": model,
-                    "prompt_eval_count": response.json().get("prompt_eval_count", 0),
-                    "eval_count": response.json().get("eval_count", 0),
+                    "prompt_eval_count": body.get("prompt_eval_count", 0),
+                    "eval_count": body.get("eval_count", 0),
                 }
             else:
                 return {
@@ -77,6 +121,12 @@ class OllamaClient:
                 "error": "Request timed out. The model might be taking too long to respond.",
                 "model": model
             }
+        except requests.HTTPError as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "model": model
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -84,7 +134,30 @@ class OllamaClient:
                 "model": model
             }
 
-    def generate_structured_response(self, prompt: str, model: str = None) -> Dict[str, Any]:
+    def _generate_streamed_response(self, prompt: str, model: str,
+                                    on_token: Callable[[str], None]) -> Dict[str, Any]:
+        """Stream a completion, forwarding fragments to ``on_token``."""
+        fragments = []
+        final_chunk = {}
+
+        for chunk in self._iter_stream(prompt, model):
+            fragment = chunk.get("response", "")
+            if fragment:
+                fragments.append(fragment)
+                on_token(fragment)
+            if chunk.get("done"):
+                final_chunk = chunk
+
+        return {
+            "success": True,
+            "response": "".join(fragments),
+            "model": model,
+            "prompt_eval_count": final_chunk.get("prompt_eval_count", 0),
+            "eval_count": final_chunk.get("eval_count", 0),
+        }
+
+    def generate_structured_response(self, prompt: str, model: str = None,
+                                     on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """Generate structured JSON response from Ollama model."""
 
         structured_prompt = f"""{prompt}
@@ -98,7 +171,7 @@ IMPORTANT:
 - The response must be directly parseable as JSON.
 """
 
-        result = self.generate_response(structured_prompt, model)
+        result = self.generate_response(structured_prompt, model, on_token=on_token)
 
         if result["success"]:
             try:
@@ -118,8 +191,11 @@ IMPORTANT:
                 # Further clean with helper
                 response_text = self._clean_json_response(response_text)
 
-                # Parse with json5 for tolerance
-                parsed_json = json5.loads(response_text)
+                # Parse strictly with orjson first, falling back to json5 for tolerance
+                try:
+                    parsed_json = orjson.loads(response_text)
+                except orjson.JSONDecodeError:
+                    parsed_json = json5.loads(response_text)
 
                 result["parsed_response"] = parsed_json
                 result["is_json"] = True
@@ -161,7 +237,7 @@ IMPORTANT:
         model = model or self.default_model
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/show",
                 json={"name": model},
                 timeout=10
@@ -1,5 +1,6 @@
-from typing import Dict, List, Any
-from ollama_client import OllamaClient
+from typing import Dict, List, Any, Callable, Optional
+from .ollama_client import OllamaClient
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from math import ceil
 import json
 
@@ -35,51 +36,6 @@ class EnhancedSchemaEnricher:
             }
         }
 
-    def enhance_schema(self, schema: List[Dict[str, Any]],
-                       enhancement_options: List[str],
-                       project_context: Dict[str, Any],
-                       chunk_size: int = 8) -> List[Dict[str, Any]]:
-        """Enhanced schema enrichment with business context."""
-
-        industry = project_context.get('industry', 'General')
-        options = [opt.lower().replace(" ", "_").replace("-", "_") for opt in enhancement_options]
-
-        all_enhanced_columns = []
-        total_chunks = ceil(len(schema) / chunk_size)
-
-        for i in range(total_chunks):
-            chunk = schema[i * chunk_size: (i + 1) * chunk_size]
-            prompt = self._build_comprehensive_enhancement_prompt(
-                chunk, options, project_context, industry
-            )
-
-            print(f"Processing chunk {i + 1}/{total_chunks} with {len(chunk)} columns...")
-
-            result = self.client.generate_structured_response(prompt)
-
-            if not result["success"]:
-                raise Exception(f"AI enhancement failed for chunk {i + 1}: {result.get('error', 'Unknown error')}")
-
-            if not result.get("is_json"):
-                raise Exception(
-                    f"AI returned invalid JSON for chunk {i + 1}: {result.get('json_error', 'Parse error')}")
-
-            enhanced_columns = result["parsed_response"].get("enhanced_columns", [])
-
-            if len(enhanced_columns) != len(chunk):
-                raise Exception(
-                    f"Chunk {i + 1}: Expected {len(chunk)} columns, but AI returned {len(enhanced_columns)}")
-
-            # Process and merge the chunk
-            enhanced_chunk = self._process_ai_response(
-                {"enhanced_columns": enhanced_columns},
-                chunk,
-                industry
-            )
-            all_enhanced_columns.extend(enhanced_chunk)
-
-        return all_enhanced_columns
-
     def _build_comprehensive_enhancement_prompt(self, schema: List[Dict[str, Any]],
                                                 options: List[str],
                                                 project_context: Dict[str, Any],
@@ -100,7 +56,7 @@ CURRENT SCHEMA ANALYSIS:
 
         # Add detailed schema information
         for i, col in enumerate(schema, 1):
-            prompt += f"\n{i}. Column: '{col['column_name']}'"
+            prompt += f"\n[{i}] Column: '{col['column_name']}'"
             prompt += f"\n   - Data Type: {col['data_type']}"
             prompt += f"\n   - Completeness: {col['completeness_pct']}%"
             prompt += f"\n   - Unique Values: {col['unique_count']} out of {col['total_count']}"
@@ -152,12 +108,14 @@ CURRENT SCHEMA ANALYSIS:
         prompt += f"""
 RESPONSE FORMAT - CRITICAL INSTRUCTIONS:
 You must return exactly {len(schema)} column objects in the "enhanced_columns" array.
+Set "index" to the [index] shown next to each column above (1 to {len(schema)}).
 
 Return ONLY this JSON structure with NO additional text, explanations, or formatting:
 
 {{
   "enhanced_columns": [
     {{
+      "index": 1,
       "original_name": "exact_original_column_name",
       "suggested_name": "modern_column_name",
       "business_description": "{industry} business description in 1-2 sentences",
@@ -187,82 +145,110 @@ CRITICAL REQUIREMENTS:
     def enhance_schema(self, schema: List[Dict[str, Any]],
                        enhancement_options: List[str],
                        project_context: Dict[str, Any],
-                       chunk_size: int = 6) -> List[Dict[str, Any]]:  # Reduced chunk size for reliability
-        """Enhanced schema enrichment with improved error handling."""
+                       chunk_size: int = 8,
+                       max_workers: int = 4,
+                       progress_callback: Optional[Callable[[int, int], None]] = None,
+                       on_token: Optional[Callable[[int, str], None]] = None) -> List[Dict[str, Any]]:
+        """Enhanced schema enrichment with improved error handling.
+
+        Chunks are sent to the AI concurrently, up to ``max_workers`` requests at a time.
+        ``progress_callback(completed, total)`` is invoked from the calling thread as
+        each chunk finishes. When ``on_token(chunk_number, text)`` is given, responses
+        are streamed and it is invoked from worker threads as text arrives.
+        """
 
         industry = project_context.get('industry', 'General')
         options = [opt.lower().replace(" ", "_").replace("-", "_") for opt in enhancement_options]
 
-        all_enhanced_columns = []
         total_chunks = ceil(len(schema) / chunk_size)
+        chunks = [schema[i * chunk_size: (i + 1) * chunk_size] for i in range(total_chunks)]
+        enhanced_chunks = [[] for _ in chunks]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total_chunks))) as executor:
+            futures = {
+                executor.submit(self._enhance_chunk, chunk, i + 1, total_chunks,
+                                options, project_context, industry, on_token): i
+                for i, chunk in enumerate(chunks)
+            }
+
+            for completed, future in enumerate(as_completed(futures), 1):
+                enhanced_chunks[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(completed, total_chunks)
 
-        for i in range(total_chunks):
-            chunk = schema[i * chunk_size: (i + 1) * chunk_size]
-
-            # Try multiple times with different approaches
-            max_retries = 3
-            success = False
-
-            for retry in range(max_retries):
-                try:
-                    print(f"Processing chunk {i + 1}/{total_chunks} with {len(chunk)} columns (attempt {retry + 1})...")
-
-                    if retry == 0:
-                        # Standard prompt
-                        prompt = self._build_comprehensive_enhancement_prompt(
-                            chunk, options, project_context, industry
-                        )
-                    elif retry == 1:
-                        # Simplified prompt for better JSON compliance
-                        prompt = self._build_simplified_enhancement_prompt(
-                            chunk, project_context, industry
-                        )
-                    else:
-                        # Most basic prompt
-                        prompt = self._build_basic_enhancement_prompt(
-                            chunk, project_context, industry
-                        )
-
-                    result = self.client.generate_structured_response(prompt)
-
-                    if not result["success"]:
-                        print(f"AI API failed: {result.get('error', 'Unknown error')}")
-                        continue
-
-                    if not result.get("is_json"):
-                        print(f"JSON parsing failed: {result.get('json_error', 'Parse error')}")
-                        print(f"Raw response: {result.get('response', '')[:200]}...")
-                        continue
-
-                    enhanced_columns = result["parsed_response"].get("enhanced_columns", [])
-
-                    if len(enhanced_columns) != len(chunk):
-                        print(f"Column count mismatch: Expected {len(chunk)}, got {len(enhanced_columns)}")
-                        continue
-
-                    # Process and merge the chunk
-                    enhanced_chunk = self._process_ai_response(
-                        {"enhanced_columns": enhanced_columns},
-                        chunk,
-                        industry
+        return [column for enhanced_chunk in enhanced_chunks for column in enhanced_chunk]
+
+    def _enhance_chunk(self, chunk: List[Dict[str, Any]],
+                       chunk_number: int,
+                       total_chunks: int,
+                       options: List[str],
+                       project_context: Dict[str, Any],
+                       industry: str,
+                       on_token: Optional[Callable[[int, str], None]] = None) -> List[Dict[str, Any]]:
+        """Enhance a single chunk, retrying with simpler prompts before falling back."""
+
+        chunk_on_token = None
+        if on_token is not None:
+            def chunk_on_token(text: str) -> None:
+                on_token(chunk_number, text)
+
+        # Try multiple times with different approaches
+        max_retries = 3
+
+        for retry in range(max_retries):
+            try:
+                print(f"Processing chunk {chunk_number}/{total_chunks} with {len(chunk)} columns (attempt {retry + 1})...")
+
+                if retry == 0:
+                    # Standard prompt
+                    prompt = self._build_comprehensive_enhancement_prompt(
+                        chunk, options, project_context, industry
+                    )
+                elif retry == 1:
+                    # Simplified prompt for better JSON compliance
+                    prompt = self._build_simplified_enhancement_prompt(
+                        chunk, project_context, industry
+                    )
+                else:
+                    # Most basic prompt
+                    prompt = self._build_basic_enhancement_prompt(
+                        chunk, project_context, industry
                     )
-                    all_enhanced_columns.extend(enhanced_chunk)
-                    success = True
-                    break
 
-                except Exception as e:
-                    print(f"Attempt {retry + 1} failed: {str(e)}")
-                    if retry == max_retries - 1:
-                        # Fallback: create basic enhancements manually
-                        print("Using fallback enhancement...")
-                        enhanced_chunk = self._create_fallback_enhancement(chunk, industry)
-                        all_enhanced_columns.extend(enhanced_chunk)
-                        success = True
+                result = self.client.generate_structured_response(prompt, on_token=chunk_on_token)
 
-            if not success:
-                raise Exception(f"Failed to enhance chunk {i + 1} after {max_retries} attempts")
+                if not result["success"]:
+                    print(f"AI API failed: {result.get('error', 'Unknown error')}")
+                    continue
 
-        return all_enhanced_columns
+                if not result.get("is_json"):
+                    print(f"JSON parsing failed: {result.get('json_error', 'Parse error')}")
+                    print(f"Raw response: {result.get('response', '')[:200]}...")
+                    continue
+
+                enhanced_columns = self._order_by_index(
+                    result["parsed_response"].get("enhanced_columns", []), len(chunk)
+                )
+
+                if len(enhanced_columns) != len(chunk):
+                    print(f"Column count mismatch: Expected {len(chunk)}, got {len(enhanced_columns)}")
+                    continue
+
+                # Process and merge the chunk
+                return self._process_ai_response(
+                    {"enhanced_columns": enhanced_columns},
+                    chunk,
+                    industry
+                )
+
+            except Exception as e:
+                print(f"Attempt {retry + 1} failed: {str(e)}")
+                if retry == max_retries - 1:
+                    # Fallback: create basic enhancements manually
+                    print("Using fallback enhancement...")
+                    return self._create_fallback_enhancement(chunk, industry)
+
+        raise Exception(f"Failed to enhance chunk {chunk_number} after {max_retries} attempts")
 
     def _build_simplified_enhancement_prompt(self, schema: List[Dict[str, Any]],
                                              project_context: Dict[str, Any],
@@ -275,7 +261,7 @@ COLUMNS TO ENHANCE:
 """
 
         for i, col in enumerate(schema, 1):
-            prompt += f"{i}. {col['column_name']} ({col['data_type']}) - Sample: {col['sample_values'][:2]}\n"
+            prompt += f"[{i}] {col['column_name']} ({col['data_type']}) - Sample: {col['sample_values'][:2]}\n"
 
         prompt += f"""
 Return ONLY this JSON (no other text):
@@ -286,6 +272,7 @@ Return ONLY this JSON (no other text):
         for i, col in enumerate(schema):
             prompt += f"""
     {{
+      "index": {i + 1},
       "original_name": "{col['column_name']}",
       "suggested_name": "suggest_better_name",
       "business_description": "{industry} business meaning",
@@ -328,6 +315,7 @@ Return ONLY this JSON (no other text):
 
             prompt += f"""
     {{
+      "index": {i + 1},
       "original_name": "{col['column_name']}",
       "suggested_name": "{suggested_name}",
       "business_description": "{industry} data field",
@@ -379,7 +367,7 @@ Return ONLY this JSON (no other text):
             else:
                 business_desc = f"{industry} operational data field"
 
-            enhanced_col = col.copy()
+            enhanced_col = dict(col)
             enhanced_col.update({
                 'suggested_name': suggested_name,
                 'business_description': business_desc,
@@ -404,6 +392,20 @@ Return ONLY this JSON (no other text):
 
         return enhanced_columns
 
+    def _order_by_index(self, enhanced_columns: List[Dict[str, Any]], expected: int) -> List[Dict[str, Any]]:
+        """Order AI results by their [index] marker, falling back to response order."""
+        indexed = {}
+        for enhanced in enhanced_columns:
+            try:
+                indexed[int(enhanced['index'])] = enhanced
+            except (KeyError, TypeError, ValueError):
+                return enhanced_columns
+
+        if not all(i in indexed for i in range(1, expected + 1)):
+            return enhanced_columns
+
+        return [indexed[i] for i in range(1, expected + 1)]
+
     def _process_ai_response(self, ai_response: Dict[str, Any],
                              original_schema: List[Dict[str, Any]],
                              industry: str) -> List[Dict[str, Any]]:
@@ -420,7 +422,7 @@ Return ONLY this JSON (no other text):
         result = []
 
         for i, (original, enhanced) in enumerate(zip(original_schema, enhanced_columns)):
-            merged_column = original.copy()
+            merged_column = dict(original)
 
             # Add AI enhancements
             merged_column.update({
@@ -497,24 +499,24 @@ Return ONLY this JSON (no other text):
         checklist = []
 
         # PII handling
-        pii_columns = [col for col in enhanced_schema if col.get('potential_pii')]
+        pii_columns = sum(1 for col in enhanced_schema if col.get('potential_pii'))
         if pii_columns:
-            checklist.append(f"🔒 Implement PII protection for {len(pii_columns)} columns")
+            checklist.append(f"🔒 Implement PII protection for {pii_columns} columns")
 
         # High complexity migrations
-        high_complexity = [col for col in enhanced_schema if col.get('migration_complexity') == 'High']
+        high_complexity = sum(1 for col in enhanced_schema if col.get('migration_complexity') == 'High')
         if high_complexity:
-            checklist.append(f"⚠️ Plan detailed migration strategy for {len(high_complexity)} complex columns")
+            checklist.append(f"⚠️ Plan detailed migration strategy for {high_complexity} complex columns")
 
         # Data quality rules
-        columns_with_rules = [col for col in enhanced_schema if col.get('data_quality_rules')]
+        columns_with_rules = sum(1 for col in enhanced_schema if col.get('data_quality_rules'))
         if columns_with_rules:
-            checklist.append(f"✅ Implement data quality rules for {len(columns_with_rules)} columns")
+            checklist.append(f"✅ Implement data quality rules for {columns_with_rules} columns")
 
         # Business KPIs
-        kpi_columns = [col for col in enhanced_schema if col.get('potential_kpis')]
+        kpi_columns = sum(1 for col in enhanced_schema if col.get('potential_kpis'))
         if kpi_columns:
-            checklist.append(f"📊 Set up KPI tracking for {len(kpi_columns)} business metrics")
+            checklist.append(f"📊 Set up KPI tracking for {kpi_columns} business metrics")
 
         return checklist
 
@@ -545,7 +547,7 @@ Return ONLY this JSON (no other text):
         suggested_names = [col.get('suggested_name', col['column_name']) for col in enhanced_schema]
 
         # Check for duplicates
-        if len(suggested_names) != len(set([name.upper() for name in suggested_names])):
+        if len(suggested_names) != len({name.upper() for name in suggested_names}):
             validation_result['errors'].append("Duplicate column names detected (case-insensitive)")
             validation_result['valid'] = False
 
@@ -0,0 +1,81 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from src.csv_processor import CSVProcessor
+
+
+class _Upload(io.BytesIO):
+    """Stand-in for a Streamlit upload: the bytes plus the name the processor reads."""
+
+    name = 'upload.csv'
+
+
+def _schema_by_column(file_bytes: bytes, **kwargs):
+    processor = CSVProcessor()
+    df = processor.process_file(_Upload(file_bytes), **kwargs)
+    return df, {column['column_name']: column for column in processor.infer_schema(df)}
+
+
+def test_empty_and_na_fields_are_counted_as_nulls():
+    df, schema = _schema_by_column(b"id,name,city\n1,Ann,\n2,,Paris\n3,NA,Rome\n")
+
+    assert df['name'].isna().tolist() == [False, True, True]
+    assert schema['id']['null_count'] == 0
+    assert schema['name']['null_count'] == 2
+    assert schema['city']['null_count'] == 1
+    assert schema['name']['most_common'] == 'Ann'
+    assert schema['name']['min_length'] == 3
+
+
+def test_null_counts_when_reading_a_sample_of_rows():
+    _, schema = _schema_by_column(b"id,name,city\n1,Ann,\n2,,Paris\n3,NA,Rome\n", max_rows=2)
+
+    assert schema['name']['null_count'] == 1
+    assert schema['city']['null_count'] == 1
+
+
+def test_latin1_file_falls_back_to_a_decoding_parse():
+    file_bytes = "id,name,city\n1,José,München\n2,Renée,Zürich\n3,Ann,Rome\n".encode('latin1')
+    df, schema = _schema_by_column(file_bytes)
+
+    assert df['city'].tolist() == ['München', 'Zürich', 'Rome']
+    assert schema['name']['data_type'] == 'string'
+
+
+def test_single_value_numeric_columns_have_no_std_dev():
+    _, one_row = _schema_by_column(b"id,amt,note\n1,42.5,a\n")
+    _, sparse = _schema_by_column(b"id,amt,note\n1,,a\n2,42.5,b\n3,,c\n4,,d\n")
+
+    for schema in (one_row, sparse):
+        assert schema['amt']['min_value'] == 42.5
+        assert schema['amt']['mean_value'] == 42.5
+        assert schema['amt']['std_dev'] != schema['amt']['std_dev']  # NaN
+
+
+def test_whole_number_float_columns():
+    # Floats as the pandas reader widens integer columns with gaps, and as generated data holds them
+    df = pd.DataFrame({
+        'qty': [2.0, np.nan, 3.0, 4.0],
+        'exchange_rt': [1.0, 1.0, np.nan, 1.0],
+        'flat': [5.0, 5.0, 5.0, np.nan],
+        'ratio': [0.5, 1.5, 2.0, 3.0],
+    })
+    schema = {column['column_name']: column for column in CSVProcessor().infer_schema(df)}
+
+    assert schema['qty']['data_type'] == 'integer'
+    assert (schema['qty']['min_value'], schema['qty']['max_value']) == (2, 4)
+    assert isinstance(schema['qty']['min_value'], int)
+    assert schema['exchange_rt']['data_type'] == 'float'
+    assert schema['flat']['data_type'] == 'float'
+    assert schema['ratio']['data_type'] == 'float'
+
+
+def test_dotted_values_are_not_dates():
+    _, schema = _schema_by_column(
+        b"id,version,day\n1,01.02.2024,2024-02-01\n2,12.31.2024,2024-12-31\n3,10.11.2023,2023-11-10\n"
+    )
+
+    assert schema['version']['data_type'] == 'string'
+    assert schema['day']['data_type'] == 'date'